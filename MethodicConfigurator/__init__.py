@@ -9,7 +9,13 @@ SPDX-License-Identifier: GPL-3.0-or-later
 """
 # pylint: skip-file
 
-from MethodicConfigurator.internationalization import load_translation
+from MethodicConfigurator.startup_profiler import start_startup_profiler_if_requested
+
+# Must run before anything else gets imported, so that all imports get profiled.
+# It only reads an environment variable, so importing the package stays cheap and side-effect free
+start_startup_profiler_if_requested()
+
+from MethodicConfigurator.internationalization import load_translation  # noqa: E402
 
 _ = load_translation()
 
@@ -10,6 +10,7 @@ This script fetches online ArduPilot parameter documentation (if not cached) and
 2. Parses the XML data and creates a dictionary of parameter documentation.
 3. DELETES all comments that start at the beginning of a line
 4. Adds the parameter documentation to the target file or to all *.param,*.parm files in the target directory.
+   With --recursive, it does so for all directories below the target directory, in parallel.
 
 Supports AP_Periph, AntennaTracker, ArduCopter, ArduPlane, ArduSub, Blimp, Heli, Rover and SITL vehicle types
 Supports both Mission Planner and MAVProxy file formats
@@ -26,10 +27,22 @@ import argparse
 import glob
 import logging
 import re
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from hashlib import sha256
+from os import chmod as os_chmod
+from os import cpu_count as os_cpu_count
 from os import path as os_path
 from os import popen as os_popen
+from os import remove as os_remove
+from os import replace as os_replace
+from os import stat as os_stat
+from os import umask as os_umask
+from os import walk as os_walk
+from shutil import copymode as shutil_copymode
 from sys import exc_info as sys_exc_info
 from sys import exit as sys_exit
+from tempfile import NamedTemporaryFile
 from types import TracebackType
 from typing import Any, Optional
 from xml.etree import ElementTree as ET  # no parsing, just data-structure manipulation
@@ -44,10 +57,14 @@ LUA_PARAM_DEFINITION_XML_FILE = "24_inflight_magnetometer_fit_setup.pdef.xml"
 
 # ArduPilot parameter names start with a capital letter and can have capital letters, numbers and _
 PARAM_NAME_REGEX = r"^[A-Z][A-Z_0-9]*"
+PARAM_NAME_PATTERN = re.compile(PARAM_NAME_REGEX)
 PARAM_NAME_MAX_LEN = 16
+# A well-formed "NAME,VALUE  # comment", "NAME VALUE" or "NAME<TAB>VALUE" parameter file line, without surrounding spaces
+PARAM_LINE_PATTERN = re.compile(r"([A-Z][A-Z_0-9]*)[,\s]\s*([^\s,#]+)\s*(?:#(.*))?")
 VERSION = "1.0"
 
 # mypy: disable-error-code="unused-ignore"
+# pylint: disable=too-many-lines
 
 
 def arg_parser():
@@ -85,6 +102,19 @@ def arg_parser():
         default="ArduCopter",
         help="The type of the vehicle. Defaults to %(default)s.",
     )
+    parser.add_argument(
+        "-r",
+        "--recursive",
+        action="store_true",
+        help="Annotate the parameter files of all directories below the target directory. Defaults to %(default)s.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os_cpu_count() or 1,
+        help="Number of directories to annotate in parallel when --recursive is used. Defaults to %(default)s.",
+    )
     parser.add_argument(
         "-m",
         "--max-line-length",
@@ -153,41 +183,86 @@ class Par:
         Returns:
         dict: A dictionary containing the parameters from the file.
         """
-        parameter_dict: dict[str, Par] = {}
         try:
             with open(param_file, encoding="utf-8") as f_handle:
-                for i, f_line in enumerate(f_handle, start=1):
-                    original_line = f_line
-                    line = f_line.strip()
-                    comment = None
-                    if not line:
-                        continue  # skip empty lines
-                    if line[0] == "#":
-                        continue  # skip comments
-                    if "#" in line:
-                        line, comment = line.split("#", 1)  # strip trailing comments
-                        comment = comment.strip()
-                    if "," in line:
-                        # parse mission planner style parameter files
-                        parameter, value = line.split(",", 1)
-                    elif " " in line:
-                        # parse mavproxy style parameter files
-                        parameter, value = line.split(" ", 1)
-                    elif "\t" in line:
-                        parameter, value = line.split("\t", 1)
-                    else:
-                        raise SystemExit(f"Missing parameter-value separator: {line} in {param_file} line {i}")
-                    parameter = parameter.strip()
-                    Par.validate_parameter(param_file, parameter_dict, i, original_line, comment, parameter, value)
+                return Par.parse_param_lines(f_handle, param_file)
         except UnicodeDecodeError as exp:
             raise SystemExit(f"Fatal error reading {param_file}: {exp}") from exp
+
+    @staticmethod
+    def load_param_files_into_dicts(param_files: list[str], max_workers: int = 1) -> dict[str, dict[str, "Par"]]:
+        """
+        Loads several ArduPilot parameter files in one call.
+
+        Parameters:
+        param_files (List[str]): The names of the parameter files to load.
+        max_workers (int): Number of threads reading the files in parallel. Defaults to 1, no threads.
+
+        Returns:
+        dict: The name of each file, in the given order, and the parameters loaded from it.
+        """
+        if max_workers <= 1 or len(param_files) <= 1:
+            return {param_file: Par.load_param_file_into_dict(param_file) for param_file in param_files}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(param_files, executor.map(Par.load_param_file_into_dict, param_files)))
+
+    @staticmethod
+    def parse_param_lines(lines: Iterable[str], param_file: str) -> dict[str, "Par"]:
+        """
+        Parses the lines of an ArduPilot parameter file in Mission Planner or MAVProxy format.
+
+        Parameters:
+        lines (Iterable[str]): The lines of the file.
+        param_file (str): The name of the file, used in the error messages.
+
+        Returns:
+        dict: A dictionary containing the parameters from the lines.
+        """
+        parameter_dict: dict[str, Par] = {}
+        for i, f_line in enumerate(lines, start=1):
+            line = f_line.strip()
+            if not line:
+                continue  # skip empty lines
+            if line[0] == "#":
+                continue  # skip comments
+            # Most lines are well-formed, parse those with a single precompiled regular expression
+            match = PARAM_LINE_PATTERN.fullmatch(line)
+            if match is not None:
+                parameter, value, comment = match.groups()
+                if len(parameter) <= PARAM_NAME_MAX_LEN and parameter not in parameter_dict:
+                    try:
+                        parameter_dict[parameter] = Par(float(value), None if comment is None else comment.strip())
+                        continue
+                    except ValueError:
+                        pass  # the generic parser reports the error
+            Par.__parse_param_line(param_file, parameter_dict, i, f_line)
         return parameter_dict
 
+    @staticmethod
+    def __parse_param_line(param_file: str, parameter_dict: dict[str, "Par"], i: int, original_line: str) -> None:
+        line = original_line.strip()
+        comment = None
+        if "#" in line:
+            line, comment = line.split("#", 1)  # strip trailing comments
+            comment = comment.strip()
+        if "," in line:
+            # parse mission planner style parameter files
+            parameter, value = line.split(",", 1)
+        elif " " in line:
+            # parse mavproxy style parameter files
+            parameter, value = line.split(" ", 1)
+        elif "\t" in line:
+            parameter, value = line.split("\t", 1)
+        else:
+            raise SystemExit(f"Missing parameter-value separator: {line} in {param_file} line {i}")
+        parameter = parameter.strip()
+        Par.validate_parameter(param_file, parameter_dict, i, original_line, comment, parameter, value)
+
     @staticmethod
     def validate_parameter(param_file, parameter_dict, i, original_line, comment, parameter, value) -> None:  # pylint: disable=too-many-arguments, too-many-positional-arguments
         if len(parameter) > PARAM_NAME_MAX_LEN:
             raise SystemExit(f"Too long parameter name: {parameter} in {param_file} line {i}")
-        if not re.match(PARAM_NAME_REGEX, parameter):
+        if not PARAM_NAME_PATTERN.fullmatch(parameter):
             raise SystemExit(f"Invalid characters in parameter name {parameter} in {param_file} line {i}")
         if parameter in parameter_dict:
             raise SystemExit(f"Duplicated parameter {parameter} in {param_file} line {i}")
@@ -282,10 +357,7 @@ class Par:
         if not formatted_params:
             return
         try:
-            # Ensure newline character is LF, even on windows
-            with open(filename_out, "w", encoding="utf-8", newline="\n") as output_file:
-                for line in formatted_params:
-                    output_file.write(line + "\n")
+            write_file_if_changed(filename_out, "".join(line + "\n" for line in formatted_params))
         except OSError as e:
             raise SystemExit(f"ERROR: writing to file {filename_out}: {e}") from e
 
@@ -325,6 +397,76 @@ class Par:
             print(line)
 
 
+def _new_file_mode() -> int:
+    # the umask can only be read by setting it, do it once while importing instead of racing with other threads
+    umask = os_umask(0)
+    os_umask(umask)
+    return 0o666 & ~umask
+
+
+# The permissions open() gives new files, NamedTemporaryFile creates files only their owner can read
+NEW_FILE_MODE = _new_file_mode()
+
+
+def write_file_if_changed(filename: str, content: str) -> bool:
+    """
+    Writes the content to a text file, unless the file already contains exactly that content.
+
+    The content is first written to a temporary file in the same directory, which then atomically
+    replaces the file. Readers never see a partially written file, and an unchanged file keeps its
+    modification time.
+
+    Args:
+        filename (str): The file to write.
+        content (str): The new file content. Newline characters are written as LF, even on windows.
+
+    Returns:
+        bool: True if the file was written, False if it was already up to date.
+    """
+    try:
+        with open(filename, encoding="utf-8", newline="") as file:
+            if file.read() == content:
+                return False
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+    tmp_file = NamedTemporaryFile(  # noqa: SIM115
+        "w",
+        encoding="utf-8",
+        newline="\n",
+        dir=os_path.dirname(os_path.abspath(filename)),
+        prefix=os_path.basename(filename) + ".",
+        suffix=".tmp",
+        delete=False,
+    )
+    try:
+        with tmp_file:
+            tmp_file.write(content)
+        if os_path.exists(filename):
+            shutil_copymode(filename, tmp_file.name)
+        else:
+            os_chmod(tmp_file.name, NEW_FILE_MODE)
+        os_replace(tmp_file.name, filename)
+    except OSError:
+        os_remove(tmp_file.name)
+        raise
+    return True
+
+
+def get_local_xml_file_path(directory: str, filename: str) -> Optional[str]:
+    """
+    Locates a locally cached XML file, first relative to the given directory, then in the current directory.
+
+    Returns:
+        Optional[str]: The path to the XML file, or None if there is no local copy of it.
+    """
+    file_path = os_path.join(directory, filename)
+    if os_path.isfile(file_path):
+        return file_path
+    if os_path.isfile(filename):
+        return filename
+    return None
+
+
 def get_xml_data(base_url: str, directory: str, filename: str, vehicle_type: str) -> ET.Element:
     """
     Fetches XML data from a local file or a URL.
@@ -338,16 +480,11 @@ def get_xml_data(base_url: str, directory: str, filename: str, vehicle_type: str
     Returns:
         ET.Element: The root element of the parsed XML data.
     """
-    file_path = os_path.join(directory, filename)
+    file_path = get_local_xml_file_path(directory, filename)
     # Check if the locally cached file exists
-    if os_path.isfile(file_path):
-        # Load the file content relative to the script location
+    if file_path is not None:
         with open(file_path, encoding="utf-8") as file:
             xml_data = file.read()
-    elif os_path.isfile(filename):
-        # Load the file content from the current directory
-        with open(filename, encoding="utf-8") as file:
-            xml_data = file.read()
     else:
         # No locally cached file exists, get it from the internet
         try:
@@ -451,47 +588,81 @@ def create_doc_dict(root: ET.Element, vehicle_type: str, max_line_length: int =
 
     # Use the findall method with an XPath expression to find all "param" elements
     for param in root.findall(".//param"):
-        name = param.get("name")
-        if name is None:
-            continue
-        if vehicle_type == "Heli":
-            vehicle_type = "Helicopter"
-        # Remove the <vehicle_type>: prefix from the name if it exists
-        name = remove_prefix(name, vehicle_type + ":")
-
-        human_name = param.get("humanName")
-        documentation = param.get("documentation")
-        documentation_lst: list[str] = []
-        if documentation:
-            documentation_lst = split_into_lines(documentation, max_line_length)
-        # the keys are the "name" attribute of the "field" sub-elements
-        # the values are the text content of the "field" sub-elements
-        fields = {field.get("name"): field.text for field in param.findall("field")}
-        # if Units and UnitText exist, combine them into a single element
-        delete_unit_text = False
-        for key, value in fields.items():
-            if key == "Units" and "UnitText" in fields:
-                fields[key] = f"{value} ({fields['UnitText']})"
-                delete_unit_text = True
-        if delete_unit_text:
-            del fields["UnitText"]
-        # the keys are the "code" attribute of the "values/value" sub-elements
-        # the values are the text content of the "values/value" sub-elements
-        values = {value.get("code"): value.text for value in param.findall("values/value")}
-
-        # Dictionary with "Parameter names" as keys and the values is a
-        # dictionary with "humanName", "documentation" attributes and
-        # "fields", "values" sub-elements.
-        doc[name] = {
-            "humanName": human_name,
-            "documentation": documentation_lst,
-            "fields": fields,
-            "values": values,
-        }
+        add_param_doc(doc, param, vehicle_type, max_line_length)
 
     return doc
 
 
+def create_doc_dict_from_xml_file(xml_file: str, vehicle_type: str, max_line_length: int = 100) -> dict[str, Any]:
+    """
+    Create a dictionary of parameter documentation by streaming through an XML file.
+
+    Produces the same result as create_doc_dict(), but handles each "param" element as soon as it got parsed
+    and then discards it, so that the whole element tree of a large XML file never needs to be in memory at once.
+
+    Args:
+        xml_file (str): The path to the XML file.
+
+    Returns:
+        Dict[str, Any]: A dictionary of parameter documentation.
+    """
+    doc: dict[str, Any] = {}
+    for _event, element in DET.iterparse(xml_file, events=("end",)):
+        if element.tag == "param":
+            add_param_doc(doc, element, vehicle_type, max_line_length)
+            element.clear()
+        elif element.tag == "parameters":
+            element.clear()  # drop the already processed and cleared "param" elements
+    return doc
+
+
+def add_param_doc(doc: dict[str, Any], param: ET.Element, vehicle_type: str, max_line_length: int) -> None:
+    """
+    Add the documentation of a single "param" XML element to a dictionary of parameter documentation.
+
+    Parameters of other vehicles, those with a "<other_vehicle_type>:" name prefix, get skipped.
+    """
+    name = param.get("name")
+    if name is None:
+        return
+    if vehicle_type == "Heli":
+        vehicle_type = "Helicopter"
+    if ":" in name and not name.startswith(vehicle_type + ":"):
+        return
+    # Remove the <vehicle_type>: prefix from the name if it exists
+    name = remove_prefix(name, vehicle_type + ":")
+
+    human_name = param.get("humanName")
+    documentation = param.get("documentation")
+    documentation_lst: list[str] = []
+    if documentation:
+        documentation_lst = split_into_lines(documentation, max_line_length)
+    # the keys are the "name" attribute of the "field" sub-elements
+    # the values are the text content of the "field" sub-elements
+    fields = {field.get("name"): field.text for field in param.findall("field")}
+    # if Units and UnitText exist, combine them into a single element
+    delete_unit_text = False
+    for key, value in fields.items():
+        if key == "Units" and "UnitText" in fields:
+            fields[key] = f"{value} ({fields['UnitText']})"
+            delete_unit_text = True
+    if delete_unit_text:
+        del fields["UnitText"]
+    # the keys are the "code" attribute of the "values/value" sub-elements
+    # the values are the text content of the "values/value" sub-elements
+    values = {value.get("code"): value.text for value in param.findall("values/value")}
+
+    # Dictionary with "Parameter names" as keys and the values is a
+    # dictionary with "humanName", "documentation" attributes and
+    # "fields", "values" sub-elements.
+    doc[name] = {
+        "humanName": human_name,
+        "documentation": documentation_lst,
+        "fields": fields,
+        "values": values,
+    }
+
+
 def format_columns(values: dict[str, Any], max_width: int = 105, max_columns: int = 4) -> list[str]:
     """
     Formats a dictionary of values into column-major horizontally aligned columns.
@@ -545,7 +716,7 @@ def extract_parameter_name(item: str) -> str:
     Extract the parameter name from a line. Very simple to use in sorting
     """
     item = item.strip()
-    match = re.match(PARAM_NAME_REGEX, item)
+    match = PARAM_NAME_PATTERN.match(item)
     return match.group(0) if match else item
 
 
@@ -570,7 +741,7 @@ def extract_parameter_name_and_validate(line: str, filename: str, line_nr: int)
         SystemExit: If the line is invalid or the parameter name is too long or invalid.
     """
     # Extract the parameter name
-    match = re.match(PARAM_NAME_REGEX, line)
+    match = PARAM_NAME_PATTERN.match(line)
     if match:
         param_name = match.group(0)
     else:
@@ -587,12 +758,14 @@ def extract_parameter_name_and_validate(line: str, filename: str, line_nr: int)
     return param_name
 
 
-def update_parameter_documentation(
+def update_parameter_documentation(  # pylint: disable=too-many-arguments
     doc: dict[str, Any],
     target: str = ".",
     sort_type: str = "none",
     param_default_dict: Optional[dict] = None,
     delete_documentation_annotations=False,
+    *,
+    rendered_doc_cache: Optional[dict[str, str]] = None,
 ) -> None:
     """
     Updates the parameter documentation in the target file or in all *.param,*.parm files of the target directory.
@@ -611,6 +784,8 @@ def update_parameter_documentation(
                                    Can be 'none', 'missionplanner', or 'mavproxy'. Defaults to 'none'.
         param_default_dict (Dict, optional): A dictionary of default parameter values. Defaults to None.
                                               If None, an empty dictionary is used.
+        rendered_doc_cache (Dict, optional): Memoizes the rendered documentation comment of each parameter.
+                                             Reuse it across calls that use the same documentation dictionary.
     """
     # Check if the target is a file or a directory
     if os_path.isfile(target):
@@ -624,6 +799,8 @@ def update_parameter_documentation(
 
     if param_default_dict is None:
         param_default_dict = {}
+    if rendered_doc_cache is None:
+        rendered_doc_cache = {}
 
     # Iterate over all the target ArduPilot parameter files
     for param_file in param_files:
@@ -635,10 +812,91 @@ def update_parameter_documentation(
             lines = file.readlines()
 
         update_parameter_documentation_file(
-            doc, sort_type, param_default_dict, param_file, lines, delete_documentation_annotations
+            doc,
+            sort_type,
+            param_default_dict,
+            param_file,
+            lines,
+            delete_documentation_annotations,
+            rendered_doc_cache=rendered_doc_cache,
         )
 
 
+def format_parameter_documentation(data: dict[str, Any]) -> str:
+    """
+    Renders the documentation comment of a single parameter, without the leading '# ' and without its default value.
+
+    Args:
+        data (Dict[str, Any]): The documentation of the parameter.
+
+    Returns:
+        str: The comment lines, separated by '\n# '.
+    """
+    prefix_parts = [
+        f"{data['humanName']}",
+    ]
+    prefix_parts += data["documentation"]
+    for key, value in data["fields"].items():
+        prefix_parts.append(f"{key}: {value}")
+    prefix_parts += format_columns(data["values"])
+    return "\n# ".join(prefix_parts)
+
+
+def get_parameter_documentation_comment(
+    param_name: str, doc: dict[str, Any], param_default_dict: dict[str, "Par"], rendered_doc_cache: dict[str, str]
+) -> str:
+    """
+    Returns the documentation comment of a parameter, without the leading '# ', including its default value.
+
+    The same parameter appears in many files, so its rendered documentation gets memoized in rendered_doc_cache.
+    """
+    if param_name not in rendered_doc_cache:
+        rendered_doc_cache[param_name] = format_parameter_documentation(doc[param_name])
+    doc_text = rendered_doc_cache[param_name]
+    if param_name in param_default_dict:
+        default_value = format(param_default_dict[param_name].value, ".6f").rstrip("0").rstrip(".")
+        doc_text += f"\n# Default: {default_value}"
+    return doc_text
+
+
+def format_annotated_params(
+    param_dict: dict[str, "Par"],
+    doc: dict[str, Any],
+    param_default_dict: dict[str, "Par"],
+    rendered_doc_cache: Optional[dict[str, str]] = None,
+) -> str:
+    """
+    Formats parameters in Mission Planner format, each documented parameter preceded by its documentation comment.
+
+    Generates the same content as Par.format_params() followed by update_parameter_documentation_file() with
+    'missionplanner' sorting, but in a single pass, without parsing, sorting and validating the lines again.
+
+    Args:
+        param_dict (Dict[str, Par]): The parameters to format.
+        doc (Dict[str, Any]): A dictionary of parameter documentation.
+        param_default_dict (Dict[str, Par]): A dictionary of default parameter values.
+        rendered_doc_cache (Dict[str, str], optional): Memoizes the rendered documentation comment of each parameter.
+
+    Returns:
+        str: The annotated parameter file content.
+    """
+    if rendered_doc_cache is None:
+        rendered_doc_cache = {}
+    # Par.format_params() returns the lines in this same order
+    param_names = sorted(param_dict, key=Par.missionplanner_sort)
+    parts: list[str] = []
+    for param_name, f_line in zip(param_names, Par.format_params(param_dict)):
+        line = f_line.strip()
+        if param_name in doc:
+            if parts:
+                parts.append("\n")
+            doc_text = get_parameter_documentation_comment(param_name, doc, param_default_dict, rendered_doc_cache)
+            parts.append(f"# {doc_text}\n{line}\n")
+        else:
+            parts.append(f"{line}\n")
+    return "".join(parts)
+
+
 def update_parameter_documentation_file(  # pylint: disable=too-many-locals, too-many-arguments, too-many-positional-arguments
     doc,
     sort_type,
@@ -646,7 +904,11 @@ def update_parameter_documentation_file(  # pylint: disable=too-many-locals, too
     param_file,
     lines,
     delete_documentation_annotations: bool,
+    *,
+    rendered_doc_cache: Optional[dict[str, str]] = None,
 ) -> None:
+    if rendered_doc_cache is None:
+        rendered_doc_cache = {}
     new_lines = []
     if os_path.basename(param_file).endswith("16_pid_adjustment.param"):
         new_lines.extend(lines[0:5])  # copy the first 6 lines verbatim
@@ -667,18 +929,7 @@ def update_parameter_documentation_file(  # pylint: disable=too-many-locals, too
             if param_name in doc and not delete_documentation_annotations:
                 # If the parameter name is in the dictionary,
                 #  prefix the line with a comment derived from the dictionary element
-                data = doc[param_name]
-                prefix_parts = [
-                    f"{data['humanName']}",
-                ]
-                prefix_parts += data["documentation"]
-                for key, value in data["fields"].items():
-                    prefix_parts.append(f"{key}: {value}")
-                prefix_parts += format_columns(data["values"])
-                doc_text = "\n# ".join(prefix_parts)
-                if param_name in param_default_dict:
-                    default_value = format(param_default_dict[param_name].value, ".6f").rstrip("0").rstrip(".")
-                    doc_text += f"\n# Default: {default_value}"
+                doc_text = get_parameter_documentation_comment(param_name, doc, param_default_dict, rendered_doc_cache)
                 if not is_first_param_in_file:
                     new_lines.append("\n")
                 new_lines.append(f"# {doc_text}\n{line}\n")
@@ -698,9 +949,8 @@ def update_parameter_documentation_file(  # pylint: disable=too-many-locals, too
         )
         logging.warning("No documentation found for: %s", ", ".join(undocumented_params))
 
-    # Write the new file contents to the file
-    with open(param_file, "w", encoding="utf-8", newline="\n") as file:  # Ensure newline character is LF, even on windows
-        file.writelines(new_lines)
+    if not write_file_if_changed(param_file, "".join(new_lines)):
+        logging.info("File %s is already up to date", param_file)
 
 
 def print_read_only_params(doc) -> None:
@@ -747,13 +997,176 @@ def get_xml_url(vehicle_type: str, firmware_version: str) -> str:
 def parse_parameter_metadata(
     xml_url: str, xml_dir: str, xml_file: str, vehicle_type: str, max_line_length: int
 ) -> dict[str, Any]:
+    local_xml_file = get_local_xml_file_path(xml_dir, xml_file)
+    if local_xml_file is not None:
+        return create_doc_dict_from_xml_file(local_xml_file, vehicle_type, max_line_length)
+    # the XML data needs to be downloaded first, and once downloaded it is already in memory
     xml_root = get_xml_data(xml_url, xml_dir, xml_file, vehicle_type)
     return create_doc_dict(xml_root, vehicle_type, max_line_length)
 
 
+def find_param_file_dirs(target: str) -> list[str]:
+    """Returns the target directory and all its subdirectories that contain *.param or *.parm files"""
+    return sorted(
+        dirpath for dirpath, _dirnames, filenames in os_walk(target) if any(f.endswith((".param", ".parm")) for f in filenames)
+    )
+
+
+# (absolute filename, size, modification time) -> SHA-256 of the file contents
+_file_content_hashes: dict[tuple[str, int, int], str] = {}
+
+
+def file_content_hash(filename: str) -> str:
+    """Returns the SHA-256 of the file contents. Unmodified files are hashed only once."""
+    file_stat = os_stat(filename)
+    stat_key = (os_path.abspath(filename), file_stat.st_size, file_stat.st_mtime_ns)
+    if stat_key not in _file_content_hashes:
+        file_hash = sha256()
+        with open(filename, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                file_hash.update(chunk)
+        _file_content_hashes[stat_key] = file_hash.hexdigest()
+    return _file_content_hashes[stat_key]
+
+
+# Documentation dictionaries and their memoized rendered comments, keyed by the XML file hash, in each batch worker
+_batch_docs: dict[str, dict[str, Any]] = {}
+_batch_rendered_docs: dict[str, dict[str, str]] = {}
+
+
+def _init_batch_worker(docs: dict[str, dict[str, Any]], log_level: int) -> None:
+    # workers started with the 'spawn' method do not inherit the logging configuration
+    logging.basicConfig(level=log_level, format="%(levelname)s: %(message)s")
+    _batch_docs.update(docs)
+
+
+def _annotate_directory(  # pylint: disable=too-many-arguments
+    directory: str,
+    doc_key: str,
+    *,
+    xml_url: str,
+    vehicle_type: str,
+    max_line_length: int,
+    sort_type: str,
+    delete_documentation_annotations: bool,
+) -> None:
+    param_default_dict = load_default_param_file(directory)
+    update_parameter_documentation(
+        _batch_docs[doc_key],
+        directory,
+        sort_type,
+        param_default_dict,
+        delete_documentation_annotations,
+        rendered_doc_cache=_batch_rendered_docs.setdefault(doc_key, {}),
+    )
+
+    # Annotate lua MAGfit XML documentation into the respective parameter file
+    target = os_path.join(directory, "24_inflight_magnetometer_fit_setup.param")
+    if os_path.isfile(os_path.join(directory, LUA_PARAM_DEFINITION_XML_FILE)) and os_path.isfile(target):
+        doc_dict = parse_parameter_metadata(xml_url, directory, LUA_PARAM_DEFINITION_XML_FILE, vehicle_type, max_line_length)
+        update_parameter_documentation(doc_dict, target, sort_type, param_default_dict, delete_documentation_annotations)
+
+
+def update_parameter_documentation_recursively(  # pylint: disable=too-many-arguments, too-many-locals
+    target: str,
+    vehicle_type: str,
+    firmware_version: str,
+    max_line_length: int,
+    *,
+    sort_type: str = "none",
+    delete_documentation_annotations: bool = False,
+    jobs: int = 1,
+) -> None:
+    """
+    Updates the parameter documentation of all directories below the target directory that contain parameter files.
+
+    Each distinct apm.pdef.xml file is parsed only once, even if identical copies of it are stored in many directories.
+    The directories get annotated in parallel by a pool of jobs processes,
+    and each process renders the documentation comment of a parameter only once.
+
+    Args:
+        target (str): The top-level directory.
+        vehicle_type (str): The type of the vehicle, used to download missing apm.pdef.xml files.
+        firmware_version (str): The firmware version, used to download missing apm.pdef.xml files.
+        max_line_length (int): Maximum documentation line length.
+        sort_type (str, optional): The type of sorting to apply to the parameters. Defaults to 'none'.
+        delete_documentation_annotations (bool, optional): Delete the annotations instead. Defaults to False.
+        jobs (int, optional): Number of processes annotating directories in parallel. Defaults to 1.
+    """
+    if not os_path.isdir(target):
+        raise ValueError(f"Target '{target}' is not a directory.")
+    xml_url = get_xml_url(vehicle_type, firmware_version)
+
+    docs: dict[str, dict[str, Any]] = {}
+    tasks: list[tuple[str, str]] = []
+    failed_dirs: list[str] = []
+    for directory in find_param_file_dirs(target):
+        local_xml_file = get_local_xml_file_path(directory, PARAM_DEFINITION_XML_FILE)
+        doc_dict = None
+        if local_xml_file is None:
+            # downloads the XML file and stores it in the directory
+            try:
+                doc_dict = parse_parameter_metadata(
+                    xml_url, directory, PARAM_DEFINITION_XML_FILE, vehicle_type, max_line_length
+                )
+            except SystemExit as exp:
+                logging.error("Skipping directory %s: %s", directory, exp)
+                failed_dirs.append(directory)
+                continue
+            local_xml_file = os_path.join(directory, PARAM_DEFINITION_XML_FILE)
+        doc_key = file_content_hash(local_xml_file)
+        if doc_key not in docs:
+            docs[doc_key] = (
+                doc_dict
+                if doc_dict is not None
+                else create_doc_dict_from_xml_file(local_xml_file, vehicle_type, max_line_length)
+            )
+        tasks.append((directory, doc_key))
+    logging.info("Annotating %d directories using %d distinct XML documentation files", len(tasks), len(docs))
+
+    task_kwargs: dict[str, Any] = {
+        "xml_url": xml_url,
+        "vehicle_type": vehicle_type,
+        "max_line_length": max_line_length,
+        "sort_type": sort_type,
+        "delete_documentation_annotations": delete_documentation_annotations,
+    }
+    if jobs <= 1 or len(tasks) <= 1:
+        _init_batch_worker(docs, logging.getLogger().getEffectiveLevel())
+        try:
+            for directory, doc_key in tasks:
+                _annotate_directory(directory, doc_key, **task_kwargs)
+        finally:
+            _batch_docs.clear()
+            _batch_rendered_docs.clear()
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(tasks)),
+            initializer=_init_batch_worker,
+            initargs=(docs, logging.getLogger().getEffectiveLevel()),
+        ) as executor:
+            futures = [executor.submit(_annotate_directory, directory, doc_key, **task_kwargs) for directory, doc_key in tasks]
+            for future in futures:
+                future.result()
+    if failed_dirs:
+        raise SystemExit(f"No XML documentation available for {len(failed_dirs)} directories")
+
+
 def main() -> None:
     args = arg_parser()
     try:
+        if args.recursive:
+            update_parameter_documentation_recursively(
+                args.target,
+                args.vehicle_type,
+                args.firmware_version,
+                args.max_line_length,
+                sort_type=args.sort,
+                delete_documentation_annotations=args.delete_documentation_annotations,
+                jobs=args.jobs,
+            )
+            return
+
         xml_url = get_xml_url(args.vehicle_type, args.firmware_version)
         xml_dir = get_xml_dir(args.target)
 
@@ -28,6 +28,7 @@ from MethodicConfigurator.frontend_tkinter_connection_selection import Connectio
 from MethodicConfigurator.frontend_tkinter_directory_selection import VehicleDirectorySelectionWindow
 from MethodicConfigurator.frontend_tkinter_flightcontroller_info import FlightControllerInfoWindow
 from MethodicConfigurator.frontend_tkinter_parameter_editor import ParameterEditorWindow
+from MethodicConfigurator.startup_profiler import startup_phase, waiting_for_user
 
 
 def argument_parser():
@@ -63,12 +64,14 @@ def argument_parser():
 def connect_to_fc_and_read_parameters(args) -> tuple[FlightController, str]:
     flight_controller = FlightController(args.reboot_time)
 
-    error_str = flight_controller.connect(args.device, log_errors=False)
+    with startup_phase("FC connect"):
+        error_str = flight_controller.connect(args.device, log_errors=False)
     if error_str:
         if args.device and _("No serial ports found") not in error_str:
             logging_error(error_str)
         conn_sel_window = ConnectionSelectionWindow(flight_controller, error_str)
-        conn_sel_window.root.mainloop()
+        with waiting_for_user():
+            conn_sel_window.root.mainloop()
 
     vehicle_type = args.vehicle_type
     if vehicle_type == "":  # not explicitly set, to try to guess it
@@ -88,24 +91,26 @@ def component_editor(
     local_filesystem: LocalFilesystem,
     vehicle_dir_window,
 ) -> None:
-    component_editor_window = ComponentEditorWindow(__version__, local_filesystem)
-    if (
-        vehicle_dir_window
-        and vehicle_dir_window.configuration_template
-        and vehicle_dir_window.use_fc_params.get()
-        and flight_controller.fc_parameters
-    ):
-        # copy vehicle parameters to component editor values
-        component_editor_window.set_values_from_fc_parameters(flight_controller.fc_parameters, local_filesystem.doc_dict)
-    component_editor_window.populate_frames()
-    component_editor_window.set_vehicle_type_and_version(vehicle_type, flight_controller.info.flight_sw_version_and_type)
-    component_editor_window.set_fc_manufacturer(flight_controller.info.vendor)
-    component_editor_window.set_fc_model(flight_controller.info.product)
-    if vehicle_dir_window and vehicle_dir_window.configuration_template:
-        component_editor_window.set_vehicle_configuration_template(vehicle_dir_window.configuration_template)
+    with startup_phase("component editor"):
+        component_editor_window = ComponentEditorWindow(__version__, local_filesystem)
+        if (
+            vehicle_dir_window
+            and vehicle_dir_window.configuration_template
+            and vehicle_dir_window.use_fc_params.get()
+            and flight_controller.fc_parameters
+        ):
+            # copy vehicle parameters to component editor values
+            component_editor_window.set_values_from_fc_parameters(flight_controller.fc_parameters, local_filesystem.doc_dict)
+        component_editor_window.populate_frames()
+        component_editor_window.set_vehicle_type_and_version(vehicle_type, flight_controller.info.flight_sw_version_and_type)
+        component_editor_window.set_fc_manufacturer(flight_controller.info.vendor)
+        component_editor_window.set_fc_model(flight_controller.info.product)
+        if vehicle_dir_window and vehicle_dir_window.configuration_template:
+            component_editor_window.set_vehicle_configuration_template(vehicle_dir_window.configuration_template)
     if args.skip_component_editor:
         component_editor_window.root.after(10, component_editor_window.root.destroy)
-    component_editor_window.root.mainloop()
+    with waiting_for_user():
+        component_editor_window.root.mainloop()
 
     if vehicle_dir_window and vehicle_dir_window.configuration_template and vehicle_dir_window.use_fc_params.get():
         error_message = local_filesystem.copy_fc_params_values_to_template_created_vehicle_files(
@@ -134,13 +139,15 @@ def main() -> None:
 
     param_default_values = {}
     if flight_controller.master is not None or args.device == "test":
-        fciw = FlightControllerInfoWindow(flight_controller)
+        with startup_phase("FC parameter download"):
+            fciw = FlightControllerInfoWindow(flight_controller)
         param_default_values = fciw.get_param_default_values()
 
     try:
-        local_filesystem = LocalFilesystem(
-            args.vehicle_dir, vehicle_type, flight_controller.info.flight_sw_version, args.allow_editing_template_files
-        )
+        with startup_phase("LocalFilesystem init"):
+            local_filesystem = LocalFilesystem(
+                args.vehicle_dir, vehicle_type, flight_controller.info.flight_sw_version, args.allow_editing_template_files
+            )
     except SystemExit as exp:
         show_error_message(_("Fatal error reading parameter files"), f"{exp}")
         raise
@@ -155,7 +162,8 @@ def main() -> None:
     vehicle_dir_window = None
     if not files:
         vehicle_dir_window = VehicleDirectorySelectionWindow(local_filesystem, len(flight_controller.fc_parameters) > 0)
-        vehicle_dir_window.root.mainloop()
+        with waiting_for_user():
+            vehicle_dir_window.root.mainloop()
 
     component_editor(args, flight_controller, local_filesystem.vehicle_type, local_filesystem, vehicle_dir_window)
 
@@ -167,7 +175,9 @@ def main() -> None:
     start_file = local_filesystem.get_start_file(args.n, imu_tcal_available)
 
     # Call the GUI function with the starting intermediate parameter file
-    ParameterEditorWindow(start_file, flight_controller, local_filesystem)
+    # it prints the startup profile once displayed, the phase is reported until then
+    with startup_phase("parameter editor"):
+        ParameterEditorWindow(start_file, flight_controller, local_filesystem, args.watch_vehicle_dir)
 
     # Close the connection to the flight controller
     flight_controller.disconnect()
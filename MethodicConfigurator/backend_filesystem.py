@@ -10,6 +10,7 @@ SPDX-License-Identifier: GPL-3.0-or-later
 
 # from sys import exit as sys_exit
 from argparse import ArgumentParser
+from collections.abc import Iterator, Mapping
 from logging import debug as logging_debug
 from logging import error as logging_error
 from logging import info as logging_info
@@ -18,33 +19,47 @@ from os import getcwd as os_getcwd
 from os import listdir as os_listdir
 from os import path as os_path
 from os import rename as os_rename
+from os import stat as os_stat
 from platform import system as platform_system
 from re import compile as re_compile
 from shutil import copy2 as shutil_copy2
 from shutil import copytree as shutil_copytree
+from time import time as time_time
 from typing import Any, Optional
 from zipfile import ZipFile
 
-from requests import get as requests_get
-
 from MethodicConfigurator import _
 from MethodicConfigurator.annotate_params import (
     PARAM_DEFINITION_XML_FILE,
     Par,
+    format_annotated_params,
     format_columns,
     get_xml_dir,
     get_xml_url,
     load_default_param_file,
     parse_parameter_metadata,
     split_into_lines,
-    update_parameter_documentation,
+    update_parameter_documentation_file,
+    write_file_if_changed,
 )
 from MethodicConfigurator.backend_filesystem_configuration_steps import ConfigurationSteps
+from MethodicConfigurator.backend_filesystem_documentation_cache import (
+    documentation_cache_key,
+    load_cached_documentation,
+    save_cached_documentation,
+)
 from MethodicConfigurator.backend_filesystem_program_settings import ProgramSettings
 from MethodicConfigurator.backend_filesystem_vehicle_components import VehicleComponents
+from MethodicConfigurator.startup_profiler import startup_phase
 
 TOOLTIP_MAX_LENGTH = 105
 
+# Files modified less than this many seconds ago are not cached, their mtime might not change on the next edit
+PARAM_FILE_CACHE_MIN_AGE = 2.0
+
+# Parsed intermediate parameter files, keyed by absolute path, with the (size, mtime_ns) they were parsed at
+_parsed_param_files: dict[str, tuple[tuple[int, int], dict[str, Par]]] = {}
+
 
 def is_within_tolerance(x: float, y: float, atol: float = 1e-08, rtol: float = 1e-03) -> bool:
     """
@@ -66,7 +81,87 @@ def is_within_tolerance(x: float, y: float, atol: float = 1e-08, rtol: float = 1
     return abs(x - y) <= atol + (rtol * abs(y))
 
 
-class LocalFilesystem(VehicleComponents, ConfigurationSteps, ProgramSettings):  # pylint: disable=too-many-public-methods
+class ParameterDocumentation(Mapping[str, Any]):
+    """
+    The documentation of a single parameter, as parsed from the apm.pdef.xml file.
+
+    Besides the parsed "humanName", "documentation", "fields" and "values" it provides the derived
+    "unit", "unit_tooltip", "min", "max", "Calibration", "ReadOnly", "RebootRequired", "Bitmask", "Values"
+    and "doc_tooltip" entries. These are computed the first time the documentation gets read and then memoized,
+    so that out of the thousands of documented parameters only the ones actually displayed or used pay for it.
+    """
+
+    def __init__(self, param_info: dict[str, Any], default_value: Optional[float] = None) -> None:
+        self.__param_info = param_info
+        self.__default_value = default_value
+        self.__documentation: Optional[dict[str, Any]] = None
+
+    def __getitem__(self, key: str) -> Any:  # noqa: ANN401
+        return self.__get_documentation()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__get_documentation())
+
+    def __len__(self) -> int:
+        return len(self.__get_documentation())
+
+    def __repr__(self) -> str:
+        return repr(self.__get_documentation())
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Only pickle the parsed documentation, the derived fields are cheap to recompute on demand
+        return (ParameterDocumentation, (self.__param_info, self.__default_value))
+
+    def __get_documentation(self) -> dict[str, Any]:  # pylint: disable=too-many-branches
+        if self.__documentation is not None:
+            return self.__documentation
+        param_info = dict(self.__param_info)
+        if "fields" in param_info:
+            param_fields = param_info["fields"]
+            if "Units" in param_fields:
+                units_list = param_fields["Units"].split("(")
+                param_info["unit"] = units_list[0].strip()
+                if len(units_list) > 1:
+                    param_info["unit_tooltip"] = units_list[1].strip(")").strip()
+            if "Range" in param_fields:
+                param_info["min"] = float(param_fields["Range"].split(" ")[0].strip())
+                param_info["max"] = float(param_fields["Range"].split(" ")[1].strip())
+            if "Calibration" in param_fields:
+                param_info["Calibration"] = LocalFilesystem.str_to_bool(param_fields["Calibration"].strip())
+            if "ReadOnly" in param_fields:
+                param_info["ReadOnly"] = LocalFilesystem.str_to_bool(param_fields["ReadOnly"].strip())
+            if "RebootRequired" in param_fields:
+                param_info["RebootRequired"] = LocalFilesystem.str_to_bool(param_fields["RebootRequired"].strip())
+            if "Bitmask" in param_fields:
+                bitmask_items = param_fields["Bitmask"].split(",")
+                param_info["Bitmask"] = {}
+                for item in bitmask_items:
+                    key, value = item.split(":")
+                    param_info["Bitmask"][int(key.strip())] = value.strip()
+
+        if param_info.get("values"):
+            try:
+                param_info["Values"] = {int(k): v for k, v in param_info["values"].items()}
+            except ValueError:
+                param_info["Values"] = {float(k): v for k, v in param_info["values"].items()}
+
+        prefix_parts = [
+            f"{param_info['humanName']}",
+        ]
+        prefix_parts += param_info["documentation"]
+        for key, value in param_info["fields"].items():
+            if key not in {"Units", "UnitText"}:
+                prefix_parts += split_into_lines(f"{key}: {value}", TOOLTIP_MAX_LENGTH)
+        prefix_parts += format_columns(param_info["values"], TOOLTIP_MAX_LENGTH)
+        if self.__default_value is not None:
+            default_value = format(self.__default_value, ".6f").rstrip("0").rstrip(".")
+            prefix_parts += [f"Default: {default_value}"]
+        param_info["doc_tooltip"] = ("\n").join(prefix_parts)
+        self.__documentation = param_info
+        return param_info
+
+
+class LocalFilesystem(VehicleComponents, ConfigurationSteps, ProgramSettings):  # pylint: disable=too-many-public-methods, too-many-instance-attributes
     """
     A class to manage local filesystem operations for the ArduPilot methodic configurator.
 
@@ -93,12 +188,15 @@ class LocalFilesystem(VehicleComponents, ConfigurationSteps, ProgramSettings):
         self.param_default_dict: dict[str, Par] = {}
         self.vehicle_dir = vehicle_dir
         self.doc_dict: dict[str, Any] = {}
+        self.rendered_doc_cache: dict[str, str] = {}
+        self.__param_file_stats: dict[str, Optional[tuple[int, int]]] = {}
         if vehicle_dir is not None:
             self.re_init(vehicle_dir, vehicle_type)
 
     def re_init(self, vehicle_dir: str, vehicle_type: str) -> None:
         self.vehicle_dir = vehicle_dir
         self.doc_dict = {}
+        self.rendered_doc_cache = {}
 
         if not self.load_vehicle_components_json_data(vehicle_dir):
             return
@@ -124,19 +222,74 @@ class LocalFilesystem(VehicleComponents, ConfigurationSteps, ProgramSettings):
             return  # No files intermediate parameters files found, no need to continue, the rest needs them
 
         # Read ArduPilot parameter documentation
-        xml_url = get_xml_url(vehicle_type, self.fw_version)
         xml_dir = get_xml_dir(vehicle_dir)
-        self.doc_dict = parse_parameter_metadata(xml_url, xml_dir, PARAM_DEFINITION_XML_FILE, vehicle_type, TOOLTIP_MAX_LENGTH)
         self.param_default_dict = load_default_param_file(xml_dir)
+        pdef_xml_files = [
+            filename.replace(".param", ".pdef.xml")
+            for filename in self.file_parameters
+            if os_path.exists(os_path.join(xml_dir, filename.replace(".param", ".pdef.xml")))
+        ]
+        with startup_phase("XML parse"):
+            self.doc_dict = self.load_parameter_documentation(
+                xml_dir, vehicle_type, self.fw_version, pdef_xml_files, self.param_default_dict
+            )
 
+    @staticmethod
+    def load_parameter_documentation(
+        xml_dir: str,
+        vehicle_type: str,
+        fw_version: str = "",
+        pdef_xml_files: Optional[list[str]] = None,
+        param_default_dict: Optional[dict[str, Par]] = None,
+    ) -> dict[str, Any]:
+        """
+        Loads the parameter documentation of a vehicle or of a vehicle template directory.
+
+        The apm.pdef.xml and <parameter_file>.pdef.xml files are resolved through the content-addressed
+        documentation store, so directories with identical copies of them share one parsed instance of each.
+
+        Args:
+            xml_dir (str): The directory containing the apm.pdef.xml file.
+            vehicle_type (str): The vehicle type, used to download a missing apm.pdef.xml file.
+            fw_version (str, optional): The firmware version, used to download a missing apm.pdef.xml file.
+            pdef_xml_files (list[str], optional): Additional <parameter_file>.pdef.xml files extending the
+                                                  documentation. Defaults to all of them in the directory.
+            param_default_dict (dict, optional): The default parameter values. Defaults to the 00_default.param file.
+
+        Returns:
+            dict[str, Any]: The documentation of each parameter.
+        """
+        if pdef_xml_files is None:
+            pdef_xml_files = (
+                sorted(f for f in os_listdir(xml_dir) if f.endswith(".pdef.xml") and f != PARAM_DEFINITION_XML_FILE)
+                if os_path.isdir(xml_dir)
+                else []
+            )
+        if param_default_dict is None:
+            param_default_dict = load_default_param_file(xml_dir)
+
+        doc_cache_dir = ProgramSettings.get_documentation_cache_dir()
+        doc_dict: dict[str, Any] = {}
         # Extend parameter documentation metadata if <parameter_file>.pdef.xml exists
-        for filename in self.file_parameters:
-            pdef_xml_file = filename.replace(".param", ".pdef.xml")
-            if os_path.exists(os_path.join(xml_dir, pdef_xml_file)):
-                doc_dict = parse_parameter_metadata("", xml_dir, pdef_xml_file, vehicle_type, TOOLTIP_MAX_LENGTH)
-                self.doc_dict.update(doc_dict)
+        for xml_file in [PARAM_DEFINITION_XML_FILE, *pdef_xml_files]:
+            # A parsed file only depends on its contents, reuse it if another directory already had the same file
+            xml_path = os_path.join(xml_dir, xml_file)
+            file_doc_dict = load_cached_documentation(
+                doc_cache_dir, documentation_cache_key([xml_path], vehicle_type, TOOLTIP_MAX_LENGTH)
+            )
+            if file_doc_dict is None:
+                # only the main XML file can be downloaded
+                xml_url = get_xml_url(vehicle_type, fw_version) if xml_file == PARAM_DEFINITION_XML_FILE else ""
+                file_doc_dict = parse_parameter_metadata(xml_url, xml_dir, xml_file, vehicle_type, TOOLTIP_MAX_LENGTH)
+                # the key is only computed now, because the main XML file might just have been downloaded
+                save_cached_documentation(
+                    doc_cache_dir, documentation_cache_key([xml_path], vehicle_type, TOOLTIP_MAX_LENGTH), file_doc_dict
+                )
+            # The shared parsed entries are only wrapped, never modified
+            doc_dict.update(file_doc_dict)
 
-        self.__extend_and_reformat_parameter_documentation_metadata()
+        LocalFilesystem.__extend_and_reformat_parameter_documentation_metadata(doc_dict, param_default_dict)
+        return doc_dict
 
     def vehicle_configuration_files_exist(self, vehicle_dir: str) -> bool:
         if os_path.exists(vehicle_dir) and os_path.isdir(vehicle_dir):
@@ -171,50 +324,16 @@ class LocalFilesystem(VehicleComponents, ConfigurationSteps, ProgramSettings):
                         os_rename(old_filename_path, new_filename_path)
                         logging_info("Renamed %s to %s", old_filename, new_filename)
 
-    def __extend_and_reformat_parameter_documentation_metadata(self) -> None:  # pylint: disable=too-many-branches
-        for param_name, param_info in self.doc_dict.items():
-            if "fields" in param_info:
-                param_fields = param_info["fields"]
-                if "Units" in param_fields:
-                    units_list = param_fields["Units"].split("(")
-                    param_info["unit"] = units_list[0].strip()
-                    if len(units_list) > 1:
-                        param_info["unit_tooltip"] = units_list[1].strip(")").strip()
-                if "Range" in param_fields:
-                    param_info["min"] = float(param_fields["Range"].split(" ")[0].strip())
-                    param_info["max"] = float(param_fields["Range"].split(" ")[1].strip())
-                if "Calibration" in param_fields:
-                    param_info["Calibration"] = self.str_to_bool(param_fields["Calibration"].strip())
-                if "ReadOnly" in param_fields:
-                    param_info["ReadOnly"] = self.str_to_bool(param_fields["ReadOnly"].strip())
-                if "RebootRequired" in param_fields:
-                    param_info["RebootRequired"] = self.str_to_bool(param_fields["RebootRequired"].strip())
-                if "Bitmask" in param_fields:
-                    bitmask_items = param_fields["Bitmask"].split(",")
-                    param_info["Bitmask"] = {}
-                    for item in bitmask_items:
-                        key, value = item.split(":")
-                        param_info["Bitmask"][int(key.strip())] = value.strip()
-
-            if param_info.get("values"):
-                try:
-                    param_info["Values"] = {int(k): v for k, v in param_info["values"].items()}
-                except ValueError:
-                    param_info["Values"] = {float(k): v for k, v in param_info["values"].items()}
-                # print(param_info['Values'])
-
-            prefix_parts = [
-                f"{param_info['humanName']}",
-            ]
-            prefix_parts += param_info["documentation"]
-            for key, value in param_info["fields"].items():
-                if key not in {"Units", "UnitText"}:
-                    prefix_parts += split_into_lines(f"{key}: {value}", TOOLTIP_MAX_LENGTH)
-            prefix_parts += format_columns(param_info["values"], TOOLTIP_MAX_LENGTH)
-            if param_name in self.param_default_dict:
-                default_value = format(self.param_default_dict[param_name].value, ".6f").rstrip("0").rstrip(".")
-                prefix_parts += [f"Default: {default_value}"]
-            param_info["doc_tooltip"] = ("\n").join(prefix_parts)
+    @staticmethod
+    def __extend_and_reformat_parameter_documentation_metadata(
+        doc_dict: dict[str, Any], param_default_dict: dict[str, Par]
+    ) -> None:
+        # The derived documentation fields are only computed for the parameters that actually get used
+        for param_name, param_info in doc_dict.items():
+            param_default = param_default_dict.get(param_name)
+            doc_dict[param_name] = ParameterDocumentation(
+                param_info, param_default.value if param_default is not None else None
+            )
 
     def read_params_from_files(self) -> dict[str, dict[str, "Par"]]:
         """
@@ -223,25 +342,95 @@ class LocalFilesystem(VehicleComponents, ConfigurationSteps, ProgramSettings):
         This function scans the specified directory for files matching a specific pattern,
         reads each file, and stores the parameter names and values in a dictionary.
         Files named '00_default.param' and '01_ignore_readonly.param' are ignored.
+        Only files whose size or modification time changed since they were last parsed get parsed again.
 
         Returns:
         - Dict[str, Dict[str, 'Par']]: A dictionary with filenames as keys and as values
                                        a dictionary with (parameter names, values) pairs.
         """
         parameters: dict[str, dict[str, Par]] = {}
+        self.__param_file_stats = {}
         if os_path.isdir(self.vehicle_dir):
-            # Regular expression pattern for filenames starting with two digits followed by an underscore and ending in .param
-            pattern = re_compile(r"^\d{2}_.*\.param$")
-
-            for filename in sorted(os_listdir(self.vehicle_dir)):
-                if pattern.match(filename):
-                    if filename in {"00_default.param", "01_ignore_readonly.param"}:
-                        continue
-                    parameters[filename] = Par.load_param_file_into_dict(os_path.join(self.vehicle_dir, filename))
+            parameters = self.__read_param_files(self.__intermediate_param_filenames())
         else:
             logging_error(_("Error: %s is not a directory."), self.vehicle_dir)
         return parameters
 
+    def refresh(self) -> list[str]:
+        """
+        Reconciles file_parameters with the intermediate parameter files in the vehicle directory.
+
+        Files that got added or changed on disk since they were last read or written are read,
+        entries of removed files are dropped and all other entries, including their unsaved edits, are kept.
+
+        Returns:
+        - List[str]: The names of the files that got added, changed or removed, sorted.
+        """
+        if not os_path.isdir(self.vehicle_dir):
+            logging_error(_("Error: %s is not a directory."), self.vehicle_dir)
+            return []
+        filenames = self.__intermediate_param_filenames()
+        changed = [
+            filename
+            for filename in filenames
+            if filename not in self.file_parameters
+            or self.__param_file_stats.get(filename) != self.__param_file_stat(filename)
+        ]
+        removed = [filename for filename in self.file_parameters if filename not in filenames]
+        if not changed and not removed:
+            return []
+        for filename in removed:
+            self.__param_file_stats.pop(filename, None)
+        reloaded = self.__read_param_files(changed)
+        self.file_parameters = {
+            filename: reloaded[filename] if filename in reloaded else self.file_parameters[filename] for filename in filenames
+        }
+        return sorted(changed + removed)
+
+    def __intermediate_param_filenames(self) -> list[str]:
+        # Regular expression pattern for filenames starting with two digits followed by an underscore and ending in .param
+        pattern = re_compile(r"^\d{2}_.*\.param$")
+        return [
+            filename
+            for filename in sorted(os_listdir(self.vehicle_dir))
+            if pattern.match(filename) and filename not in {"00_default.param", "01_ignore_readonly.param"}
+        ]
+
+    def __param_file_stat(self, filename: str) -> Optional[tuple[int, int]]:
+        try:
+            stat = os_stat(os_path.join(self.vehicle_dir, filename))
+        except OSError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def __read_param_files(self, filenames: list[str]) -> dict[str, dict[str, "Par"]]:
+        """Reads the files through the parsed files cache and records their (size, mtime_ns)"""
+        paths = {filename: os_path.abspath(os_path.join(self.vehicle_dir, filename)) for filename in filenames}
+        stats = {filename: self.__param_file_stat(filename) for filename in filenames}
+        stale = [
+            filename
+            for filename in filenames
+            if stats[filename] is None or _parsed_param_files.get(paths[filename], (None, {}))[0] != stats[filename]
+        ]
+        # Parse all files in one call, reading ~50 small local files with threads would only add overhead
+        loaded_files = Par.load_param_files_into_dicts([paths[filename] for filename in stale])
+        recently_modified = (time_time() - PARAM_FILE_CACHE_MIN_AGE) * 1e9
+        parameters: dict[str, dict[str, Par]] = {}
+        for filename in filenames:
+            stat = stats[filename]
+            if filename in stale:
+                parsed = loaded_files[paths[filename]]
+                if stat is not None and stat[1] < recently_modified:
+                    _parsed_param_files[paths[filename]] = (stat, parsed)
+                else:
+                    _parsed_param_files.pop(paths[filename], None)
+            else:
+                parsed = _parsed_param_files[paths[filename]][1]
+            # The editor modifies the returned parameters, so the cache must only hand out copies
+            parameters[filename] = {name: Par(par.value, par.comment) for name, par in parsed.items()}
+            self.__param_file_stats[filename] = stat
+        return parameters
+
     @staticmethod
     def str_to_bool(s) -> Optional[bool]:
         """
@@ -267,18 +456,40 @@ class LocalFilesystem(VehicleComponents, ConfigurationSteps, ProgramSettings):
         Exports a dictionary of parameters to a .param file and optionally annotates the documentation.
 
         This function formats the provided parameters into a string suitable for a .param file,
-        writes the string to the specified output file, and optionally updates the parameter documentation.
+        optionally annotates it with the parameter documentation, and writes it to the specified output file.
+        The file is only written if its content changes.
 
         Parameters:
         - params (Dict[str, 'Par']): A dictionary of parameters to export.
         - filename_out (str): The name of the output file.
         - annotate_doc (bool, optional): Whether to update the parameter documentation. Defaults to True.
         """
-        Par.export_to_param(Par.format_params(params), os_path.join(self.vehicle_dir, filename_out))
-        if annotate_doc:
-            update_parameter_documentation(
-                self.doc_dict, os_path.join(self.vehicle_dir, filename_out), "missionplanner", self.param_default_dict
+        param_file = os_path.join(self.vehicle_dir, filename_out)
+        # update_parameter_documentation() does not annotate the MAGfit file without its lua documentation either
+        if (
+            not annotate_doc
+            or not params
+            or (filename_out.endswith("24_inflight_magnetometer_fit_setup.param") and "MAGH_ALT_DELTA" not in self.doc_dict)
+        ):
+            Par.export_to_param(Par.format_params(params), param_file)
+        elif filename_out.endswith("16_pid_adjustment.param"):
+            # this file gets special treatment of its first lines, keep using the generic annotation for it
+            update_parameter_documentation_file(
+                self.doc_dict,
+                "missionplanner",
+                self.param_default_dict,
+                param_file,
+                [line + "\n" for line in Par.format_params(params)],
+                delete_documentation_annotations=False,
             )
+        else:
+            write_file_if_changed(
+                param_file,
+                format_annotated_params(params, self.doc_dict, self.param_default_dict, self.rendered_doc_cache),
+            )
+        if params is self.file_parameters.get(filename_out):
+            # the file now holds these parameters, refresh() must not read it back over them
+            self.__param_file_stats[filename_out] = self.__param_file_stat(filename_out)
 
     def vehicle_configuration_file_exists(self, filename: str) -> bool:
         """
@@ -625,6 +836,9 @@ class LocalFilesystem(VehicleComponents, ConfigurationSteps, ProgramSettings):
             logging_error(_("URL or local filename not provided."))
             return False
         logging_info(_("Downloading %s from %s"), local_filename, url)
+        # imported on first use, it is slow to import and most sessions never download anything
+        from requests import get as requests_get  # pylint: disable=import-outside-toplevel
+
         response = requests_get(url, timeout=timeout)
 
         if response.status_code == 200:
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+"""
+Content-addressed store of the parsed and reformatted ArduPilot parameter documentation.
+
+Parsing the multi-megabyte apm.pdef.xml file and reformatting its documentation strings takes seconds,
+so the parsed documentation dictionary gets pickled and reused as long as its source files do not change.
+
+The store is keyed by the hashes of the source file contents and not by their location, so that the many
+vehicle template directories that carry identical copies of apm.pdef.xml share a single cache file,
+and a single in-memory documentation dictionary while the program runs.
+
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+from hashlib import sha256
+from logging import debug as logging_debug
+from os import path as os_path
+from os import replace as os_replace
+from pickle import HIGHEST_PROTOCOL
+from pickle import dump as pickle_dump
+from pickle import load as pickle_load
+from typing import Any, Optional
+
+from MethodicConfigurator import _
+from MethodicConfigurator.annotate_params import file_content_hash
+
+# Increment whenever the structure of the cached documentation dictionary changes
+DOCUMENTATION_CACHE_FORMAT_VERSION = 4
+
+# Number of documentation dictionaries kept in memory, one per distinct set of source file contents
+MAX_DOCUMENTATION_STORE_ENTRIES = 8
+
+# cache key -> documentation dictionary, shared by all directories with identical source files
+_documentation_store: dict[tuple[Any, ...], dict[str, Any]] = {}
+
+
+def documentation_cache_key(source_files: list[str], vehicle_type: str, max_line_length: int) -> Optional[tuple[Any, ...]]:
+    """
+    Identifies a documentation dictionary by everything it was generated from.
+
+    Args:
+        source_files (list[str]): The files the documentation was generated from, the main XML file first.
+        vehicle_type (str): The vehicle type the documentation was generated for.
+        max_line_length (int): The maximum tooltip line length the documentation was formatted with.
+
+    Returns:
+        tuple: The cache key, or None if the main XML file does not exist and nothing can be cached.
+    """
+    if not source_files or not os_path.isfile(source_files[0]):
+        return None
+    files_info = tuple(
+        (os_path.basename(filename), file_content_hash(filename) if os_path.isfile(filename) else None)
+        for filename in source_files
+    )
+    return (DOCUMENTATION_CACHE_FORMAT_VERSION, vehicle_type, max_line_length, files_info)
+
+
+def documentation_cache_filename(cache_dir: str, key: tuple[Any, ...]) -> str:
+    """The file name is derived from the source file contents, so identical copies share one cache file"""
+    return os_path.join(cache_dir, sha256(repr(key).encode("utf-8")).hexdigest()[:32] + ".pickle")
+
+
+def load_cached_documentation(cache_dir: str, key: Optional[tuple[Any, ...]]) -> Optional[dict[str, Any]]:
+    """Returns the cached documentation dictionary, or None if there is none or if it is out of date"""
+    if key is None:
+        return None
+    if key in _documentation_store:
+        return _documentation_store[key]
+    filename = documentation_cache_filename(cache_dir, key)
+    try:
+        with open(filename, "rb") as file:
+            # the cache file was written by this program into the user's own configuration directory
+            cached_key, doc_dict = pickle_load(file)  # noqa: S301
+    except FileNotFoundError:
+        return None
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logging_debug(_("Ignoring unreadable documentation cache file %s: %s"), filename, e)
+        return None
+    if cached_key != key:
+        logging_debug(_("Documentation cache file %s is out of date"), filename)
+        return None
+    logging_debug(_("Loaded parameter documentation from cache file %s"), filename)
+    _add_to_documentation_store(key, doc_dict)
+    return doc_dict  # type: ignore[no-any-return]
+
+
+def save_cached_documentation(cache_dir: str, key: Optional[tuple[Any, ...]], doc_dict: dict[str, Any]) -> None:
+    if key is None or not doc_dict:
+        return
+    _add_to_documentation_store(key, doc_dict)
+    filename = documentation_cache_filename(cache_dir, key)
+    try:
+        # write to a temporary file first, so that concurrent readers never see a partially written cache
+        with open(filename + ".tmp", "wb") as file:
+            pickle_dump((key, doc_dict), file, protocol=HIGHEST_PROTOCOL)
+        os_replace(filename + ".tmp", filename)
+    except OSError as e:
+        logging_debug(_("Could not write documentation cache file %s: %s"), filename, e)
+
+
+def _add_to_documentation_store(key: tuple[Any, ...], doc_dict: dict[str, Any]) -> None:
+    _documentation_store.pop(key, None)
+    _documentation_store[key] = doc_dict
+    while len(_documentation_store) > MAX_DOCUMENTATION_STORE_ENTRIES:
+        # dictionaries keep their insertion order, so the first one is the least recently stored
+        del _documentation_store[next(iter(_documentation_store))]
+
+
+def clear_documentation_store() -> None:
+    """Forgets the in-memory documentation dictionaries, the cache files on disk are kept"""
+    _documentation_store.clear()
@@ -217,6 +217,18 @@ class ProgramSettings:
         logging_debug(_("site_directory: %s"), site_directory)
         return os_path.join(site_directory, "vehicle_templates")
 
+    @staticmethod
+    def get_documentation_cache_dir() -> str:
+        """Directory where the parsed parameter documentation gets cached between program runs"""
+        cache_dir = os_path.join(ProgramSettings.__user_config_dir(), "documentation_cache")
+        os_makedirs(cache_dir, exist_ok=True)
+        return cache_dir
+
+    @staticmethod
+    def get_template_overview_cache_filename() -> str:
+        """File where the overview of the vehicle templates gets cached between program runs"""
+        return os_path.join(ProgramSettings.__user_config_dir(), "template_overview_cache.json")
+
     @staticmethod
     def get_recently_used_dirs() -> tuple[str, str, str]:
         template_default_dir = os_path.join(
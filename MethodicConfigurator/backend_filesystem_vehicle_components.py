@@ -8,6 +8,7 @@ SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
 SPDX-License-Identifier: GPL-3.0-or-later
 """
 
+from collections.abc import Iterator
 from json import JSONDecodeError
 from json import dump as json_dump
 from json import load as json_load
@@ -19,14 +20,19 @@ from logging import debug as logging_debug
 # from logging import warning as logging_warning
 from logging import error as logging_error
 from os import path as os_path
+from os import replace as os_replace
+from os import stat as os_stat
 from os import walk as os_walk
 from re import match as re_match
-from typing import Any, Union
+from typing import Any, Optional, Union
 
 from MethodicConfigurator import _
 from MethodicConfigurator.backend_filesystem_program_settings import ProgramSettings
 from MethodicConfigurator.middleware_template_overview import TemplateOverview
 
+# Increment whenever the structure of the template overview cache file changes
+TEMPLATE_OVERVIEW_CACHE_FORMAT_VERSION = 1
+
 
 class VehicleComponents:
     """
@@ -96,24 +102,80 @@ class VehicleComponents:
     @staticmethod
     def get_vehicle_components_overviews() -> dict[str, TemplateOverview]:
         """
-        Finds all subdirectories of base_dir containing a "vehicle_components.json" file,
-        creates a dictionary where the keys are the subdirectory names (relative to base_dir)
-        and the values are instances of VehicleComponents.
+        Finds all subdirectories of the templates base directory containing a "vehicle_components.json" file.
+
+        :return: A dictionary mapping subdirectory paths, relative to the templates base directory,
+                 to TemplateOverview instances.
+        """
+        return dict(VehicleComponents.iter_vehicle_components_overviews())
 
-        :param base_dir: The base directory to start searching from.
-        :return: A dictionary mapping subdirectory paths to VehicleComponents instances.
+    @staticmethod
+    def iter_vehicle_components_overviews() -> Iterator[tuple[str, TemplateOverview]]:
+        """
+        Yields the (relative path, TemplateOverview) of each template directory as soon as it is found.
+
+        The overviews are cached between program runs. A template's "vehicle_components.json" file is only parsed again
+        if the modification time of the file or of its directory changed. The cache file gets updated once all
+        templates were yielded.
         """
-        vehicle_components_dict = {}
         file_to_find = VehicleComponents().vehicle_components_json_filename
         template_default_dir = ProgramSettings.get_templates_base_dir()
+        cache_filename = ProgramSettings.get_template_overview_cache_filename()
+        cached_templates = VehicleComponents.__load_template_overview_cache(cache_filename, template_default_dir)
+        templates: dict[str, list[Any]] = {}
         for root, _dirs, files in os_walk(template_default_dir):
-            if file_to_find in files:
-                relative_path = os_path.relpath(root, template_default_dir)
-                vehicle_components = VehicleComponents()
-                comp_data = vehicle_components.load_vehicle_components_json_data(root)
-                if comp_data:
-                    comp_data = comp_data.get("Components", {})
-                    vehicle_components_overview = TemplateOverview(comp_data)
-                    vehicle_components_dict[relative_path] = vehicle_components_overview
-
-        return vehicle_components_dict
+            if file_to_find not in files:
+                continue
+            relative_path = os_path.relpath(root, template_default_dir)
+            try:
+                stamp = [os_stat(root).st_mtime_ns, os_stat(os_path.join(root, file_to_find)).st_mtime_ns]
+            except OSError:
+                continue  # deleted in the meantime
+            cached = cached_templates.get(relative_path)
+            if cached and cached[:2] == stamp:
+                attributes = cached[2]
+            else:
+                comp_data = VehicleComponents().load_vehicle_components_json_data(root)
+                # templates with an empty or invalid file are cached too, so that it does not get parsed again
+                attributes = dict(TemplateOverview(comp_data.get("Components", {})).__dict__) if comp_data else None
+            templates[relative_path] = [*stamp, attributes]
+            if attributes is not None:
+                yield relative_path, TemplateOverview.from_attributes(attributes)
+        if templates != cached_templates:
+            VehicleComponents.__save_template_overview_cache(cache_filename, template_default_dir, templates)
+
+    @staticmethod
+    def __load_template_overview_cache(cache_filename: str, template_default_dir: str) -> dict[str, list[Any]]:
+        try:
+            with open(cache_filename, encoding="utf-8") as file:
+                cache = json_load(file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, JSONDecodeError) as e:
+            logging_debug(_("Ignoring unreadable template overview cache file %s: %s"), cache_filename, e)
+            return {}
+        if (
+            not isinstance(cache, dict)
+            or cache.get("format_version") != TEMPLATE_OVERVIEW_CACHE_FORMAT_VERSION
+            or cache.get("templates_dir") != template_default_dir
+        ):
+            return {}
+        templates: Optional[dict[str, list[Any]]] = cache.get("templates")
+        return templates if isinstance(templates, dict) else {}
+
+    @staticmethod
+    def __save_template_overview_cache(
+        cache_filename: str, template_default_dir: str, templates: dict[str, list[Any]]
+    ) -> None:
+        cache = {
+            "format_version": TEMPLATE_OVERVIEW_CACHE_FORMAT_VERSION,
+            "templates_dir": template_default_dir,
+            "templates": templates,
+        }
+        try:
+            # write to a temporary file first, so that concurrent readers never see a partially written cache
+            with open(cache_filename + ".tmp", "w", encoding="utf-8") as file:
+                json_dump(cache, file)
+            os_replace(cache_filename + ".tmp", cache_filename)
+        except OSError as e:
+            logging_debug(_("Could not write template overview cache file %s: %s"), cache_filename, e)
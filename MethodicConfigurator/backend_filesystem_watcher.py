@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+"""
+Detects external changes of the parameter files in a vehicle directory.
+
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+from ctypes import CDLL, get_errno
+from ctypes.util import find_library
+from logging import debug as logging_debug
+from logging import warning as logging_warning
+from os import O_CLOEXEC, O_NONBLOCK
+from os import close as os_close
+from os import fsdecode as os_fsdecode
+from os import fsencode as os_fsencode
+from os import listdir as os_listdir
+from os import path as os_path
+from os import read as os_read
+from os import stat as os_stat
+from os import strerror as os_strerror
+from platform import system as platform_system
+from struct import calcsize, unpack_from
+from typing import Optional
+
+from MethodicConfigurator import _
+
+# inotify event masks, from linux/inotify.h
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+
+WATCHED_EVENTS = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+
+# struct inotify_event without its variable length name: wd, mask, cookie, len
+INOTIFY_EVENT_HEADER = "iIII"
+INOTIFY_EVENT_HEADER_SIZE = calcsize(INOTIFY_EVENT_HEADER)
+
+WATCHED_FILE_EXTENSION = ".param"
+
+
+class VehicleDirectoryWatcher:
+    """
+    Detects files with a .param extension that got created, modified, renamed or deleted in a directory.
+
+    On Linux the directory is watched with inotify, through the C library so no extra package is needed.
+    On other systems, or if inotify is not available, the size and modification time of the files
+    are compared on each call to has_changes() instead.
+    has_changes() never blocks and no thread is used, so it can be called periodically from the GUI event loop.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self.__inotify_fd = self.__init_inotify(directory)
+        self.__snapshot: dict[str, tuple[int, int]] = {} if self.uses_inotify else self.__take_snapshot()
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self.__inotify_fd is not None
+
+    @staticmethod
+    def __init_inotify(directory: str) -> Optional[int]:
+        if platform_system() != "Linux":
+            return None
+        try:
+            libc = CDLL(find_library("c"), use_errno=True)
+            inotify_fd = libc.inotify_init1(O_NONBLOCK | O_CLOEXEC)
+        except (AttributeError, OSError) as e:
+            logging_debug(_("inotify is not available, polling %s for changes instead: %s"), directory, e)
+            return None
+        if inotify_fd < 0:
+            logging_warning(_("Could not initialize inotify, polling for changes instead: %s"), os_strerror(get_errno()))
+            return None
+        if libc.inotify_add_watch(inotify_fd, os_fsencode(directory), WATCHED_EVENTS) < 0:
+            logging_warning(_("Could not watch %s, polling for changes instead: %s"), directory, os_strerror(get_errno()))
+            os_close(inotify_fd)
+            return None
+        return int(inotify_fd)
+
+    def has_changes(self) -> bool:
+        """Returns True if any watched file changed since the previous call"""
+        if self.__inotify_fd is not None:
+            return self.__read_inotify_events(self.__inotify_fd)
+        snapshot = self.__take_snapshot()
+        changed = snapshot != self.__snapshot
+        self.__snapshot = snapshot
+        return changed
+
+    @staticmethod
+    def __read_inotify_events(inotify_fd: int) -> bool:
+        changed = False
+        while True:
+            try:
+                buffer = os_read(inotify_fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset + INOTIFY_EVENT_HEADER_SIZE <= len(buffer):
+                _wd, mask, _cookie, name_length = unpack_from(INOTIFY_EVENT_HEADER, buffer, offset)
+                offset += INOTIFY_EVENT_HEADER_SIZE
+                name = os_fsdecode(buffer[offset : offset + name_length].rstrip(b"\0"))
+                offset += name_length
+                if mask & (IN_Q_OVERFLOW | IN_DELETE_SELF | IN_MOVE_SELF) or name.endswith(WATCHED_FILE_EXTENSION):
+                    changed = True
+
+    def __take_snapshot(self) -> dict[str, tuple[int, int]]:
+        snapshot: dict[str, tuple[int, int]] = {}
+        try:
+            filenames = os_listdir(self.directory)
+        except OSError:
+            return snapshot
+        for filename in filenames:
+            if not filename.endswith(WATCHED_FILE_EXTENSION):
+                continue
+            try:
+                stat = os_stat(os_path.join(self.directory, filename))
+            except OSError:
+                continue  # deleted in the meantime
+            snapshot[filename] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def close(self) -> None:
+        if self.__inotify_fd is not None:
+            os_close(self.__inotify_fd)
+            self.__inotify_fd = None
@@ -9,16 +9,19 @@ SPDX-License-Identifier: GPL-3.0-or-later
 """
 
 from argparse import ArgumentParser
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from logging import debug as logging_debug
 from logging import error as logging_error
 from logging import info as logging_info
 from logging import warning as logging_warning
+from math import isclose
 from os import name as os_name
 from os import path as os_path
 from os import readlink as os_readlink
 from time import sleep as time_sleep
 from time import time as time_time
-from typing import NoReturn, Optional, Union
+from typing import Any, Callable, NoReturn, Optional, Union
 
 import serial.tools.list_ports
 import serial.tools.list_ports_common
@@ -32,6 +35,10 @@ from MethodicConfigurator.annotate_params import Par
 from MethodicConfigurator.argparse_check_range import CheckRange
 from MethodicConfigurator.backend_flightcontroller_info import BackendFlightcontrollerInfo
 from MethodicConfigurator.backend_mavftp import MAVFTP
+from MethodicConfigurator.backend_mavlink_dispatcher import MavlinkDispatcher
+
+# Maximum time to wait for the banner STATUSTEXT messages on boards that do not send a ChibiOS banner line
+BANNER_TIMEOUT = 1.0
 
 
 class FakeSerialForUnitTests:
@@ -70,16 +77,22 @@ class FlightController:
         fc_parameters (Dict[str, float]): A dictionary of flight controller parameters.
     """
 
-    def __init__(self, reboot_time: int) -> None:
+    def __init__(self, reboot_time: int, mavlink_connection_factory: Optional[Callable[..., Any]] = None) -> None:
         """
         Initialize the FlightController communication object.
 
+        Args:
+            reboot_time (int): The time in seconds the flight controller takes to reboot.
+            mavlink_connection_factory (callable, optional): Creates the MAVLink connections instead of
+                                                             mavutil.mavlink_connection, for instance to
+                                                             connect to a simulated autopilot.
         """
         # warn people about ModemManager which interferes badly with ArduPilot
         if os_path.exists("/usr/sbin/ModemManager"):
             logging_warning(_("You should uninstall ModemManager as it conflicts with ArduPilot"))
 
         self.__reboot_time = reboot_time
+        self.__mavlink_connection_factory = mavlink_connection_factory
         self.__connection_tuples: list[tuple[str, str]] = []
         self.discover_connections()
         self.master: Union[mavutil.mavlink_connection, None] = None
@@ -149,6 +162,13 @@ class FlightController:
             self.comport = mavutil.SerialPort(device=device, description=device)
         else:
             autodetect_serial = self.__auto_detect_serial()
+            if len(autodetect_serial) > 1:
+                # Several candidates, probe them all at once and prefer the one whose heartbeat arrives first
+                ranked_devices = [device for device, _latency in self.probe_connections([p.device for p in autodetect_serial])]
+                if ranked_devices:
+                    autodetect_serial.sort(
+                        key=lambda p: ranked_devices.index(p.device) if p.device in ranked_devices else len(ranked_devices)
+                    )
             if autodetect_serial:
                 # Resolve the soft link if it's a Linux system
                 if os_name == "posix":
@@ -171,6 +191,49 @@ class FlightController:
                 return _("No serial ports found. Please connect a flight controller and try again.")
         return self.__create_connection_with_retry(progress_callback=progress_callback, log_errors=log_errors)
 
+    def probe_connections(self, devices: Optional[list[str]] = None, timeout: float = 2) -> list[tuple[str, float]]:
+        """
+        Concurrently probes candidate connections for a MAVLink heartbeat.
+
+        All candidate ports are opened at once, each one in its own worker thread.
+        All probe connections get closed before this method returns.
+
+        Args:
+            devices (list[str], optional): The connection strings to probe. Defaults to all discovered connections.
+            timeout (float, optional): How long to listen for a heartbeat on each port. Defaults to 2 seconds.
+
+        Returns:
+            list[tuple[str, float]]: The (device, heartbeat latency) of the ports that answered, fastest first.
+        """
+        if devices is None:
+            devices = [t[0] for t in self.__connection_tuples if t[0] != _("Add another")]
+        if not devices:
+            return []
+        with ThreadPoolExecutor(max_workers=len(devices)) as executor:
+            latencies = list(executor.map(lambda device: self.__probe_connection(device, timeout), devices))
+        ranked = sorted(
+            ((device, latency) for device, latency in zip(devices, latencies) if latency is not None), key=lambda x: x[1]
+        )
+        for device, latency in ranked:
+            logging_info(_("MAVLink heartbeat received on %s after %.3f seconds"), device, latency)
+        return ranked
+
+    def __probe_connection(self, device: str, timeout: float) -> Optional[float]:
+        """Returns the time it took to receive a heartbeat on device, or None if it did not answer"""
+        start_time = time_time()
+        master = None
+        try:
+            master = self.__mavlink_connection(device=device, timeout=timeout, retries=0)
+            if master.wait_heartbeat(timeout=timeout) is None:
+                return None
+            return time_time() - start_time
+        except OSError as e:  # also covers SerialException, ConnectionError and PermissionError
+            logging_debug(_("Probing %s failed: %s"), device, e)
+            return None
+        finally:
+            if master is not None:
+                master.close()
+
     def __request_banner(self) -> None:
         """Request banner information from the flight controller"""
         # https://mavlink.io/en/messages/ardupilotmega.html#MAV_CMD_DO_SEND_BANNER
@@ -189,21 +252,47 @@ class FlightController:
                 0,
             )
 
-    def __receive_banner_text(self) -> list[str]:
-        """Starts listening for STATUS_TEXT MAVLink messages."""
+    @staticmethod
+    def __banner_is_complete(banner_msgs: list[str]) -> bool:
+        """The FC product banner line is the one after the ChibiOS one, once both arrived the banner is complete"""
+        for i, msg in enumerate(banner_msgs):
+            if "ChibiOS:" in msg:
+                return i + 1 < len(banner_msgs)
+        return False
+
+    def __receive_banner_text_and_autopilot_version(self, timeout: int) -> tuple[list[str], Any]:
+        """
+        Collects the banner STATUSTEXT messages and the AUTOPILOT_VERSION message in a single message pump.
+
+        Returns as soon as the ChibiOS and the FC product banner lines and the AUTOPILOT_VERSION message arrived.
+        Boards that do not send a ChibiOS banner line stop collecting banner text after BANNER_TIMEOUT seconds.
+        """
         start_time = time_time()
         banner_msgs: list[str] = []
+        autopilot_version = None
         while self.master:
-            msg = self.master.recv_match(type="STATUSTEXT", blocking=False)
-            if msg:
-                if banner_msgs:
-                    banner_msgs.append(msg.text)
-                else:
-                    banner_msgs = [msg.text]
-            time_sleep(0.1)  # Sleep briefly to reduce CPU usage
-            if time_time() - start_time > 1:  # Check if 1 seconds have passed since the start of the loop
-                break  # Exit the loop if 1 seconds have elapsed
-        return banner_msgs
+            elapsed = time_time() - start_time
+            banner_done = elapsed > BANNER_TIMEOUT or FlightController.__banner_is_complete(banner_msgs)
+            if (autopilot_version is not None and banner_done) or elapsed > timeout:
+                break
+            msg = self.master.recv_match(type=["STATUSTEXT", "AUTOPILOT_VERSION"], blocking=True, timeout=0.1)
+            if msg is None:
+                continue
+            if msg.get_type() == "AUTOPILOT_VERSION":
+                autopilot_version = msg
+            elif not banner_done:
+                banner_msgs.append(msg.text)
+        return banner_msgs, autopilot_version
+
+    def __mavlink_connection(self, **kwargs) -> Any:  # noqa: ANN401
+        if self.__mavlink_connection_factory is not None:
+            return self.__mavlink_connection_factory(**kwargs)
+        return mavutil.mavlink_connection(**kwargs)
+
+    def __discard_stale_messages(self, msg_types: tuple[str, ...]) -> None:
+        """Replies left over from earlier exchanges must not be mistaken for replies to a new request"""
+        if isinstance(self.master, MavlinkDispatcher):
+            self.master.discard(msg_types)
 
     def __request_message(self, message_id: int) -> None:
         if self.master is not None:
@@ -247,7 +336,7 @@ class FlightController:
         logging_info(_("Will connect to %s"), self.comport.device)
         try:
             # Create the connection
-            self.master = mavutil.mavlink_connection(
+            self.master = self.__mavlink_connection(
                 device=self.comport.device, timeout=timeout, retries=retries, progress_callback=progress_callback
             )
             logging_debug(_("Waiting for MAVLink heartbeat"))
@@ -273,12 +362,17 @@ class FlightController:
             msg = _("Vehicle type: {self.info.mav_type} running {self.info.vehicle_type} firmware")
             logging_info(msg.format(**locals()))
 
+            # Request both and collect them together, instead of waiting for one after the other
             self.__request_banner()
-            banner_msgs = self.__receive_banner_text()
-
             self.__request_message(mavutil.mavlink.MAVLINK_MSG_ID_AUTOPILOT_VERSION)
-            m = self.master.recv_match(type="AUTOPILOT_VERSION", blocking=True, timeout=timeout)
-            return self.__process_autopilot_version(m, banner_msgs)
+            banner_msgs, m = self.__receive_banner_text_and_autopilot_version(timeout)
+            error_msg = self.__process_autopilot_version(m, banner_msgs)
+            if not error_msg:
+                # From now on a background thread reads the link and dispatches the messages by type,
+                # so that parameter, MAVFTP and status text consumers do not discard each other's messages
+                self.master = MavlinkDispatcher(self.master)
+                self.master.start()
+            return error_msg
         except (ConnectionError, SerialException, PermissionError, ConnectionRefusedError) as e:
             if log_errors:
                 logging_warning(_("Connection failed: %s"), e)
@@ -325,10 +419,19 @@ class FlightController:
             self.info.product = fc_product  # force the one from the banner because it is more reliable
         return ""
 
-    def download_params(self, progress_callback=None) -> tuple[dict[str, float], dict[str, "Par"]]:
+    def download_params(
+        self,
+        progress_callback=None,
+        complete_param_filename: str = "complete.param",
+        default_param_filename: str = "00_default.param",
+    ) -> tuple[dict[str, float], dict[str, "Par"]]:
         """
         Requests all flight controller parameters from a MAVLink connection.
 
+        Args:
+            complete_param_filename (str, optional): File to store the MAVFTP downloaded parameter values in.
+            default_param_filename (str, optional): File to store the MAVFTP downloaded parameter default values in.
+
         Returns:
             Dict[str, float]: A dictionary of flight controller parameters.
             Dict[str, Par]: A dictionary of flight controller default parameters.
@@ -348,7 +451,7 @@ class FlightController:
         if self.info.is_mavftp_supported:
             logging_info(_("MAVFTP is supported by the %s flight controller"), comport_device)
 
-            return self.download_params_via_mavftp(progress_callback)
+            return self.download_params_via_mavftp(progress_callback, complete_param_filename, default_param_filename)
 
         logging_info(_("MAVFTP is not supported by the %s flight controller, fallback to MAVLink"), comport_device)
         return self.__download_params_via_mavlink(progress_callback), {}
@@ -364,6 +467,7 @@ class FlightController:
         if self.master is None:
             return parameters
 
+        self.__discard_stale_messages(("PARAM_VALUE",))
         self.master.mav.param_request_list_send(self.master.target_system, self.master.target_component)
 
         # Loop to receive all parameters
@@ -377,30 +481,32 @@ class FlightController:
                 param_value = message["param_value"]
                 parameters[param_id] = param_value
                 logging_debug(_("Received parameter: %s = %s"), param_id, param_value)
-                # Call the progress callback with the current progress
-                if progress_callback:
-                    progress_callback(len(parameters), m.param_count)
-                if m.param_count == len(parameters):
-                    logging_debug(
-                        _("Fetched %d parameter values from the %s flight controller"), m.param_count, comport_device
-                    )
-                    break
             except Exception as error:  # pylint: disable=broad-except
                 logging_error(_("Error: %s"), error)
                 break
+            # Call the progress callback with the current progress, exceptions it raises to cancel the download propagate
+            if progress_callback:
+                progress_callback(len(parameters), m.param_count)
+            if m.param_count == len(parameters):
+                logging_debug(_("Fetched %d parameter values from the %s flight controller"), m.param_count, comport_device)
+                break
         return parameters
 
-    def download_params_via_mavftp(self, progress_callback=None) -> tuple[dict[str, float], dict[str, "Par"]]:
+    def download_params_via_mavftp(
+        self,
+        progress_callback=None,
+        complete_param_filename: str = "complete.param",
+        default_param_filename: str = "00_default.param",
+    ) -> tuple[dict[str, float], dict[str, "Par"]]:
         if self.master is None:
             return {}, {}
+        self.__discard_stale_messages(("FILE_TRANSFER_PROTOCOL",))
         mavftp = MAVFTP(self.master, target_system=self.master.target_system, target_component=self.master.target_component)
 
         def get_params_progress_callback(completion: float) -> None:
             if progress_callback is not None and completion is not None:
                 progress_callback(int(completion * 100), 100)
 
-        complete_param_filename = "complete.param"
-        default_param_filename = "00_default.param"
         mavftp.cmd_getparams([complete_param_filename, default_param_filename], progress_callback=get_params_progress_callback)
         ret = mavftp.process_ftp_reply("getparams", timeout=10)
         pdict = {}
@@ -428,6 +534,60 @@ class FlightController:
             return None
         return self.master.param_set_send(param_name, param_value)
 
+    def upload_params_pipelined(
+        self, params: dict[str, float], timeout: float = 5, retries: int = 2, max_in_flight: int = 20
+    ) -> list[str]:
+        """
+        Upload parameters to the flight controller without waiting for each one to be confirmed before sending the next.
+
+        Up to max_in_flight PARAM_SET messages are outstanding at any time, and each PARAM_VALUE echo
+        frees a slot for the next parameter. When the flight controller stops answering for timeout seconds,
+        the unconfirmed parameters are re-sent, up to retries times each.
+        Confirmed values are stored in fc_parameters.
+
+        Args:
+            params (dict[str, float]): The parameter names and values to upload.
+            timeout (float, optional): Time without any confirmation before re-sending. Defaults to 5 seconds.
+            retries (int, optional): How often an unconfirmed parameter is re-sent. Defaults to 2.
+            max_in_flight (int, optional): Maximum number of unconfirmed parameters. Defaults to 20.
+
+        Returns:
+            list[str]: The names of the parameters whose upload could not be confirmed.
+        """
+        if self.master is None:
+            return list(params)
+        self.__discard_stale_messages(("PARAM_VALUE",))
+        to_send = deque(params.items())
+        in_flight: dict[str, float] = {}
+        attempts: dict[str, int] = {}
+        failed: list[str] = []
+        last_progress = time_time()
+        while to_send or in_flight:
+            while to_send and len(in_flight) < max_in_flight:
+                param_name, param_value = to_send.popleft()
+                self.master.param_set_send(param_name, param_value)
+                in_flight[param_name] = param_value
+                attempts[param_name] = attempts.get(param_name, 0) + 1
+            m = self.master.recv_match(type="PARAM_VALUE", blocking=True, timeout=0.1)
+            if (
+                m is not None
+                and m.param_id in in_flight
+                and isclose(m.param_value, in_flight[m.param_id], rel_tol=1e-6, abs_tol=1e-6)
+            ):
+                self.fc_parameters[m.param_id] = m.param_value
+                del in_flight[m.param_id]
+                last_progress = time_time()
+            elif time_time() - last_progress > timeout:
+                for param_name, param_value in in_flight.items():
+                    if attempts[param_name] > retries:
+                        logging_error(_("Parameter %s upload to the flight controller was not confirmed"), param_name)
+                        failed.append(param_name)
+                    else:
+                        to_send.append((param_name, param_value))
+                in_flight = {}
+                last_progress = time_time()
+        return failed
+
     def reset_and_reconnect(
         self, reset_progress_callback=None, connection_progress_callback=None, extra_sleep_time: Optional[int] = None
     ) -> str:
@@ -538,6 +698,7 @@ class FlightController:
         """Upload a file to the flight controller."""
         if self.master is None:
             return False
+        self.__discard_stale_messages(("FILE_TRANSFER_PROTOCOL",))
         mavftp = MAVFTP(self.master, target_system=self.master.target_system, target_component=self.master.target_component)
 
         def put_progress_callback(completion: float) -> None:
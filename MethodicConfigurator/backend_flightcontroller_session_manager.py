@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+
+"""
+Manages simultaneous connections to several flight controllers.
+
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from logging import error as logging_error
+from logging import info as logging_info
+from os import path as os_path
+from re import sub as re_sub
+from time import time as time_time
+from typing import Callable, Optional
+
+from MethodicConfigurator import _
+from MethodicConfigurator.annotate_params import Par
+from MethodicConfigurator.backend_flightcontroller import FlightController
+
+
+class VehicleSessionReport:  # pylint: disable=too-few-public-methods
+    """
+    The outcome of an operation performed on a single vehicle of a FlightControllerSessionManager.
+
+    Attributes:
+        device (str): The connection string of the vehicle.
+        system_id (int): The MAVLink system ID of the vehicle.
+        error_msg (str): Empty on success, otherwise a description of the problem.
+        param_count (int): Number of parameters downloaded or uploaded.
+        failed_params (list[str]): Names of the parameters that could not be uploaded.
+        elapsed (float): Duration of the operation in seconds.
+    """
+
+    def __init__(self, device: str, system_id: int) -> None:
+        self.device = device
+        self.system_id = system_id
+        self.error_msg = ""
+        self.param_count = 0
+        self.failed_params: list[str] = []
+        self.elapsed = 0.0
+
+    @property
+    def success(self) -> bool:
+        return not self.error_msg and not self.failed_params
+
+
+class FlightControllerSessionManager:
+    """
+    Owns several FlightController connections and performs operations on all of them in parallel.
+
+    Each connection is keyed by its (device, MAVLink system ID) pair, so that several vehicles
+    sharing a telemetry link can also be told apart.
+    """
+
+    def __init__(self, reboot_time: int, work_dir: str = ".") -> None:
+        self.reboot_time = reboot_time
+        self.work_dir = work_dir
+        self.sessions: dict[tuple[str, int], FlightController] = {}
+
+    def __connect_one(self, device: str) -> tuple[str, Optional[FlightController], str]:
+        flight_controller = FlightController(self.reboot_time)
+        error_msg = flight_controller.connect(device)
+        if error_msg:
+            flight_controller.disconnect()
+            return device, None, error_msg
+        return device, flight_controller, ""
+
+    def connect(self, devices: list[str]) -> dict[str, str]:
+        """
+        Connects to all devices concurrently.
+
+        Args:
+            devices (list[str]): The connection strings to connect to.
+
+        Returns:
+            dict[str, str]: device -> error message, empty for successful connections.
+        """
+        errors: dict[str, str] = {}
+        if not devices:
+            return errors
+        with ThreadPoolExecutor(max_workers=len(devices)) as executor:
+            for device, flight_controller, error_msg in executor.map(self.__connect_one, devices):
+                errors[device] = error_msg
+                if flight_controller is None:
+                    logging_error(_("Could not connect to %s: %s"), device, error_msg)
+                    continue
+                key = (device, int(flight_controller.info.system_id))
+                if key in self.sessions:
+                    self.sessions[key].disconnect()
+                self.sessions[key] = flight_controller
+                logging_info(_("Connected to vehicle with system ID %s on %s"), key[1], device)
+        return errors
+
+    def disconnect(self) -> None:
+        """Closes all connections."""
+        for flight_controller in self.sessions.values():
+            flight_controller.disconnect()
+        self.sessions = {}
+
+    def __run_on_all(
+        self, operation: Callable[[tuple[str, int], FlightController, VehicleSessionReport], None]
+    ) -> dict[tuple[str, int], VehicleSessionReport]:
+        def run(item: tuple[tuple[str, int], FlightController]) -> tuple[tuple[str, int], VehicleSessionReport]:
+            key, flight_controller = item
+            report = VehicleSessionReport(*key)
+            start_time = time_time()
+            try:
+                operation(key, flight_controller, report)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                report.error_msg = str(e)
+            report.elapsed = time_time() - start_time
+            return key, report
+
+        if not self.sessions:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(self.sessions)) as executor:
+            return dict(executor.map(run, list(self.sessions.items())))
+
+    def download_params(
+        self, progress_callback: Optional[Callable[[tuple[str, int], int, int], None]] = None
+    ) -> dict[tuple[str, int], VehicleSessionReport]:
+        """
+        Downloads the parameters of all vehicles concurrently into the fc_parameters of each FlightController.
+
+        Args:
+            progress_callback (callable, optional): Called with the session key, the current and the maximum progress.
+
+        Returns:
+            dict[tuple[str, int], VehicleSessionReport]: One report per vehicle.
+        """
+
+        def download(key: tuple[str, int], flight_controller: FlightController, report: VehicleSessionReport) -> None:
+            def vehicle_progress_callback(current: int, maximum: int) -> None:
+                if progress_callback is not None:
+                    progress_callback(key, current, maximum)
+
+            # MAVFTP stores the downloaded files on disk, so each vehicle needs its own file names
+            suffix = f"{re_sub(r'[^A-Za-z0-9]+', '_', key[0]).strip('_')}_{key[1]}"
+            flight_controller.fc_parameters, _defaults = flight_controller.download_params(
+                vehicle_progress_callback,
+                os_path.join(self.work_dir, f"complete_{suffix}.param"),
+                os_path.join(self.work_dir, f"00_default_{suffix}.param"),
+            )
+            report.param_count = len(flight_controller.fc_parameters)
+            if not report.param_count:
+                report.error_msg = _("No parameters were downloaded")
+
+        return self.__run_on_all(download)
+
+    def upload_param_file(self, param_file: str) -> dict[tuple[str, int], VehicleSessionReport]:
+        """
+        Uploads the parameters of an intermediate parameter file to all vehicles in parallel.
+
+        Args:
+            param_file (str): The .param file to upload.
+
+        Returns:
+            dict[tuple[str, int], VehicleSessionReport]: One report per vehicle.
+        """
+        params = {name: par.value for name, par in Par.load_param_file_into_dict(param_file).items()}
+
+        def upload(_key: tuple[str, int], flight_controller: FlightController, report: VehicleSessionReport) -> None:
+            report.failed_params = flight_controller.upload_params_pipelined(params)
+            report.param_count = len(params) - len(report.failed_params)
+
+        return self.__run_on_all(upload)
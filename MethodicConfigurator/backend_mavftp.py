@@ -1139,7 +1139,7 @@ class MAVFTP:  # pylint: disable=too-many-instance-attributes
         assert recv_timeout < self.ftp_settings.retry_time, "recv_timeout must be < settings.retry_time"  # noqa: S101
 
         while True:  # an FTP operation can have multiple responses
-            m = self.master.recv_match(type=["FILE_TRANSFER_PROTOCOL"], timeout=recv_timeout)
+            m = self.master.recv_match(type=["FILE_TRANSFER_PROTOCOL"], blocking=True, timeout=recv_timeout)
             if m is not None:
                 if operation_name == "TerminateSession":
                     # self.silently_discard_terminate_session_reply()
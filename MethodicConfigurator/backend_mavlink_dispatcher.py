@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+
+"""
+Reads a MAVLink connection in a background thread and dispatches the messages into per-type queues.
+
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+from collections import deque
+from logging import debug as logging_debug
+from logging import warning as logging_warning
+from threading import Condition, Event, Thread
+from time import time as time_time
+from typing import Any, Optional, Union
+
+from MethodicConfigurator import _
+
+DISPATCHED_MESSAGE_TYPES = ("PARAM_VALUE", "FILE_TRANSFER_PROTOCOL", "STATUSTEXT", "HEARTBEAT", "COMMAND_ACK")
+
+# Oldest messages get dropped once a queue holds this many unconsumed messages
+MAX_QUEUE_LENGTH = 5000
+
+# Methods of the wrapped connection that read the link, they would race with the reader thread
+RAW_READ_METHODS = ("recv", "select")
+
+
+class MavlinkDispatcher:
+    """
+    Wraps a pymavlink connection and reads it continuously in a dedicated thread.
+
+    Each received message whose type has been subscribed is appended to the queue of that type.
+    recv_match() has the same signature as the pymavlink one, but consumes from these queues,
+    so that several consumers (parameter download, MAVFTP, status text) can wait for
+    different message types at the same time without discarding each other's messages.
+    wait_heartbeat() and recv_msg() also read from the queues. All other attributes,
+    except the ones that read the link, are forwarded to the wrapped connection, so the
+    dispatcher can be used as a drop-in replacement for it.
+
+    Messages nobody consumed stay queued, so a consumer starting a request/response exchange
+    should discard() the stale ones of the reply types first.
+    """
+
+    def __init__(self, master, message_types: tuple[str, ...] = DISPATCHED_MESSAGE_TYPES) -> None:
+        self.__master = master
+        self.__queues: dict[str, deque[tuple[int, Any]]] = {
+            msg_type: deque(maxlen=MAX_QUEUE_LENGTH) for msg_type in message_types
+        }
+        self.__sequence_number = 0
+        self.__condition = Condition()
+        self.__stop_event = Event()
+        self.__thread = Thread(target=self.__read_loop, name="MAVLink reader", daemon=True)
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        if name in RAW_READ_METHODS:
+            msg = _("{name} would read the MAVLink connection concurrently with the reader thread")
+            raise AttributeError(msg.format(**locals()))
+        return getattr(self.__master, name)
+
+    @property
+    def connection(self) -> Any:  # noqa: ANN401
+        """The wrapped pymavlink connection"""
+        return self.__master
+
+    def start(self) -> None:
+        self.__thread.start()
+
+    def stop(self) -> None:
+        self.__stop_event.set()
+        if self.__thread.is_alive():
+            self.__thread.join()
+        with self.__condition:
+            self.__condition.notify_all()
+
+    def close(self) -> None:
+        self.stop()
+        self.__master.close()
+
+    def subscribe(self, msg_type: str) -> None:
+        """Start queueing messages of this type. Messages received before subscribing are discarded."""
+        with self.__condition:
+            if msg_type in self.__queues:
+                self.__queues[msg_type].clear()
+            else:
+                self.__queues[msg_type] = deque(maxlen=MAX_QUEUE_LENGTH)
+
+    def discard(self, msg_types: tuple[str, ...]) -> None:
+        """Discard the queued messages of these types, so that only replies to a new request get consumed"""
+        with self.__condition:
+            for msg_type in msg_types:
+                if msg_type in self.__queues:
+                    self.__queues[msg_type].clear()
+
+    def __read_loop(self) -> None:
+        while not self.__stop_event.is_set():
+            try:
+                m = self.__master.recv_match(blocking=True, timeout=0.1)
+            except (OSError, ValueError) as e:
+                if not self.__stop_event.is_set():
+                    logging_warning(_("MAVLink reader thread stopped: %s"), e)
+                break
+            if m is None:
+                continue
+            with self.__condition:
+                queue = self.__queues.get(m.get_type())
+                if queue is None:
+                    continue
+                self.__sequence_number += 1
+                queue.append((self.__sequence_number, m))
+                self.__condition.notify_all()
+        logging_debug(_("MAVLink reader thread finished"))
+
+    def __pop_oldest(self, msg_types: list[str]) -> Optional[Any]:  # noqa: ANN401
+        oldest_queue: Optional[deque[tuple[int, Any]]] = None
+        oldest_sequence_number = 0
+        for msg_type in msg_types:
+            queue = self.__queues[msg_type]
+            if queue and (oldest_queue is None or queue[0][0] < oldest_sequence_number):
+                oldest_queue = queue
+                oldest_sequence_number = queue[0][0]
+        return None if oldest_queue is None else oldest_queue.popleft()[1]
+
+    def recv_match(  # pylint: disable=redefined-builtin
+        self,
+        type: Union[str, list[str], None] = None,
+        blocking: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Optional[Any]:  # noqa: ANN401
+        """
+        Return the oldest queued message of one of the requested types, like pymavlink's recv_match().
+
+        Args:
+            type (str or list[str], optional): The message type(s) to return. Defaults to all subscribed types.
+            blocking (bool, optional): Wait for a message if none is queued. Defaults to False.
+            timeout (float, optional): Maximum time to wait in seconds. Defaults to waiting forever.
+        """
+        with self.__condition:
+            if type is None:
+                msg_types = list(self.__queues)
+            else:
+                msg_types = [type] if isinstance(type, str) else list(type)
+                for msg_type in msg_types:
+                    if msg_type not in self.__queues:
+                        self.__queues[msg_type] = deque(maxlen=MAX_QUEUE_LENGTH)
+            deadline = None if timeout is None else time_time() + timeout
+            while True:
+                m = self.__pop_oldest(msg_types)
+                if m is not None or not blocking or self.__stop_event.is_set():
+                    return m
+                remaining = None if deadline is None else deadline - time_time()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self.__condition.wait(remaining)
+
+    def recv_msg(self) -> Optional[Any]:  # noqa: ANN401
+        """Return the oldest queued message of any subscribed type, without waiting"""
+        return self.recv_match()
+
+    def wait_heartbeat(self, blocking: bool = True, timeout: Optional[float] = None) -> Optional[Any]:  # noqa: ANN401
+        """Wait for a HEARTBEAT message, like pymavlink's wait_heartbeat()"""
+        return self.recv_match(type="HEARTBEAT", blocking=blocking, timeout=timeout)
@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+
+"""
+In-process simulated ArduPilot autopilot, to exercise and benchmark the MAVLink communication without hardware.
+
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import struct
+from argparse import ArgumentParser
+from collections import deque
+from logging import basicConfig as logging_basicConfig
+from logging import getLevelName as logging_getLevelName
+from logging import info as logging_info
+from os import path as os_path
+from random import Random
+from tempfile import TemporaryDirectory
+from threading import Condition
+from time import time as time_time
+from typing import Optional
+
+from pymavlink import mavutil
+
+from MethodicConfigurator import _
+from MethodicConfigurator.backend_flightcontroller import FlightController
+from MethodicConfigurator.backend_mavftp import (
+    ERR_EndOfFile,
+    ERR_FileNotFound,
+    ERR_InvalidSession,
+    ERR_UnknownCommand,
+    HDR_Len,
+    MAX_Payload,
+    OP_Ack,
+    OP_BurstReadFile,
+    OP_Nack,
+    OP_OpenFileRO,
+    OP_ReadFile,
+    OP_ResetSessions,
+    OP_TerminateSession,
+)
+
+PARAM_PCK_MAGIC = 0x671B
+PARAM_PCK_MAGIC_WITH_DEFAULTS = 0x671C
+PARAM_PCK_TYPE_FLOAT = 4
+
+# The simulated board, its USB IDs map to this product name in BackendFlightcontrollerInfo
+BOARD_NAME = "CubeOrange"
+BOARD_VENDOR_ID = 0x2DAE
+BOARD_PRODUCT_ID = 0x1016
+FLIGHT_CUSTOM_VERSION = "a7f0b4a5"
+OS_CUSTOM_VERSION = "6a85082c"
+
+
+def float32(value: float) -> float:
+    """Round a value to the precision it has when transported as a MAVLink float"""
+    return float(struct.unpack("<f", struct.pack("<f", value))[0])
+
+
+def encode_param_pck(params: dict[str, float], defaults: Optional[dict[str, float]] = None) -> bytes:
+    """
+    Encode parameters in the ArduPilot @PARAM/param.pck format, the inverse of MAVFTP.ftp_param_decode().
+
+    All parameters are encoded as 32-bit floats. If defaults are given, the parameters whose value
+    differs from their default carry that default as well.
+    """
+    data = bytearray(
+        struct.pack("<HHH", PARAM_PCK_MAGIC if defaults is None else PARAM_PCK_MAGIC_WITH_DEFAULTS, len(params), len(params))
+    )
+    last_name = b""
+    for name, value in sorted(params.items()):
+        encoded_name = name.encode("ascii")
+        common_len = 0
+        while (
+            common_len < min(len(last_name), len(encoded_name) - 1, 15) and last_name[common_len] == encoded_name[common_len]
+        ):
+            common_len += 1
+        suffix = encoded_name[common_len:]
+        default = None if defaults is None else defaults.get(name, value)
+        has_default = default is not None and float32(default) != float32(value)
+        data += struct.pack("<BB", PARAM_PCK_TYPE_FLOAT | (0x10 if has_default else 0), ((len(suffix) - 1) << 4) | common_len)
+        data += suffix + struct.pack("<f", value)
+        if has_default:
+            data += struct.pack("<f", default)
+        last_name = encoded_name
+    return bytes(data)
+
+
+class SimulatedAutopilot:  # pylint: disable=too-many-instance-attributes
+    """
+    Answers the MAVLink requests the configurator sends to an ArduPilot flight controller.
+
+    Serves heartbeats, the banner, AUTOPILOT_VERSION, the PARAM_* protocol and the MAVFTP
+    read operations needed to download @PARAM/param.pck, with or without defaults.
+    """
+
+    def __init__(
+        self,
+        params: dict[str, float],
+        defaults: Optional[dict[str, float]] = None,
+        system_id: int = 1,
+        component_id: int = 1,
+    ) -> None:
+        self.params = {name: float32(value) for name, value in params.items()}
+        self.defaults = dict(self.params) if defaults is None else {name: float32(value) for name, value in defaults.items()}
+        self.param_names = sorted(self.params)
+        self.param_indexes = {name: i for i, name in enumerate(self.param_names)}
+        self.system_id = system_id
+        self.component_id = component_id
+        self.mav = mavutil.mavlink.MAVLink(None, srcSystem=system_id, srcComponent=component_id)
+        self.mav.robust_parsing = True
+        self.ftp_session = 0
+        self.ftp_file: Optional[bytes] = None
+        self.received_messages = 0
+
+    def heartbeat(self) -> bytes:
+        packet: bytes = self.mav.heartbeat_encode(
+            mavutil.mavlink.MAV_TYPE_QUADROTOR, mavutil.mavlink.MAV_AUTOPILOT_ARDUPILOTMEGA, 0, 0, 0
+        ).pack(self.mav)
+        return packet
+
+    def handle_bytes(self, buf: bytes) -> list[bytes]:
+        """Parse the bytes sent to the autopilot and return the packed reply messages"""
+        replies: list[bytes] = []
+        for m in self.mav.parse_buffer(buf) or []:
+            self.received_messages += 1
+            if getattr(m, "target_system", self.system_id) not in {0, self.system_id}:
+                continue
+            handler = getattr(self, "_handle_" + m.get_type().lower(), None)
+            if handler is not None:
+                replies.extend(reply.pack(self.mav) for reply in handler(m))
+        return replies
+
+    def __param_value(self, name: str) -> mavutil.mavlink.MAVLink_message:
+        return self.mav.param_value_encode(
+            name.encode("ascii"),
+            self.params[name],
+            mavutil.mavlink.MAV_PARAM_TYPE_REAL32,
+            len(self.param_names),
+            self.param_indexes[name],
+        )
+
+    def _handle_param_request_list(self, _m) -> list[mavutil.mavlink.MAVLink_message]:
+        return [self.__param_value(name) for name in self.param_names]
+
+    def _handle_param_request_read(self, m) -> list[mavutil.mavlink.MAVLink_message]:
+        name = m.param_id
+        if m.param_index >= 0:
+            name = self.param_names[m.param_index] if m.param_index < len(self.param_names) else ""
+        return [self.__param_value(name)] if name in self.params else []
+
+    def _handle_param_set(self, m) -> list[mavutil.mavlink.MAVLink_message]:
+        if m.param_id not in self.params:
+            return []
+        self.params[m.param_id] = float32(m.param_value)
+        return [self.__param_value(m.param_id)]
+
+    def _handle_command_long(self, m) -> list[mavutil.mavlink.MAVLink_message]:
+        replies: list[mavutil.mavlink.MAVLink_message] = []
+        result = mavutil.mavlink.MAV_RESULT_ACCEPTED
+        if m.command == mavutil.mavlink.MAV_CMD_DO_SEND_BANNER:
+            # the same firmware, OS and board as in AUTOPILOT_VERSION, like a real flight controller sends
+            banner = (
+                f"ArduCopter V4.5.7 ({FLIGHT_CUSTOM_VERSION})",
+                f"ChibiOS: {OS_CUSTOM_VERSION}",
+                f"{BOARD_NAME} 00360042 3132510C 31383938",
+            )
+            replies.extend(self.mav.statustext_encode(mavutil.mavlink.MAV_SEVERITY_INFO, t.encode("ascii")) for t in banner)
+        elif m.command == mavutil.mavlink.MAV_CMD_REQUEST_MESSAGE:
+            if int(m.param1) == mavutil.mavlink.MAVLINK_MSG_ID_AUTOPILOT_VERSION:
+                replies.append(self.__autopilot_version())
+            else:
+                result = mavutil.mavlink.MAV_RESULT_UNSUPPORTED
+        elif m.command != mavutil.mavlink.MAV_CMD_PREFLIGHT_REBOOT_SHUTDOWN:
+            result = mavutil.mavlink.MAV_RESULT_UNSUPPORTED
+        replies.append(self.mav.command_ack_encode(m.command, result))
+        return replies
+
+    def __autopilot_version(self) -> mavutil.mavlink.MAVLink_message:
+        return self.mav.autopilot_version_encode(
+            capabilities=mavutil.mavlink.MAV_PROTOCOL_CAPABILITY_PARAM_FLOAT | mavutil.mavlink.MAV_PROTOCOL_CAPABILITY_FTP,
+            flight_sw_version=(4 << 24) | (5 << 16) | (7 << 8) | 255,
+            middleware_sw_version=0,
+            os_sw_version=0,
+            board_version=0,
+            flight_custom_version=[ord(c) for c in FLIGHT_CUSTOM_VERSION],
+            middleware_custom_version=[0] * 8,
+            os_custom_version=[ord(c) for c in OS_CUSTOM_VERSION],
+            vendor_id=BOARD_VENDOR_ID,
+            product_id=BOARD_PRODUCT_ID,
+            uid=0,
+        )
+
+    def __ftp_reply(  # pylint: disable=too-many-arguments
+        self, m, req_opcode: int, *, opcode: int = OP_Ack, payload: bytes = b"", offset: int = 0, burst_complete: int = 0
+    ) -> mavutil.mavlink.MAVLink_message:
+        seq, session = struct.unpack("<HB", bytes(m.payload[0:3]))
+        header = struct.pack(
+            "<HBBBBBBI", (seq + 1) % 65536, session, opcode, len(payload), req_opcode, burst_complete, 0, offset
+        )
+        return self.mav.file_transfer_protocol_encode(
+            0, m.get_srcSystem(), m.get_srcComponent(), list((header + payload).ljust(HDR_Len + MAX_Payload, b"\0"))
+        )
+
+    def __ftp_nack(self, m, req_opcode: int, error_code: int, offset: int = 0) -> mavutil.mavlink.MAVLink_message:
+        return self.__ftp_reply(m, req_opcode, opcode=OP_Nack, payload=bytes([error_code]), offset=offset)
+
+    def _handle_file_transfer_protocol(self, m) -> list[mavutil.mavlink.MAVLink_message]:  # noqa: PLR0911 pylint: disable=too-many-return-statements, too-many-locals
+        payload = bytes(m.payload)
+        (_seq, session, opcode, size, _req_opcode, _burst_complete, _pad, offset) = struct.unpack(
+            "<HBBBBBBI", payload[0:HDR_Len]
+        )
+        data = payload[HDR_Len : HDR_Len + size]
+        if opcode == OP_ResetSessions:
+            self.ftp_file = None
+            return [self.__ftp_reply(m, opcode)]
+        if opcode == OP_TerminateSession:
+            self.ftp_file = None
+            return [self.__ftp_reply(m, opcode)]
+        if opcode == OP_OpenFileRO:
+            self.ftp_session = session
+            filename = data.decode("ascii")
+            if filename == "@PARAM/param.pck":
+                self.ftp_file = encode_param_pck(self.params)
+            elif filename == "@PARAM/param.pck?withdefaults=1":
+                self.ftp_file = encode_param_pck(self.params, self.defaults)
+            else:
+                return [self.__ftp_nack(m, opcode, ERR_FileNotFound)]
+            return [self.__ftp_reply(m, opcode, payload=struct.pack("<I", len(self.ftp_file)))]
+        if opcode in {OP_BurstReadFile, OP_ReadFile}:
+            if self.ftp_file is None or session != self.ftp_session:
+                return [self.__ftp_nack(m, opcode, ERR_InvalidSession)]
+            if offset >= len(self.ftp_file):
+                return [self.__ftp_nack(m, opcode, ERR_EndOfFile, offset)]
+            if opcode == OP_ReadFile:
+                return [self.__ftp_reply(m, opcode, payload=self.ftp_file[offset : offset + size], offset=offset)]
+            replies = []
+            # a burst sends the remainder of the file, flagging the last packet as burst complete
+            chunk_size = min(max(size, 1), MAX_Payload)
+            for chunk_offset in range(offset, len(self.ftp_file), chunk_size):
+                chunk = self.ftp_file[chunk_offset : chunk_offset + chunk_size]
+                is_last = chunk_offset + chunk_size >= len(self.ftp_file)
+                replies.append(self.__ftp_reply(m, opcode, payload=chunk, offset=chunk_offset, burst_complete=int(is_last)))
+            return replies
+        return [self.__ftp_nack(m, opcode, ERR_UnknownCommand)]
+
+
+class SimulatedLinkDirection:  # pylint: disable=too-few-public-methods
+    """One direction of a serial-like link with a fixed latency and a limited bandwidth"""
+
+    def __init__(self, latency: float, bandwidth: Optional[float]) -> None:
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.free_time = 0.0
+
+    def arrival_time(self, size: int, send_time: float) -> float:
+        """Time at which a message of size bytes, sent at send_time, arrives at the other end"""
+        start_time = max(send_time, self.free_time)
+        self.free_time = start_time + (size / self.bandwidth if self.bandwidth else 0.0)
+        return self.free_time + self.latency
+
+
+class SimulatedMavlinkConnection(mavutil.mavfile):  # pylint: disable=too-many-instance-attributes
+    """
+    A pymavlink connection to a SimulatedAutopilot, usable wherever mavutil.mavlink_connection() results are used.
+
+    Args:
+        autopilot (SimulatedAutopilot): The simulated autopilot at the other end of the link.
+        latency (float, optional): One-way latency in seconds. Defaults to 0.
+        bandwidth (float, optional): Link bandwidth in bytes per second. Defaults to unlimited.
+        loss (float, optional): Probability between 0 and 1 of losing each message, in each direction. Defaults to 0.
+        seed (int, optional): Seed for the packet loss random generator, for reproducible runs.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        autopilot: SimulatedAutopilot,
+        *,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        loss: float = 0.0,
+        seed: Optional[int] = None,
+        source_system: int = 255,
+        source_component: int = 0,
+    ) -> None:
+        self.autopilot = autopilot
+        self.loss = loss
+        self.uplink = SimulatedLinkDirection(latency, bandwidth)
+        self.downlink = SimulatedLinkDirection(latency, bandwidth)
+        self.random = Random(seed)  # noqa: S311
+        self.condition = Condition()
+        self.in_flight: deque[tuple[float, bytes]] = deque()
+        self.rx_buffer = bytearray()
+        self.next_heartbeat_time = time_time()
+        self.closed = False
+        mavutil.mavfile.__init__(
+            self, None, "sim", source_system=source_system, source_component=source_component, input=False
+        )
+
+    def __schedule(self, packets: list[bytes], send_time: float) -> None:
+        for packet in packets:
+            arrival_time = self.downlink.arrival_time(len(packet), send_time)
+            if self.random.random() >= self.loss:
+                self.in_flight.append((arrival_time, packet))
+
+    def __schedule_heartbeats(self, now: float) -> None:
+        while self.next_heartbeat_time <= now:
+            self.__schedule([self.autopilot.heartbeat()], self.next_heartbeat_time)
+            self.next_heartbeat_time += 1.0
+
+    def write(self, buf) -> None:
+        with self.condition:
+            if self.closed:
+                return
+            arrival_time = self.uplink.arrival_time(len(buf), time_time())
+            if self.random.random() < self.loss:
+                return
+            self.__schedule(self.autopilot.handle_bytes(bytes(buf)), arrival_time)
+            self.condition.notify_all()
+
+    def recv(self, n=None) -> bytes:
+        with self.condition:
+            now = time_time()
+            self.__schedule_heartbeats(now)
+            while self.in_flight and self.in_flight[0][0] <= now:
+                self.rx_buffer += self.in_flight.popleft()[1]
+            if n is None:
+                n = len(self.rx_buffer)
+            data = bytes(self.rx_buffer[:n])
+            del self.rx_buffer[:n]
+            return data
+
+    def select(self, timeout) -> bool:
+        deadline = time_time() + timeout
+        with self.condition:
+            while not self.closed:
+                now = time_time()
+                if self.rx_buffer or (self.in_flight and self.in_flight[0][0] <= now):
+                    return True
+                next_event = min(self.next_heartbeat_time, self.in_flight[0][0] if self.in_flight else deadline)
+                if now >= deadline or next_event <= now:
+                    return next_event <= now
+                self.condition.wait(min(deadline, next_event) - now)
+        return False
+
+    def close(self) -> None:
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+
+def argument_parser():
+    """
+    Parses command-line arguments for the script.
+    """
+    parser = ArgumentParser(
+        description=_("Benchmark parameter download and upload against a simulated autopilot over a simulated link.")
+    )
+    parser.add_argument("--params", type=int, default=1200, help=_("Number of simulated parameters. Default is %(default)s"))
+    parser.add_argument(
+        "--latency", type=float, default=0.005, help=_("One-way link latency in seconds. Default is %(default)s")
+    )
+    parser.add_argument(
+        "--bandwidth", type=float, default=11520, help=_("Link bandwidth in bytes per second. Default is %(default)s")
+    )
+    parser.add_argument("--loss", type=float, default=0.0, help=_("Packet loss probability. Default is %(default)s"))
+    parser.add_argument(
+        "--loglevel",
+        type=str,
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        help=_("Logging level (default is %(default)s)."),
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = argument_parser()
+    logging_basicConfig(level=logging_getLevelName(args.loglevel), format="%(asctime)s - %(levelname)s - %(message)s")
+
+    params = {f"SIM_PARAM_{i:04d}": float(i) for i in range(args.params)}
+    autopilot = SimulatedAutopilot(params, {name: 0.0 for name in params})
+
+    def connect(**_kwargs) -> SimulatedMavlinkConnection:
+        return SimulatedMavlinkConnection(autopilot, latency=args.latency, bandwidth=args.bandwidth, loss=args.loss, seed=0)
+
+    flight_controller = FlightController(reboot_time=0, mavlink_connection_factory=connect)
+    start_time = time_time()
+    error_msg = flight_controller.connect("sim")
+    if error_msg:
+        logging_info(_("Connection to the simulated autopilot failed: %s"), error_msg)
+        return
+    logging_info(_("Connected in %.2f seconds"), time_time() - start_time)
+
+    for use_mavftp in (True, False):
+        flight_controller.info.is_mavftp_supported = use_mavftp
+        start_time = time_time()
+        with TemporaryDirectory() as tmpdir:
+            downloaded, _defaults = flight_controller.download_params(
+                None, os_path.join(tmpdir, "complete.param"), os_path.join(tmpdir, "00_default.param")
+            )
+        logging_info(
+            _("Downloaded %u parameters via %s in %.2f seconds"),
+            len(downloaded),
+            "MAVFTP" if use_mavftp else "MAVLink",
+            time_time() - start_time,
+        )
+
+    start_time = time_time()
+    failed = flight_controller.upload_params_pipelined({name: value + 1 for name, value in params.items()})
+    logging_info(_("Uploaded %u parameters in %.2f seconds, %u failed"), len(params), time_time() - start_time, len(failed))
+    flight_controller.disconnect()
+
+
+if __name__ == "__main__":
+    main()
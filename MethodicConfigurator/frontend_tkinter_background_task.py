@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+
+"""
+Runs blocking backend operations on a worker thread while the GUI stays responsive.
+
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import contextlib
+import tkinter as tk
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+# How often the Tk thread checks for progress reports and for the end of the task
+PROGRESS_POLL_INTERVAL_MS = 50
+
+T = TypeVar("T")
+
+
+class TaskCancelledError(Exception):
+    """The task got cancelled by the user"""
+
+
+class BackgroundTask(Generic[T]):  # pylint: disable=too-many-instance-attributes
+    """
+    Runs function(progress_callback) on a worker thread and delivers its progress and result on the Tk thread.
+
+    Tk widgets must only be used from the Tk thread, so the progress reports of the worker thread are stored
+    and handed to the GUI progress_callback by a root.after() poll. Only the latest report is kept, so a fast
+    transfer is never slowed down by repainting a progress bar for each of its steps.
+
+    Cancellation is cooperative: after cancel() the next progress report raises TaskCancelledError
+    inside the worker thread, which unwinds the backend operation. Only offer it for operations that can be
+    interrupted between two progress reports.
+    """
+
+    def __init__(self, root: tk.Misc, function: Callable[[Callable[..., None]], T]) -> None:
+        self.root = root
+        self.function = function
+        self.__cancel_requested = Event()
+        self.__finished = Event()
+        self.__progress_lock = Lock()
+        self.__progress: Optional[tuple[Any, ...]] = None
+        self.__result: Optional[T] = None
+        self.__exception: Optional[BaseException] = None
+
+    def cancel(self) -> None:
+        self.__cancel_requested.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.__cancel_requested.is_set()
+
+    def report_progress(self, *args: Any) -> None:  # noqa: ANN401
+        """The progress callback passed to the function, it runs on the worker thread"""
+        if self.__cancel_requested.is_set():
+            raise TaskCancelledError
+        with self.__progress_lock:
+            self.__progress = args
+
+    def __work(self) -> None:
+        try:
+            self.__result = self.function(self.report_progress)
+        except BaseException as e:  # pylint: disable=broad-exception-caught
+            # re-raised by run(), on the Tk thread
+            self.__exception = e
+        finally:
+            self.__finished.set()
+
+    def run(self, progress_callback: Optional[Callable[..., None]] = None, busy_window: Optional[tk.Misc] = None) -> T:
+        """
+        Starts the task and processes GUI events until it finishes, then returns its result.
+
+        progress_callback gets called on the Tk thread with the arguments of the latest progress report.
+        busy_window, usually the main window, ignores mouse input and shows a busy cursor while the task runs,
+        so that its buttons can not start another operation on the same flight controller.
+        Other toplevel windows, like a progress window with a cancel button, stay usable.
+        Exceptions of the function are re-raised here, and TaskCancelledError if the task got cancelled.
+        """
+        done = tk.BooleanVar(master=self.root, value=False)
+
+        def poll() -> None:
+            finished = self.__finished.is_set()
+            with self.__progress_lock:
+                progress, self.__progress = self.__progress, None
+            if progress is not None and progress_callback is not None:
+                progress_callback(*progress)
+            if finished:
+                done.set(True)
+            else:
+                self.root.after(PROGRESS_POLL_INTERVAL_MS, poll)
+
+        worker = Thread(target=self.__work, name="BackgroundTask", daemon=True)
+        worker.start()
+        if busy_window is not None:
+            # needs Tk 8.6, with older versions the input is not blocked
+            with contextlib.suppress(tk.TclError):
+                self.root.tk.call("tk", "busy", "hold", str(busy_window))
+        self.root.after(PROGRESS_POLL_INTERVAL_MS, poll)
+        self.root.wait_variable(done)
+        worker.join()
+        if busy_window is not None:
+            with contextlib.suppress(tk.TclError):
+                self.root.tk.call("tk", "busy", "forget", str(busy_window))
+        if self.cancelled:
+            raise TaskCancelledError
+        if self.__exception is not None:
+            raise self.__exception
+        return self.__result  # type: ignore[return-value]
@@ -19,7 +19,7 @@ from logging import warning as logging_warning
 from platform import system as platform_system
 from tkinter import BooleanVar, messagebox, ttk
 from tkinter import font as tkFont
-from typing import Optional
+from typing import Callable, ClassVar, Optional
 
 from PIL import Image, ImageTk
 
@@ -52,35 +52,110 @@ def show_no_connection_error(_error_string: str) -> None:
     show_error_message(_("No Connection to the Flight Controller"), error_message.format(**locals()))
 
 
-def show_tooltip(widget, text) -> None:
-    def enter(_event) -> None:
+class TooltipManager:
+    """
+    Displays the tooltips of all widgets of a toplevel window in a single shared Toplevel.
+
+    A widget with a tooltip only gets a bindtag and an entry in the widget to text map of its toplevel window,
+    instead of a hidden Toplevel and <Enter>/<Leave> bindings of its own.
+    That keeps the creation and destruction of widget-heavy windows, like the parameter table, cheap.
+    """
+
+    __managers: ClassVar[dict[tk.Misc, "TooltipManager"]] = {}
+
+    def __init__(self, toplevel: tk.Misc) -> None:
+        self.toplevel = toplevel
+        # One bindtag per toplevel, bindtags are shared by all windows of a Tk interpreter
+        self.bindtag = f"Tooltip{toplevel}"
+        self.__texts: dict[str, str] = {}
+        self.__shown_widget = ""
+        self.__tooltip: Optional[tk.Toplevel] = None
+        self.__tooltip_label: Optional[ttk.Label] = None
+        toplevel.bind_class(self.bindtag, "<Enter>", self.__enter)
+        toplevel.bind_class(self.bindtag, "<Leave>", self.__leave)
+        toplevel.bind_class(self.bindtag, "<Destroy>", self.__forget)
+        toplevel.bind("<Destroy>", self.__toplevel_destroyed, add="+")
+
+    @staticmethod
+    def of(widget: tk.Misc) -> "TooltipManager":
+        """Returns the tooltip manager of the toplevel window of the widget, creates it if needed"""
+        toplevel = widget.winfo_toplevel()
+        manager = TooltipManager.__managers.get(toplevel)
+        if manager is None:
+            manager = TooltipManager(toplevel)
+            TooltipManager.__managers[toplevel] = manager
+        return manager
+
+    def set_text(self, widget: tk.Misc, text: str) -> None:
+        """Sets the tooltip text of the widget, an empty text disables its tooltip"""
+        self.__texts[str(widget)] = text
+        bindtags = widget.bindtags()
+        if self.bindtag not in bindtags:
+            widget.bindtags((*bindtags, self.bindtag))
+        if self.__shown_widget == str(widget):
+            self.__show(widget)
+
+    def __show(self, widget: tk.Misc) -> None:
+        text = self.__texts.get(str(widget), "")
+        if not text:
+            self.__hide()
+            return
+        if self.__tooltip is None or self.__tooltip_label is None:
+            self.__tooltip = tk.Toplevel(self.toplevel)
+            self.__tooltip.wm_overrideredirect(True)
+            self.__tooltip_label = ttk.Label(
+                self.__tooltip, text=text, background="#ffffe0", relief="solid", borderwidth=1, justify=tk.LEFT
+            )
+            self.__tooltip_label.pack()
+        else:
+            self.__tooltip_label.configure(text=text)
         # Calculate the position of the tooltip based on the widget's position
         x = widget.winfo_rootx() + widget.winfo_width() // 2
         y = widget.winfo_rooty() + widget.winfo_height()
-        tooltip.geometry(f"+{x}+{y}")
-        tooltip.deiconify()
+        self.__tooltip.geometry(f"+{x}+{y}")
+        self.__tooltip.deiconify()
+        self.__shown_widget = str(widget)
 
-    def leave(_event) -> None:
-        tooltip.withdraw()
+    def __hide(self) -> None:
+        self.__shown_widget = ""
+        if self.__tooltip is not None:
+            self.__tooltip.withdraw()
 
-    tooltip = tk.Toplevel(widget)
-    tooltip.wm_overrideredirect(True)
-    tooltip_label = ttk.Label(tooltip, text=text, background="#ffffe0", relief="solid", borderwidth=1, justify=tk.LEFT)
-    tooltip_label.pack()
-    tooltip.withdraw()  # Initially hide the tooltip
+    def __enter(self, event: tk.Event) -> None:
+        if isinstance(event.widget, str):
+            return  # a widget that tkinter does not know about
+        self.__show(event.widget)
 
-    # Bind the <Enter> and <Leave> events to show and hide the tooltip
-    widget.bind("<Enter>", enter)
-    widget.bind("<Leave>", leave)
+    def __leave(self, _event: tk.Event) -> None:
+        self.__hide()
 
+    def __forget(self, event: tk.Event) -> None:
+        if str(event.widget) == self.__shown_widget:
+            self.__hide()
+        self.__texts.pop(str(event.widget), None)
 
-def update_combobox_width(combobox) -> None:
+    def __toplevel_destroyed(self, event: tk.Event) -> None:
+        # the <Destroy> binding of the toplevel also fires for each of its child widgets
+        if event.widget is self.toplevel:
+            TooltipManager.__managers.pop(self.toplevel, None)
+
+
+def show_tooltip(widget: tk.Misc, text: str) -> None:
+    """Shows text when the mouse hovers over the widget, calling it again replaces the text"""
+    TooltipManager.of(widget).set_text(widget, text)
+
+
+def combobox_width(values) -> int:
     # Calculate the maximum width needed for the content
-    max_width = max(len(value) for value in combobox["values"])
+    max_width = max((len(value) for value in values), default=0)
     # Set a minimum width for the combobox
     min_width = 4  # Adjust this value as needed
-    # Set the width of the combobox to the maximum width, but not less than the minimum width
-    combobox.config(width=max(min_width, max_width))
+    # The maximum width, but not less than the minimum width
+    return max(min_width, max_width)
+
+
+def update_combobox_width(combobox) -> None:
+    combobox.config(width=combobox_width(combobox["values"]))
 
 
 class AutoResizeCombobox(ttk.Combobox):  # pylint: disable=too-many-ancestors
@@ -217,12 +292,21 @@ class ProgressWindow:
     a task. It includes a progress bar and a label to display the progress message.
     """
 
-    def __init__(self, parent, title: str, message: str = "", width: int = 300, height: int = 80) -> None:  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        parent,
+        title: str,
+        message: str = "",
+        width: int = 300,
+        height: int = 80,
+        *,
+        on_cancel: Optional[Callable[[], None]] = None,
+    ) -> None:
         self.parent = parent
         self.message = message
         self.progress_window = tk.Toplevel(self.parent)
         self.progress_window.title(title)
-        self.progress_window.geometry(f"{width}x{height}")
+        self.progress_window.geometry(f"{width}x{height + 40 if on_cancel else height}")
 
         main_frame = ttk.Frame(self.progress_window)
         main_frame.pack(expand=True, fill=tk.BOTH)
@@ -235,6 +319,11 @@ class ProgressWindow:
         self.progress_label = ttk.Label(main_frame, text=message.format(0, 0))
         self.progress_label.pack(side=tk.TOP, fill=tk.X, expand=False, pady=(10, 10))
 
+        if on_cancel:
+            cancel_button = ttk.Button(main_frame, text=_("Cancel"), command=on_cancel)
+            cancel_button.pack(side=tk.TOP, pady=(0, 10))
+            self.progress_window.protocol("WM_DELETE_WINDOW", on_cancel)
+
         self.progress_window.lift()
 
         # Center the progress window on the parent window
@@ -18,7 +18,7 @@ from logging import error as logging_error
 from logging import getLevelName as logging_getLevelName
 from math import log2
 from tkinter import ttk
-from typing import Any, Union
+from typing import Any, Optional, Union
 
 from MethodicConfigurator import _, __version__
 from MethodicConfigurator.backend_filesystem import LocalFilesystem
@@ -207,6 +207,59 @@ rc_protocols_dict: dict[str, dict[str, str]] = {
 }
 
 
+def combobox_values_table(
+    doc_dict: dict, fc_serial_ports: list[str], fc_can_ports: list[str], fc_i2c_ports: list[str]
+) -> dict[tuple[str, str, str], tuple[str, ...]]:
+    """
+    Returns the allowed values of each component editor combobox, indexed by its path in the JSON data.
+
+    The protocol values come from the apm.pdef.xml metadata in doc_dict,
+    and from the dicts in this file if the metadata is not available.
+    """
+    # Default values for comboboxes in case the apm.pdef.xml metadata is not available
+    fallbacks = {
+        "RC_PROTOCOLS": rc_protocols_dict,
+        "BATT_MONITOR": batt_monitor_connection,
+        "MOT_PWM_TYPE": mot_pwm_type_dict,
+        "GPS_TYPE": gnss_receiver_connection,
+    }
+
+    def get_combobox_values(param_name: str) -> tuple[str, ...]:
+        if param_name in doc_dict:
+            if "values" in doc_dict[param_name] and doc_dict[param_name]["values"]:
+                return tuple(doc_dict[param_name]["values"].values())
+            if "Bitmask" in doc_dict[param_name] and doc_dict[param_name]["Bitmask"]:
+                return tuple(doc_dict[param_name]["Bitmask"].values())
+            logging_error(_("No values found for %s in the metadata"), param_name)
+        if param_name in fallbacks:
+            return tuple(value["protocol"] for value in fallbacks[param_name].values())
+        logging_error(_("No fallback values found for %s"), param_name)
+        return ()
+
+    return {
+        ("Flight Controller", "Firmware", "Type"): tuple(VehicleComponents.supported_vehicles()),
+        ("RC Receiver", "FC Connection", "Type"): ("RCin/SBUS", *fc_serial_ports, *fc_can_ports),
+        ("RC Receiver", "FC Connection", "Protocol"): get_combobox_values("RC_PROTOCOLS"),
+        ("Telemetry", "FC Connection", "Type"): (*fc_serial_ports, *fc_can_ports),
+        ("Telemetry", "FC Connection", "Protocol"): ("MAVLink1", "MAVLink2", "MAVLink High Latency"),
+        ("Battery Monitor", "FC Connection", "Type"): (
+            "None",
+            "Analog",
+            "SPI",
+            "PWM",
+            *fc_i2c_ports,
+            *fc_serial_ports,
+            *fc_can_ports,
+        ),
+        ("Battery Monitor", "FC Connection", "Protocol"): get_combobox_values("BATT_MONITOR"),
+        ("ESC", "FC Connection", "Type"): ("Main Out", "AIO", *fc_serial_ports, *fc_can_ports),
+        ("ESC", "FC Connection", "Protocol"): get_combobox_values("MOT_PWM_TYPE"),
+        ("GNSS Receiver", "FC Connection", "Type"): ("None", *fc_serial_ports, *fc_can_ports),
+        ("GNSS Receiver", "FC Connection", "Protocol"): get_combobox_values("GPS_TYPE"),
+        ("Battery", "Specifications", "Chemistry"): tuple(BatteryCell.chemistries()),
+    }
+
+
 class ComponentEditorWindow(ComponentEditorWindowBase):
     """
     This class validates the user input and handles user interactions
@@ -217,6 +270,8 @@ class ComponentEditorWindow(ComponentEditorWindowBase):
         self.serial_ports = ["SERIAL1", "SERIAL2", "SERIAL3", "SERIAL4", "SERIAL5", "SERIAL6", "SERIAL7", "SERIAL8"]
         self.can_ports = ["CAN1", "CAN2"]
         self.i2c_ports = ["I2C1", "I2C2", "I2C3", "I2C4"]
+        self.__combobox_values: Optional[dict[tuple[str, str, str], tuple[str, ...]]] = None
+        self.__combobox_values_doc_dict: Optional[dict] = None
         ComponentEditorWindowBase.__init__(self, version, local_filesystem)
         # these are just here so that pygettext extracts them, they have no function
         _vehicle_components_strings = _("Flight Controller")
@@ -481,67 +536,18 @@ class ComponentEditorWindow(ComponentEditorWindowBase):
                 protocol_combobox.set(protocols[0] if protocols else "")
             protocol_combobox.update_idletasks()  # re-draw the combobox ASAP
 
-    def add_entry_or_combobox(self, value, entry_frame, path: tuple[str, str, str]) -> Union[ttk.Entry, ttk.Combobox]:
-        # Default values for comboboxes in case the apm.pdef.xml metadata is not available
-        fallbacks = {
-            "RC_PROTOCOLS": [value["protocol"] for value in rc_protocols_dict.values()],
-            "BATT_MONITOR": [value["protocol"] for value in batt_monitor_connection.values()],
-            "MOT_PWM_TYPE": [value["protocol"] for value in mot_pwm_type_dict.values()],
-            "GPS_TYPE": [value["protocol"] for value in gnss_receiver_connection.values()],
-        }
+    def __combobox_values_table(self) -> dict[tuple[str, str, str], tuple[str, ...]]:
+        """The table only depends on the parameter metadata, it gets rebuilt when another doc_dict gets loaded"""
+        doc_dict = self.local_filesystem.doc_dict
+        if self.__combobox_values is None or self.__combobox_values_doc_dict is not doc_dict:
+            self.__combobox_values = combobox_values_table(doc_dict, self.serial_ports, self.can_ports, self.i2c_ports)
+            self.__combobox_values_doc_dict = doc_dict
+        return self.__combobox_values
 
-        def get_combobox_values(param_name: str) -> list:
-            param_metadata = self.local_filesystem.doc_dict
-            if param_name in param_metadata:
-                if "values" in param_metadata[param_name] and param_metadata[param_name]["values"]:
-                    return list(param_metadata[param_name]["values"].values())
-                if "Bitmask" in param_metadata[param_name] and param_metadata[param_name]["Bitmask"]:
-                    return list(param_metadata[param_name]["Bitmask"].values())
-                logging_error(_("No values found for %s in the metadata"), param_name)
-            if param_name in fallbacks:
-                return fallbacks[param_name]
-            logging_error(_("No fallback values found for %s"), param_name)
-            return []
-
-        combobox_config = {
-            ("Flight Controller", "Firmware", "Type"): {
-                "values": VehicleComponents.supported_vehicles(),
-            },
-            ("RC Receiver", "FC Connection", "Type"): {
-                "values": ["RCin/SBUS", *self.serial_ports, *self.can_ports],
-            },
-            ("RC Receiver", "FC Connection", "Protocol"): {
-                "values": get_combobox_values("RC_PROTOCOLS"),
-            },
-            ("Telemetry", "FC Connection", "Type"): {
-                "values": self.serial_ports + self.can_ports,
-            },
-            ("Telemetry", "FC Connection", "Protocol"): {
-                "values": ["MAVLink1", "MAVLink2", "MAVLink High Latency"],
-            },
-            ("Battery Monitor", "FC Connection", "Type"): {
-                "values": ["None", "Analog", "SPI", "PWM", *self.i2c_ports, *self.serial_ports, *self.can_ports],
-            },
-            ("Battery Monitor", "FC Connection", "Protocol"): {
-                "values": get_combobox_values("BATT_MONITOR"),
-            },
-            ("ESC", "FC Connection", "Type"): {
-                "values": ["Main Out", "AIO", *self.serial_ports, *self.can_ports],
-            },
-            ("ESC", "FC Connection", "Protocol"): {"values": get_combobox_values("MOT_PWM_TYPE")},
-            ("GNSS Receiver", "FC Connection", "Type"): {
-                "values": ["None", *self.serial_ports, *self.can_ports],
-            },
-            ("GNSS Receiver", "FC Connection", "Protocol"): {
-                "values": get_combobox_values("GPS_TYPE"),
-            },
-            ("Battery", "Specifications", "Chemistry"): {
-                "values": BatteryCell.chemistries(),
-            },
-        }
-        config = combobox_config.get(path)
-        if config:
-            cb = ttk.Combobox(entry_frame, values=config["values"])
+    def add_entry_or_combobox(self, value, entry_frame, path: tuple[str, str, str]) -> Union[ttk.Entry, ttk.Combobox]:
+        combobox_values = self.__combobox_values_table().get(path)
+        if combobox_values is not None:
+            cb = ttk.Combobox(entry_frame, values=combobox_values)
             cb.bind("<FocusOut>", lambda event, path=path: self.validate_combobox(event, path))  # type: ignore
             cb.bind("<KeyRelease>", lambda event, path=path: self.validate_combobox(event, path))  # type: ignore
 
@@ -691,6 +697,7 @@ class ComponentEditorWindow(ComponentEditorWindowBase):
         return True
 
     def save_data(self) -> None:
+        self.finish_populating_frames()
         if self.validate_data():
             ComponentEditorWindowBase.save_data(self)
 
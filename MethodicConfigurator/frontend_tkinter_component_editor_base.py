@@ -16,7 +16,7 @@ from logging import getLevelName as logging_getLevelName
 # from logging import debug as logging_debug
 from logging import info as logging_info
 from tkinter import messagebox, ttk
-from typing import Union
+from typing import Any, Optional, Union
 
 from MethodicConfigurator import _, __version__
 from MethodicConfigurator.backend_filesystem import LocalFilesystem
@@ -53,7 +53,7 @@ def argument_parser():
     # pylint: enable=duplicate-code
 
 
-class ComponentEditorWindowBase(BaseWindow):
+class ComponentEditorWindowBase(BaseWindow):  # pylint: disable=too-many-instance-attributes
     """
     A class for editing JSON files in the ArduPilot methodic configurator.
 
@@ -76,6 +76,9 @@ class ComponentEditorWindowBase(BaseWindow):
             return
 
         self.entry_widgets: dict[tuple, Union[ttk.Entry, ttk.Combobox]] = {}
+        self.__pending_components: list[tuple[str, Any]] = []
+        self.__populate_job: Optional[str] = None
+        self.__disabled_paths: set[tuple] = set()
 
         intro_frame = ttk.Frame(self.main_frame)
         intro_frame.pack(side=tk.TOP, fill="x", expand=False)
@@ -150,7 +153,10 @@ class ComponentEditorWindowBase(BaseWindow):
         for key in path[:-1]:
             data_path = data_path[key]
         data_path[path[-1]] = value
-        entry = self.entry_widgets[path]
+        self.__disabled_paths.add(path)
+        entry = self.entry_widgets.get(path)
+        if entry is None:
+            return  # not yet created, it gets created with this value and disabled by __add_widget()
         entry.delete(0, tk.END)
         entry.insert(0, value)
         entry.config(state="disabled")
@@ -158,10 +164,30 @@ class ComponentEditorWindowBase(BaseWindow):
     def populate_frames(self) -> None:
         """
         Populates the ScrollFrame with widgets based on the JSON data.
+
+        Only the first component frame gets created right away, the others are created one per event loop
+        iteration so that the window gets displayed and stays responsive while the remaining widgets get created.
         """
         if "Components" in self.data:
-            for key, value in self.data["Components"].items():
-                self.__add_widget(self.scroll_frame.view_port, key, value, [])
+            self.__pending_components = list(self.data["Components"].items())
+            self.__add_next_component_frame()
+
+    def __add_next_component_frame(self) -> None:
+        self.__populate_job = None
+        if self.__pending_components:
+            key, value = self.__pending_components.pop(0)
+            self.__add_widget(self.scroll_frame.view_port, key, value, [])
+        if self.__pending_components:
+            self.__populate_job = self.root.after(1, self.__add_next_component_frame)
+
+    def finish_populating_frames(self) -> None:
+        """Creates the component frames that populate_frames() has not yet created"""
+        if self.__populate_job is not None:
+            self.root.after_cancel(self.__populate_job)
+            self.__populate_job = None
+        while self.__pending_components:
+            key, value = self.__pending_components.pop(0)
+            self.__add_widget(self.scroll_frame.view_port, key, value, [])
 
     def __add_widget(self, parent, key, value, path) -> None:
         """
@@ -193,6 +219,9 @@ class ComponentEditorWindowBase(BaseWindow):
             entry = self.add_entry_or_combobox(value, entry_frame, tuple([*path, key]))
             entry.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=(0, 5))
 
+            if tuple([*path, key]) in self.__disabled_paths:
+                entry.config(state="disabled")
+
             # Store the entry widget in the entry_widgets dictionary for later retrieval
             self.entry_widgets[tuple([*path, key])] = entry
 
@@ -200,6 +229,7 @@ class ComponentEditorWindowBase(BaseWindow):
         """
         Saves the edited JSON data back to the file.
         """
+        self.finish_populating_frames()
         confirm_message = _(
             "ArduPilot Methodic Configurator only operates correctly if all component properties are correct."
             " ArduPilot parameter values depend on the components used and their connections.\n\n"
@@ -11,12 +11,96 @@ SPDX-License-Identifier: GPL-3.0-or-later
 """
 
 import tkinter as tk
+from bisect import bisect_left
 from tkinter import Entry, Listbox, StringVar, ttk
 from tkinter.constants import END, HORIZONTAL, SINGLE, VERTICAL, E, N, S, W
-from typing import Union
+from typing import Optional, Union
 
 from MethodicConfigurator import _
 
+# Wait for a typing pause this long before filtering the list and updating the listbox
+FILTER_DEBOUNCE_MS = 80
+
+# Length of the longest substrings stored in the FilterIndex
+NGRAM_LENGTH = 3
+
+
+class FilterIndex:
+    """
+    Finds the items that start with, or contain, a text without scanning all items.
+
+    The items are lowercased once when ignorecase is set. Prefixes are found by bisecting the sorted items,
+    and substrings by intersecting the sets of items containing each of their n-grams.
+    Results are in the order of the original list of items.
+    """
+
+    def __init__(self, items: list[str], ignorecase: bool) -> None:
+        self.items = items
+        self.ignorecase = ignorecase
+        self.keys = [item.lower() if ignorecase else item for item in items]
+        self.sorted_keys = sorted((key, position) for position, key in enumerate(self.keys))
+        self.ngrams: dict[str, set[int]] = {}
+        for position, key in enumerate(self.keys):
+            for length in range(1, NGRAM_LENGTH + 1):
+                for start in range(len(key) - length + 1):
+                    self.ngrams.setdefault(key[start : start + length], set()).add(position)
+
+    def startswith(self, text: str) -> list[str]:
+        prefix = text.lower() if self.ignorecase else text
+        positions = []
+        for key, position in self.sorted_keys[bisect_left(self.sorted_keys, (prefix, -1)) :]:
+            if not key.startswith(prefix):
+                break
+            positions.append(position)
+        return [self.items[position] for position in sorted(positions)]
+
+    def contains(self, text: str) -> list[str]:
+        substring = text.lower() if self.ignorecase else text
+        if not substring:
+            return list(self.items)
+        if len(substring) <= NGRAM_LENGTH:
+            positions = self.ngrams.get(substring, set())
+        else:
+            ngram_sets = sorted(
+                (
+                    self.ngrams.get(substring[start : start + NGRAM_LENGTH], set())
+                    for start in range(len(substring) - NGRAM_LENGTH + 1)
+                ),
+                key=len,
+            )
+            candidates = set.intersection(*ngram_sets)
+            positions = {position for position in candidates if substring in self.keys[position]}
+        return [self.items[position] for position in sorted(positions)]
+
+
+def listbox_row_edits(old: list[str], new: list[str]) -> Optional[list[tuple[int, int, list[str]]]]:
+    """
+    Returns the (index, number of rows to delete, rows to insert) edits that turn the old listbox rows into the new ones.
+
+    The indexes refer to the old rows, so the edits must be applied starting with the last one.
+    Returns None if the rows kept from the old list changed their order, or if an old row is duplicated.
+    """
+    old_indexes = {item: index for index, item in enumerate(old)}
+    if len(old_indexes) != len(old):
+        return None
+    edits: list[tuple[int, int, list[str]]] = []
+    next_old_index = 0
+    inserts: list[str] = []
+    for item in new:
+        old_index = old_indexes.get(item)
+        if old_index is None:
+            inserts.append(item)
+            continue
+        if old_index < next_old_index:
+            return None
+        if old_index > next_old_index or inserts:
+            edits.append((next_old_index, old_index - next_old_index, inserts))
+            inserts = []
+        next_old_index = old_index + 1
+    if next_old_index < len(old) or inserts:
+        edits.append((next_old_index, len(old) - next_old_index, inserts))
+    return edits
+
 
 def autoscroll(sbar, first, last) -> None:
     """Hide and show scrollbar as needed."""
@@ -49,6 +133,7 @@ class EntryWithDynamicalyFilteredListbox(Entry):  # pylint: disable=too-many-anc
         if list_of_items is None:
             raise ValueError(_("List_of_items can't be 'None'"))
         self._list_of_items = list_of_items
+        self._filter_index: Optional[FilterIndex] = None
 
         self.filter_function = custom_filter_function or self.default_filter_function
 
@@ -71,6 +156,8 @@ class EntryWithDynamicalyFilteredListbox(Entry):  # pylint: disable=too-many-anc
         self._trace_id = self._entry_var.trace_add("write", self._on_change_entry_var)
 
         self._listbox: Union[None, Listbox] = None
+        self._listbox_values: list[str] = []
+        self._filter_after_id: Optional[str] = None
 
         self.bind("<Up>", self._previous)
         self.bind("<Down>", self._next)
@@ -81,37 +168,58 @@ class EntryWithDynamicalyFilteredListbox(Entry):  # pylint: disable=too-many-anc
         self.bind("<Escape>", lambda event: self.unpost_listbox())
 
     def default_filter_function(self, entry_data):
-        if self._ignorecase_match:
-            if self._startswith_match:
-                return [item for item in self._list_of_items if item.lower().startswith(entry_data.lower())]
-            return [item for item in self._list_of_items if entry_data.lower() in item.lower()]
+        # the index is built on the first keystroke, not when the widget gets created
+        if self._filter_index is None:
+            self._filter_index = FilterIndex(self._list_of_items, self._ignorecase_match)
         if self._startswith_match:
-            return [item for item in self._list_of_items if item.startswith(entry_data)]
-        return [item for item in self._list_of_items if entry_data in item]
+            return self._filter_index.startswith(entry_data)
+        return self._filter_index.contains(entry_data)
 
     def _on_change_entry_var(self, _name, _index, _mode) -> None:
-        entry_data = self._entry_var.get()
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
 
-        if entry_data == "":
+        if self._entry_var.get() == "":
             self.unpost_listbox()
             self.focus()
         else:
-            values = self.filter_function(entry_data)
-            if values:
-                if self._listbox is None:
-                    self._build_listbox(values)
-                else:
-                    self._listbox.delete(0, END)
+            self._filter_after_id = self.after(FILTER_DEBOUNCE_MS, self._update_listbox)
 
-                    height = min(self._listbox_height, len(values))
-                    self._listbox.configure(height=height)
-
-                    for item in values:
-                        self._listbox.insert(END, item)
+    def _flush_pending_filter(self) -> None:
+        """Filters the list now if a keystroke is still waiting for the typing pause"""
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+            self._update_listbox()
 
+    def _update_listbox(self) -> None:
+        self._filter_after_id = None
+        entry_data = self._entry_var.get()
+        values = self.filter_function(entry_data) if entry_data else []
+        if values:
+            if self._listbox is None:
+                self._build_listbox(values)
             else:
-                self.unpost_listbox()
-                self.focus()
+                height = min(self._listbox_height, len(values))
+                self._listbox.configure(height=height)
+                self._set_listbox_rows(self._listbox, values)
+        else:
+            self.unpost_listbox()
+            self.focus()
+
+    def _set_listbox_rows(self, listbox: Listbox, values: list[str]) -> None:
+        """Only deletes and inserts the rows that changed"""
+        edits = listbox_row_edits(self._listbox_values, values)
+        if edits is None:
+            listbox.delete(0, END)
+            listbox.insert(END, *values)
+        else:
+            for index, delete_count, inserts in reversed(edits):
+                if delete_count:
+                    listbox.delete(index, index + delete_count - 1)
+                if inserts:
+                    listbox.insert(index, *inserts)
+        self._listbox_values = list(values)
 
     def _build_listbox(self, values) -> None:
         listbox_frame = ttk.Frame(self.master)
@@ -153,10 +261,11 @@ class EntryWithDynamicalyFilteredListbox(Entry):  # pylint: disable=too-many-anc
         height = min(self._listbox_height, len(values))
         self._listbox.configure(height=height)
 
-        for item in values:
-            self._listbox.insert(END, item)
+        self._listbox_values = []
+        self._set_listbox_rows(self._listbox, values)
 
     def post_listbox(self) -> None:
+        self._flush_pending_filter()
         if self._listbox is not None:
             return
 
@@ -169,6 +278,9 @@ class EntryWithDynamicalyFilteredListbox(Entry):  # pylint: disable=too-many-anc
             self._build_listbox(values)
 
     def unpost_listbox(self) -> None:
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
         if self._listbox is not None:
             self._listbox.master.destroy()
             self._listbox = None
@@ -191,6 +303,7 @@ class EntryWithDynamicalyFilteredListbox(Entry):  # pylint: disable=too-many-anc
         self._trace_id = self._entry_var.trace_add("write", self._on_change_entry_var)
 
     def update_entry_from_listbox(self, _event) -> str:
+        self._flush_pending_filter()
         if self._listbox is not None:
             current_selection = self._listbox.curselection()
 
@@ -208,6 +321,7 @@ class EntryWithDynamicalyFilteredListbox(Entry):  # pylint: disable=too-many-anc
         return "break"
 
     def _previous(self, _event) -> str:
+        self._flush_pending_filter()
         if self._listbox is not None:
             current_selection = self._listbox.curselection()
 
@@ -230,6 +344,7 @@ class EntryWithDynamicalyFilteredListbox(Entry):  # pylint: disable=too-many-anc
         return "break"
 
     def _next(self, _event) -> str:
+        self._flush_pending_filter()
         if self._listbox is not None:
             current_selection = self._listbox.curselection()
             if len(current_selection) == 0:
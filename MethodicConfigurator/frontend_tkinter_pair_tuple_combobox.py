@@ -24,7 +24,40 @@ from typing import Union
 
 from MethodicConfigurator import _
 from MethodicConfigurator.common_arguments import add_common_arguments_and_parse
-from MethodicConfigurator.frontend_tkinter_base import get_widget_font, update_combobox_width
+from MethodicConfigurator.frontend_tkinter_base import combobox_width, get_widget_font
+
+
+class PairTupleEntries:  # pylint: disable=too-few-public-methods
+    """
+    The keys and displayed strings of a PairTupleCombobox, with the key lookup and the widths derived from them.
+
+    Computing these is most of the work of filling a combobox with many entries. Passing the same instance
+    to several set_entries_tupple() calls, like the parameter table does for each parameter, computes it only once.
+    """
+
+    def __init__(self, list_pair_tuple) -> None:
+        if isinstance(list_pair_tuple, list):
+            pairs = [(tpl[0], tpl[1]) for tpl in list_pair_tuple]
+        elif isinstance(list_pair_tuple, dict):
+            pairs = list(list_pair_tuple.items())
+        else:
+            logging_critical(_("list_pair_tuple must be a tuple or a dictionary, not %s"), type(list_pair_tuple))
+            sys_exit(1)
+        self.keys: tuple[str, ...] = tuple(key for key, _show in pairs)
+        self.shows: tuple[str, ...] = tuple(show for _key, show in pairs)
+        self.key_index: dict[str, int] = {}
+        for i, key in enumerate(self.keys):
+            self.key_index.setdefault(key, i)  # like list.index(), the first one wins
+        self.width = combobox_width(self.shows)
+        self.longest_show = max(self.shows, key=len) if self.shows else ""
+        self.__longest_show_pixels: dict[str, int] = {}
+
+    def longest_show_pixels(self, font: tkfont.Font) -> int:
+        """The width in pixels of the longest displayed string plus four digits, measured once per font"""
+        font_name = str(font)
+        if font_name not in self.__longest_show_pixels:
+            self.__longest_show_pixels[font_name] = font.measure(self.longest_show + "0000")
+        return self.__longest_show_pixels[font_name]
 
 
 # https://dev.to/geraldew/python-tkinter-an-exercise-in-wrapping-the-combobox-ndb
@@ -38,40 +71,30 @@ class PairTupleCombobox(ttk.Combobox):  # pylint: disable=too-many-ancestors
     def __init__(self, container, list_pair_tuple, selected_element, cb_name, *args, **kwargs) -> None:
         super().__init__(container, *args, **kwargs)
         self.cb_name = cb_name
-        self.list_keys: list[str] = []
-        self.list_shows: list[str] = []
+        self.entries: Union[PairTupleEntries, None] = None
+        self.list_keys: tuple[str, ...] = ()
+        self.list_shows: tuple[str, ...] = ()
         self.set_entries_tupple(list_pair_tuple, selected_element)
         self.bind("<Configure>", self.on_combo_configure, add="+")
 
     def set_entries_tupple(self, list_pair_tuple, selected_element) -> None:
-        if isinstance(list_pair_tuple, list):
-            for tpl in list_pair_tuple:
-                self.list_keys.append(tpl[0])
-                self.list_shows.append(tpl[1])
-        elif isinstance(list_pair_tuple, dict):
-            for key, value in list_pair_tuple.items():
-                self.list_keys.append(key)
-                self.list_shows.append(value)
-        else:
-            logging_critical(_("list_pair_tuple must be a tuple or a dictionary, not %s"), type(list_pair_tuple))
-            sys_exit(1)
-        self["values"] = tuple(self.list_shows)
+        """list_pair_tuple is a list of (key, value) tuples, a dict or PairTupleEntries"""
+        entries = list_pair_tuple if isinstance(list_pair_tuple, PairTupleEntries) else PairTupleEntries(list_pair_tuple)
+        if entries is not self.entries:
+            self.entries = entries
+            self.list_keys = entries.keys
+            self.list_shows = entries.shows
+            self["values"] = entries.shows
 
         if selected_element:
-            try:
-                default_key_index = self.list_keys.index(selected_element)
-                self.current(default_key_index)
-            except IndexError:
-                logging_critical(
-                    _("%s combobox selected string '%s' not in list %s"), self.cb_name, selected_element, self.list_keys
-                )
-                sys_exit(1)
-            except ValueError:
+            default_key_index = entries.key_index.get(selected_element)
+            if default_key_index is None:
                 logging_critical(
                     _("%s combobox selected string '%s' not in list %s"), self.cb_name, selected_element, self.list_keys
                 )
                 sys_exit(1)
-            update_combobox_width(self)
+            self.current(default_key_index)
+            self.config(width=entries.width)
         else:
             logging_debug(_("No %s combobox element selected"), self.cb_name)
 
@@ -90,13 +113,11 @@ class PairTupleCombobox(ttk.Combobox):  # pylint: disable=too-many-ancestors
         current_combo_style = combo.cget("style") or "TCombobox"
         if len(style.lookup(current_combo_style, "postoffset")) > 0:
             return
-        combo_values = combo.cget("values")
-        if len(combo_values) == 0:
+        if self.entries is None or not self.entries.shows:
             return
-        longest_value = max(combo_values, key=len)
         # font = tkfont.nametofont(combo.cget('font'))
         font = tkfont.nametofont("TkDefaultFont")
-        width = font.measure(longest_value + "0000") - event.width
+        width = self.entries.longest_show_pixels(font) - event.width
         if width < 0:
             # no need to make the popdown smaller
             return
@@ -18,6 +18,7 @@ from logging import getLevelName as logging_getLevelName
 from logging import info as logging_info
 from logging import warning as logging_warning
 from tkinter import filedialog, messagebox, ttk
+from typing import Optional
 
 # from logging import critical as logging_critical
 from webbrowser import open as webbrowser_open  # to open the blog post documentation
@@ -26,8 +27,10 @@ from MethodicConfigurator import _, __version__
 from MethodicConfigurator.annotate_params import Par
 from MethodicConfigurator.backend_filesystem import LocalFilesystem, is_within_tolerance
 from MethodicConfigurator.backend_filesystem_program_settings import ProgramSettings
+from MethodicConfigurator.backend_filesystem_watcher import VehicleDirectoryWatcher
 from MethodicConfigurator.backend_flightcontroller import FlightController
 from MethodicConfigurator.common_arguments import add_common_arguments_and_parse
+from MethodicConfigurator.frontend_tkinter_background_task import BackgroundTask, TaskCancelledError
 from MethodicConfigurator.frontend_tkinter_base import (
     AutoResizeCombobox,
     BaseWindow,
@@ -39,8 +42,12 @@ from MethodicConfigurator.frontend_tkinter_base import (
 )
 from MethodicConfigurator.frontend_tkinter_directory_selection import VehicleDirectorySelectionWidgets
 from MethodicConfigurator.frontend_tkinter_parameter_editor_documentation_frame import DocumentationFrame
-from MethodicConfigurator.frontend_tkinter_parameter_editor_table import ParameterEditorTable
-from MethodicConfigurator.tempcal_imu import IMUfit
+from MethodicConfigurator.frontend_tkinter_parameter_editor_table import ParameterEditorTable, fc_parameters_diff
+from MethodicConfigurator.frontend_tkinter_parameter_treeview import ParameterSummaryWindow
+from MethodicConfigurator.startup_profiler import finish_startup_profiling
+
+# How often the vehicle directory gets checked for parameter files edited by other programs
+VEHICLE_DIR_WATCH_INTERVAL_MS = 1000
 
 
 def show_about_window(root, _version: str) -> None:  # pylint: disable=too-many-locals
@@ -130,11 +137,18 @@ class ParameterEditorWindow(BaseWindow):  # pylint: disable=too-many-instance-at
     parameters, documentation, and flight controller connection settings.
     """
 
-    def __init__(self, current_file: str, flight_controller: FlightController, local_filesystem: LocalFilesystem) -> None:
+    def __init__(
+        self,
+        current_file: str,
+        flight_controller: FlightController,
+        local_filesystem: LocalFilesystem,
+        watch_vehicle_dir: bool = False,
+    ) -> None:
         super().__init__()
         self.current_file = current_file
         self.flight_controller = flight_controller
         self.local_filesystem = local_filesystem
+        self.vehicle_dir_watcher: Optional[VehicleDirectoryWatcher] = None
 
         self.at_least_one_changed_parameter_written = False
         self.file_selection_combobox: AutoResizeCombobox
@@ -176,7 +190,15 @@ class ParameterEditorWindow(BaseWindow):  # pylint: disable=too-many-instance-at
         # this one should be on top of the previous one hence the longer time
         if UsagePopupWindow.should_display("parameter_editor"):
             self.root.after(100, self.__display_usage_popup_window(self.root))  # type: ignore[arg-type]
+
+        if watch_vehicle_dir:
+            self.vehicle_dir_watcher = VehicleDirectoryWatcher(self.local_filesystem.vehicle_dir)
+            self.root.after(VEHICLE_DIR_WATCH_INTERVAL_MS, self.__check_vehicle_dir_changes)
+        # the window is displayed once the pending idle tasks, like the geometry management, have run
+        self.root.after_idle(finish_startup_profiling)
         self.root.mainloop()
+        if self.vehicle_dir_watcher is not None:
+            self.vehicle_dir_watcher.close()
 
     def __create_conf_widgets(self, version: str) -> None:
         config_frame = ttk.Frame(self.main_frame)
@@ -403,6 +425,9 @@ class ParameterEditorWindow(BaseWindow):  # pylint: disable=too-many-instance-at
                     self.tempcal_imu_progress_window = ProgressWindow(
                         self.main_frame, _("Reading IMU calibration messages"), _("Please wait, this can take a long time")
                     )
+                    # imported on first use, numpy and matplotlib take longer to import than the rest of the program
+                    from MethodicConfigurator.tempcal_imu import IMUfit  # pylint: disable=import-outside-toplevel
+
                     # Pass the selected filename to the IMUfit class
                     IMUfit(
                         filename,
@@ -416,7 +441,7 @@ class ParameterEditorWindow(BaseWindow):  # pylint: disable=too-many-instance-at
                     )
                     self.tempcal_imu_progress_window.destroy()
                     try:
-                        self.local_filesystem.file_parameters = self.local_filesystem.read_params_from_files()
+                        self.local_filesystem.refresh()
                     except SystemExit as exp:
                         messagebox.showerror(_("Fatal error reading parameter files"), f"{exp}")
                         raise
@@ -474,9 +499,11 @@ class ParameterEditorWindow(BaseWindow):  # pylint: disable=too-many-instance-at
                     self.file_upload_progress_window = ProgressWindow(
                         self.main_frame, _("Uploading file"), _("Uploaded {} of {} %")
                     )
-                    if not self.flight_controller.upload_file(
-                        local_filename, remote_filename, self.file_upload_progress_window.update_progress_bar
-                    ):
+                    upload_task = BackgroundTask(
+                        self.root,
+                        lambda progress: self.flight_controller.upload_file(local_filename, remote_filename, progress),
+                    )
+                    if not upload_task.run(self.file_upload_progress_window.update_progress_bar, self.root):
                         error_msg = _("Failed to upload {local_filename} to {remote_filename}, please upload it manually")
                         messagebox.showerror(_("Upload failed"), error_msg.format(**locals()))
                     self.file_upload_progress_window.destroy()
@@ -503,17 +530,68 @@ class ParameterEditorWindow(BaseWindow):  # pylint: disable=too-many-instance-at
             self.documentation_frame.update_documentation_labels(selected_file)
             self.repopulate_parameter_table(selected_file)
 
+    def __check_vehicle_dir_changes(self) -> None:
+        watcher = self.vehicle_dir_watcher
+        if watcher is None:
+            return
+        if watcher.directory != self.local_filesystem.vehicle_dir:
+            # another vehicle directory got opened, and re_init() already read its files
+            watcher.close()
+            watcher = self.vehicle_dir_watcher = VehicleDirectoryWatcher(self.local_filesystem.vehicle_dir)
+        elif watcher.has_changes():
+            self.on_vehicle_dir_files_changed()
+        self.root.after(VEHICLE_DIR_WATCH_INTERVAL_MS, self.__check_vehicle_dir_changes)
+
+    def on_vehicle_dir_files_changed(self) -> None:
+        """Re-reads the intermediate parameter files that got changed by another program and updates the GUI"""
+        self.parameter_editor_table.generate_edit_widgets_focus_out()
+        edited_params = self.local_filesystem.file_parameters.get(self.current_file)
+        try:
+            changed_files = self.local_filesystem.refresh()
+        except SystemExit as exp:
+            messagebox.showerror(_("Fatal error reading parameter files"), f"{exp}")
+            raise
+        if not changed_files:
+            return
+        logging_info(_("Intermediate parameter files changed on disk: %s"), ", ".join(changed_files))
+        files = list(self.local_filesystem.file_parameters.keys())
+        reload_table = self.current_file in changed_files
+        if files and self.current_file not in files:
+            # the file being edited got deleted, continue with the first one without its special actions
+            self.current_file = files[0]
+            self.parameter_editor_table.set_at_least_one_param_edited(False)
+        elif reload_table and edited_params is not None and self.parameter_editor_table.get_at_least_one_param_edited():
+            msg = _("The {self.current_file} file was changed by another program.\nDiscard your edits and load it?")
+            if messagebox.askyesno(_("Parameter file changed on disk"), msg.format(**locals())):
+                self.parameter_editor_table.set_at_least_one_param_edited(False)
+            else:
+                self.local_filesystem.file_parameters[self.current_file] = edited_params
+                reload_table = False
+        self.file_selection_combobox.set_entries_tupple(files, self.current_file if files else "")
+        if reload_table and files:
+            self.documentation_frame.update_documentation_labels(self.current_file)
+            self.repopulate_parameter_table(self.current_file)
+
     def download_flight_controller_parameters(self, redownload: bool = False) -> None:
         operation_string = _("Re-downloading FC parameters") if redownload else _("Downloading FC parameters")
+        download_task = BackgroundTask(self.root, self.flight_controller.download_params)
+        # A MAVFTP transfer interrupted by a cancellation would leave its session open and
+        # the parameter files half written, so only the MAVLink download can be cancelled
         self.param_download_progress_window = ProgressWindow(
-            self.main_frame, operation_string, _("Downloaded {} of {} parameters")
+            self.main_frame,
+            operation_string,
+            _("Downloaded {} of {} parameters"),
+            on_cancel=None if self.flight_controller.info.is_mavftp_supported else download_task.cancel,
         )
         # Download all parameters from the flight controller
-        self.flight_controller.fc_parameters, param_default_values = self.flight_controller.download_params(
-            self.param_download_progress_window.update_progress_bar
-        )
-        if param_default_values:
-            self.local_filesystem.write_param_default_values_to_file(param_default_values)
+        try:
+            self.flight_controller.fc_parameters, param_default_values = download_task.run(
+                self.param_download_progress_window.update_progress_bar, self.root
+            )
+            if param_default_values:
+                self.local_filesystem.write_param_default_values_to_file(param_default_values)
+        except TaskCancelledError:
+            logging_warning(_("Parameter download cancelled, keeping the previously downloaded parameters"))
         self.param_download_progress_window.destroy()  # for the case that '--device test' and there is no real FC connected
         if not redownload:
             self.on_param_file_combobox_change(None, True)  # the initial param read will trigger a table update
@@ -597,9 +675,11 @@ class ParameterEditorWindow(BaseWindow):  # pylint: disable=too-many-instance-at
             flightcontroller_boot_delay = self.flight_controller.fc_parameters.get("BRD_BOOT_DELAY", 0)
             extra_sleep_time = max(filesystem_boot_delay.value, flightcontroller_boot_delay) // 1000 + 1  # round up
             # Call reset_and_reconnect with a callback to update the reset progress bar and the progress message
-            error_message = self.flight_controller.reset_and_reconnect(
-                self.reset_progress_window.update_progress_bar, None, int(extra_sleep_time)
+            reset_task = BackgroundTask(
+                self.root,
+                lambda progress: self.flight_controller.reset_and_reconnect(progress, None, int(extra_sleep_time)),
             )
+            error_message = reset_task.run(self.reset_progress_window.update_progress_bar, self.root)
             if error_message:
                 logging_error(error_message)
                 messagebox.showerror(_("ArduPilot methodic configurator"), error_message)
@@ -646,8 +726,12 @@ class ParameterEditorWindow(BaseWindow):  # pylint: disable=too-many-instance-at
 
         if self.at_least_one_changed_parameter_written:
             # Re-download all parameters, in case one of them changed, and validate that all uploads were successful
+            old_fc_parameters = dict(self.flight_controller.fc_parameters)
             self.download_flight_controller_parameters(True)
             logging_info(_("Re-download all parameters from the flight controller"))
+            self.parameter_editor_table.update_fc_parameters(
+                fc_parameters_diff(old_fc_parameters, self.flight_controller.fc_parameters)
+            )
 
             # Validate that the read parameters are the same as the ones in the current_file
             param_upload_error = []
@@ -751,7 +835,17 @@ class ParameterEditorWindow(BaseWindow):  # pylint: disable=too-many-instance-at
             "{nr_non_default__writable_non_calibrations} non-default writable non-sensor-calibrations - "
             "these can be reused between similar vehicles"
         )
-        messagebox.showinfo(_("Last parameter file processed"), summary_message.format(**locals()))
+        ParameterSummaryWindow(
+            self.root,
+            summary_message.format(**locals()),
+            {
+                _("Complete"): annotated_fc_parameters,
+                _("Non-default read-only"): non_default__read_only_params,
+                _("Non-default writable calibrations"): non_default__writable_calibrations,
+                _("Non-default writable non-calibrations"): non_default__writable_non_calibrations,
+            },
+            self.local_filesystem,
+        )
         wrote_complete = self.write_summary_file(annotated_fc_parameters, "complete.param", False)
         wrote_read_only = self.write_summary_file(non_default__read_only_params, "non-default_read-only.param", False)
         wrote_calibrations = self.write_summary_file(
@@ -802,6 +896,14 @@ class ParameterEditorWindow(BaseWindow):  # pylint: disable=too-many-instance-at
 
     @staticmethod
     def add_argparse_arguments(parser: ArgumentParser) -> ArgumentParser:
+        parser.add_argument(
+            "--watch-vehicle-dir",
+            action="store_true",
+            help=_(
+                "Reload intermediate parameter files when they get changed by another program, "
+                "for instance an external text editor. Default is %(default)s"
+            ),
+        )
         return parser
 
 
@@ -833,4 +935,4 @@ if __name__ == "__main__":
 
     fc = FlightController(args.reboot_time)
     filesystem = LocalFilesystem(args.vehicle_dir, args.vehicle_type, "", args.allow_editing_template_files)
-    ParameterEditorWindow("04_board_orientation.param", fc, filesystem)
+    ParameterEditorWindow("04_board_orientation.param", fc, filesystem, args.watch_vehicle_dir)
@@ -18,7 +18,7 @@ from logging import info as logging_info
 from platform import system as platform_system
 from sys import exit as sys_exit
 from tkinter import messagebox, ttk
-from typing import Union
+from typing import Optional, Union
 
 from MethodicConfigurator import _
 from MethodicConfigurator.annotate_params import Par
@@ -30,17 +30,206 @@ from MethodicConfigurator.backend_filesystem import is_within_tolerance
 # from MethodicConfigurator.frontend_tkinter_base import AutoResizeCombobox
 from MethodicConfigurator.frontend_tkinter_base import BaseWindow, ScrollFrame, get_widget_font, show_tooltip
 from MethodicConfigurator.frontend_tkinter_entry_dynamic import EntryWithDynamicalyFilteredListbox
-from MethodicConfigurator.frontend_tkinter_pair_tuple_combobox import PairTupleCombobox
+from MethodicConfigurator.frontend_tkinter_pair_tuple_combobox import PairTupleCombobox, PairTupleEntries
 
 NEW_VALUE_WIDGET_WIDTH = 9
 
+# Rows of widgets kept above and below the visible part of the table, so that slow scrolling rarely rebinds rows
+ROW_MARGIN = 2
 
-class ParameterEditorTable(ScrollFrame):  # pylint: disable=too-many-ancestors
+# Offset of the view_port frame inside the ScrollFrame canvas
+VIEW_PORT_OFFSET = 4
+
+
+def visible_row_range(
+    view_top: float, view_height: float, row_height: float, row_count: int, margin: int = ROW_MARGIN
+) -> range:
+    """
+    Returns the indexes of the table data rows that need widgets.
+
+    Parameters:
+    - view_top (float): Position of the top of the visible area, relative to the top of the first data row.
+    - view_height (float): Height of the visible area.
+    - row_height (float): Height of each data row.
+    - row_count (int): Number of data rows in the table.
+    - margin (int): Number of extra rows above and below the visible ones.
+    """
+    if row_height <= 0:
+        return range(0)
+    first = int(view_top // row_height) - margin
+    last = int((view_top + view_height) // row_height) + 1 + margin
+    return range(max(0, first), min(row_count, last))
+
+
+def fc_parameters_diff(old: dict[str, float], new: dict[str, float]) -> dict[str, Optional[float]]:
+    """Returns the parameters whose flight controller value changed, with None for the ones that no longer exist"""
+    diff: dict[str, Optional[float]] = {
+        param_name: value
+        for param_name, value in new.items()
+        if param_name not in old or not is_within_tolerance(old[param_name], value)
+    }
+    diff.update({param_name: None for param_name in old if param_name not in new})
+    return diff
+
+
+def restack_rows(bound_rows: dict[int, "ParameterTableRow"]) -> None:
+    """
+    Raises the widgets of the bound rows above their siblings, in the order of the table rows.
+
+    Tk moves the keyboard focus between sibling widgets in their stacking order, which is the order they
+    were created in, unless they get raised. Recycled rows are created in any order, so they need restacking
+    for the Tab key to move from one table row to the next.
+    """
+    for index in sorted(bound_rows):
+        for widget in bound_rows[index].widgets():
+            widget.lift()
+
+
+class ParameterTableRow:  # pylint: disable=too-many-instance-attributes
+    """
+    The widgets of one row of the parameter editor table.
+
+    Rows are only created for the visible part of the table and get bound to other parameters
+    as the table scrolls or gets repopulated, so their event handlers look up param_name when they run.
+    """
+
+    def __init__(self, parent: ttk.Frame) -> None:
+        self.param_name: Union[str, None] = None
+        self.present_as_forced = False
+        self.bitmask_dict: Union[dict, None] = None
+        self.delete_button = ttk.Button(parent, text=_("Del"), style="narrow.TButton")
+        self.parameter_label = ttk.Label(parent)
+        self.flightcontroller_value = ttk.Label(parent)
+        self.new_value_entry = ttk.Entry(parent, width=NEW_VALUE_WIDGET_WIDTH + 1, justify=tk.RIGHT)
+        self.new_value_combobox = PairTupleCombobox(parent, [], None, "")
+        font = get_widget_font(self.new_value_combobox)
+        font["size"] -= 2 if platform_system() == "Windows" else 1
+        self.new_value_combobox.config(width=NEW_VALUE_WIDGET_WIDTH, font=(font["family"], font["size"]))
+        self.unit_label = ttk.Label(parent)
+        self.upload_checkbutton = ttk.Checkbutton(parent)
+        self.change_reason_entry = ttk.Entry(parent, background="white")
+        # the default colors, to restore them when a forced parameter row gets bound to a normal parameter
+        self.label_background = self.flightcontroller_value.cget("background")
+        self.entry_background = self.new_value_entry.cget("background")
+        self.combobox_background = self.new_value_combobox.cget("background")
+        self.value_widget: Union[PairTupleCombobox, ttk.Entry] = self.new_value_entry
+        self.__widgets: tuple[tk.Widget, ...] = (
+            self.delete_button,
+            self.parameter_label,
+            self.flightcontroller_value,
+            self.new_value_entry,
+            self.new_value_combobox,
+            self.unit_label,
+            self.upload_checkbutton,
+            self.change_reason_entry,
+        )
+
+    def widgets(self) -> list[tk.Widget]:
+        return list(self.__widgets)
+
+    @staticmethod
+    def set_tooltip(widget: tk.Widget, text: Union[str, None]) -> None:
+        show_tooltip(widget, text or "")
+
+
+class BitmaskSelectionWindow:  # pylint: disable=too-few-public-methods
+    """
+    Lets the user select the bits of a bitmask parameter, with one checkbutton per bit.
+
+    Closing the window only withdraws it, and the checkbuttons of each parameter are kept,
+    so opening it again for a parameter only updates the state of its checkbuttons.
+    """
+
+    def __init__(self, parent: tk.Misc) -> None:
+        self.parent = parent
+        self.__window: Union[tk.Toplevel, None] = None
+        self.__closed: Union[tk.BooleanVar, None] = None
+        self.__shown_frame: Union[ttk.Frame, None] = None
+        # per parameter: the bitmask, its frame, the variables of the checkbuttons and the value label
+        self.__checkbuttons: dict[str, tuple[dict, ttk.Frame, dict[int, tk.BooleanVar], ttk.Label]] = {}
+
+    def select(self, param_name: str, bitmask_dict: dict[int, str], current_value: int) -> int:
+        """Displays the window until the user closes it, and returns the value of the selected bits"""
+        if self.__window is None or self.__closed is None or not self.__window.winfo_exists():
+            self.__window = tk.Toplevel(self.parent)
+            self.__closed = tk.BooleanVar(master=self.__window, value=False)
+            self.__window.protocol("WM_DELETE_WINDOW", lambda: self.__closed.set(True))  # type: ignore[union-attr]
+            self.__shown_frame = None
+            self.__checkbuttons = {}
+        window = self.__window
+        title = _("Select {param_name} Bitmask Options")
+        window.title(title.format(**locals()))
+
+        frame, checkbox_vars, value_label = self.__get_checkbuttons(param_name, bitmask_dict)
+        if frame is not self.__shown_frame:
+            if self.__shown_frame is not None:
+                self.__shown_frame.pack_forget()
+            frame.pack(expand=True, fill=tk.BOTH)
+            self.__shown_frame = frame
+        # Convert current_value to a set of checked keys
+        for key, var in checkbox_vars.items():
+            var.set(bool((current_value >> key) & 1))
+        BitmaskSelectionWindow.__update_label(param_name, checkbox_vars, value_label)
+
+        # Make sure the window is visible before disabling the parent window
+        self.__closed.set(False)
+        window.deiconify()
+        self.parent.update_idletasks()
+        window.grab_set()
+        window.wait_variable(self.__closed)  # Wait for the window to be closed
+        window.grab_release()
+        window.withdraw()
+        return BitmaskSelectionWindow.__selected_value(checkbox_vars)
+
+    def __get_checkbuttons(
+        self, param_name: str, bitmask_dict: dict[int, str]
+    ) -> tuple[ttk.Frame, dict[int, tk.BooleanVar], ttk.Label]:
+        cached = self.__checkbuttons.get(param_name)
+        if cached is not None and cached[0] is bitmask_dict:
+            return cached[1], cached[2], cached[3]
+        if cached is not None:  # the documentation got reloaded
+            if cached[1] is self.__shown_frame:
+                self.__shown_frame = None
+            cached[1].destroy()
+
+        frame = ttk.Frame(self.__window)
+        checkbox_vars: dict[int, tk.BooleanVar] = {}
+        # Replace the close button with a read-only label displaying the current new_decimal_value
+        value_label = ttk.Label(frame)
+        for i, (key, value) in enumerate(bitmask_dict.items()):
+            var = tk.BooleanVar(master=frame, value=False)
+            checkbox_vars[key] = var
+            checkbox = ttk.Checkbutton(
+                frame,
+                text=value,
+                variable=var,
+                command=lambda: BitmaskSelectionWindow.__update_label(param_name, checkbox_vars, value_label),
+            )
+            checkbox.grid(row=i, column=0, sticky="w")
+        value_label.grid(row=len(bitmask_dict), column=0, pady=10)
+        self.__checkbuttons[param_name] = (bitmask_dict, frame, checkbox_vars, value_label)
+        return frame, checkbox_vars, value_label
+
+    @staticmethod
+    def __selected_value(checkbox_vars: dict[int, tk.BooleanVar]) -> int:
+        # Convert checked keys back to a decimal value
+        return sum(1 << key for key, var in checkbox_vars.items() if var.get())
+
+    @staticmethod
+    def __update_label(_param_name: str, checkbox_vars: dict[int, tk.BooleanVar], value_label: ttk.Label) -> None:
+        _new_decimal_value = BitmaskSelectionWindow.__selected_value(checkbox_vars)
+        text = _("{_param_name} Value: {_new_decimal_value}")
+        value_label.config(text=text.format(**locals()))
+
+
+class ParameterEditorTable(ScrollFrame):  # pylint: disable=too-many-ancestors, too-many-instance-attributes
     """
     A class to manage and display the parameter editor table within the GUI.
 
     This class inherits from ScrollFrame and is responsible for creating,
     managing, and updating the table that displays parameters for editing.
+    The table is virtualized: widgets are only created for the visible rows,
+    and get reused for other parameters when scrolling or switching files.
     """
 
     def __init__(self, root, local_filesystem, parameter_editor) -> None:
@@ -51,9 +240,41 @@ class ParameterEditorTable(ScrollFrame):  # pylint: disable=too-many-ancestors
         self.current_file = ""
         self.upload_checkbutton_var: dict[str, tk.BooleanVar] = {}
         self.at_least_one_param_edited = False
+        self.__params: dict[str, Par] = {}
+        self.__param_names: list[str] = []
+        self.__fc_parameters: dict[str, float] = {}
+        self.__bound_rows: dict[int, ParameterTableRow] = {}
+        self.__free_rows: list[ParameterTableRow] = []
+        self.__row_height = 0
+        self.__configured_row_count = 0
+        self.__layout_running = False
+        self.__layout_requested = False
+        self.__combobox_entries: dict[str, tuple[dict[str, str], PairTupleEntries]] = {}
+        self.__bitmask_selection_window = BitmaskSelectionWindow(self.root)
 
         style = ttk.Style()
         style.configure("narrow.TButton", padding=0, width=4, border=(0, 0, 0, 0))
+        self.__default_background = ttk.Style(self.root).lookup("TFrame", "background")
+
+        self.__header_height = self.__create_headers()
+        self.add_button = ttk.Button(
+            self.view_port,
+            text=_("Add"),
+            style="narrow.TButton",
+            command=lambda: self.__on_parameter_add(self.__fc_parameters),
+        )
+
+        # Configure the table_frame to stretch columns
+        self.view_port.columnconfigure(0, weight=0)  # Delete and Add buttons
+        self.view_port.columnconfigure(1, weight=0, minsize=120)  # Parameter name
+        self.view_port.columnconfigure(2, weight=0)  # Current Value
+        self.view_port.columnconfigure(3, weight=0)  # New Value
+        self.view_port.columnconfigure(4, weight=0)  # Units
+        self.view_port.columnconfigure(5, weight=0)  # Upload to FC
+        self.view_port.columnconfigure(6, weight=1)  # Change Reason
+
+        # bind the rows to the parameters that scroll into view
+        self.canvas.configure(yscrollcommand=self.__on_canvas_yscroll)
 
         # Prepare a dictionary that maps variable names to their values
         # These variables are used by the forced_parameters and derived_parameters in configuration_steps_*.json files
@@ -61,6 +282,27 @@ class ParameterEditorTable(ScrollFrame):  # pylint: disable=too-many-ancestors
 
         self.compute_forced_and_derived_parameters()
 
+    def __create_headers(self) -> int:
+        """Creates the labels of the table headers and returns their height"""
+        headers = [_("-/+"), _("Parameter"), _("Current Value"), _("New Value"), _("Unit"), _("Upload"), _("Change Reason")]
+        tooltips = [
+            _("Delete or add a parameter"),
+            _("Parameter name must be ^[A-Z][A-Z_0-9]* and most 16 characters long"),
+            _("Current value on the flight controller "),
+            _("New value from the above selected intermediate parameter file"),
+            _("Parameter Unit"),
+            _("When selected, upload the new value to the flight controller"),
+            _("Reason why respective parameter changed"),
+        ]
+
+        header_height = 0
+        for i, header in enumerate(headers):
+            label = ttk.Label(self.view_port, text=header)
+            label.grid(row=0, column=i, sticky="ew")  # Use sticky="ew" to make the label stretch horizontally
+            show_tooltip(label, tooltips[i])
+            header_height = max(header_height, label.winfo_reqheight())
+        return header_height
+
     def compute_forced_and_derived_parameters(self) -> None:
         if self.local_filesystem.configuration_steps:
             for filename, file_info in self.local_filesystem.configuration_steps.items():
@@ -85,29 +327,8 @@ class ParameterEditorTable(ScrollFrame):  # pylint: disable=too-many-ancestors
                     self.local_filesystem.file_parameters[filename][param_name] = param
 
     def repopulate(self, selected_file: str, fc_parameters: dict, show_only_differences: bool) -> None:
-        for widget in self.view_port.winfo_children():
-            widget.destroy()
         self.current_file = selected_file
 
-        # Create labels for table headers
-        headers = [_("-/+"), _("Parameter"), _("Current Value"), _("New Value"), _("Unit"), _("Upload"), _("Change Reason")]
-        tooltips = [
-            _("Delete or add a parameter"),
-            _("Parameter name must be ^[A-Z][A-Z_0-9]* and most 16 characters long"),
-            _("Current value on the flight controller "),
-            _("New value from the above selected intermediate parameter file"),
-            _("Parameter Unit"),
-            _("When selected, upload the new value to the flight controller"),
-            _("Reason why respective parameter changed"),
-        ]
-
-        for i, header in enumerate(headers):
-            label = ttk.Label(self.view_port, text=header)
-            label.grid(row=0, column=i, sticky="ew")  # Use sticky="ew" to make the label stretch horizontally
-            show_tooltip(label, tooltips[i])
-
-        self.upload_checkbutton_var = {}
-
         # re-compute derived parameters because the fc_parameters values might have changed
         if self.local_filesystem.configuration_steps and selected_file in self.local_filesystem.configuration_steps:
             self.variables["fc_parameters"] = fc_parameters
@@ -141,8 +362,6 @@ class ParameterEditorTable(ScrollFrame):  # pylint: disable=too-many-ancestors
                 return
         else:
             self.__update_table(self.local_filesystem.file_parameters[selected_file], fc_parameters)
-        # Scroll to the top of the parameter table
-        self.canvas.yview("moveto", 0)
 
     def rename_fc_connection(self, selected_file) -> None:
         renames = {}
@@ -184,93 +403,225 @@ class ParameterEditorTable(ScrollFrame):  # pylint: disable=too-many-ancestors
                     )
                     messagebox.showinfo(_("Parameter Renamed"), info_msg.format(**locals()))
 
-    def __update_table(self, params, fc_parameters) -> None:
-        try:
-            for i, (param_name, param) in enumerate(params.items(), 1):
-                param_metadata = self.local_filesystem.doc_dict.get(param_name, None)
-                param_default = self.local_filesystem.param_default_dict.get(param_name, None)
-                doc_tooltip = (
-                    param_metadata.get("doc_tooltip")
-                    if param_metadata
-                    else _("No documentation available in apm.pdef.xml for this parameter")
-                )
+    def __update_table(self, params: dict[str, Par], fc_parameters: dict[str, float]) -> None:
+        self.__params = params
+        self.__param_names = list(params)
+        self.__fc_parameters = fc_parameters
+        self.__apply_forced_and_derived_parameters(params)
+        self.upload_checkbutton_var = {
+            param_name: tk.BooleanVar(value=bool(fc_parameters)) for param_name in self.__param_names
+        }
+
+        # the rows now show other parameters, they all need to be bound again
+        self.__free_rows.extend(self.__bound_rows.values())
+        self.__bound_rows = {}
+        if not self.__row_height:
+            self.__free_rows.append(self.__create_row())
+
+        # Reserve the height of all rows, so that the scroll region covers the whole table
+        for i in range(1, len(params) + 1):
+            self.view_port.rowconfigure(i, minsize=self.__row_height)
+        for i in range(len(params) + 1, self.__configured_row_count + 1):
+            self.view_port.rowconfigure(i, minsize=0)
+        self.__configured_row_count = len(params)
+
+        # Add the "Add" button at the bottom of the table
+        tooltip_msg = _("Add a parameter to the {self.current_file} file")
+        show_tooltip(self.add_button, tooltip_msg.format(**locals()))
+        self.add_button.grid(row=len(params) + 2, column=0, sticky="w", padx=0)
 
-                column: list[tk.Widget] = []
-                column.append(self.__create_delete_button(param_name))
-                column.append(self.__create_parameter_name(param_name, param_metadata, doc_tooltip))
-                column.append(self.__create_flightcontroller_value(fc_parameters, param_name, param_default, doc_tooltip))
-                column.append(self.__create_new_value_entry(param_name, param, param_metadata, param_default, doc_tooltip))
-                column.append(self.__create_unit_label(param_metadata))
-                column.append(self.__create_upload_checkbutton(param_name, bool(fc_parameters)))
-                column.append(self.__create_change_reason_entry(param_name, param, column[3]))
-
-                column[0].grid(row=i, column=0, sticky="w", padx=0)
-                column[1].grid(row=i, column=1, sticky="w", padx=0)
-                column[2].grid(row=i, column=2, sticky="e", padx=0)
-                column[3].grid(row=i, column=3, sticky="e", padx=0)
-                column[4].grid(row=i, column=4, sticky="e", padx=0)
-                column[5].grid(row=i, column=5, sticky="e", padx=0)
-                column[6].grid(row=i, column=6, sticky="ew", padx=(0, 5))
-
-            # Add the "Add" button at the bottom of the table
-            add_button = ttk.Button(
-                self.view_port, text=_("Add"), style="narrow.TButton", command=lambda: self.__on_parameter_add(fc_parameters)
-            )
-            tooltip_msg = _("Add a parameter to the {self.current_file} file")
-            show_tooltip(add_button, tooltip_msg.format(**locals()))
-            add_button.grid(row=len(params) + 2, column=0, sticky="w", padx=0)
+        # Scroll to the top of the parameter table
+        self.canvas.yview("moveto", 0)
+        self.__layout_visible_rows()
 
+    def __apply_forced_and_derived_parameters(self, params: dict[str, Par]) -> None:
+        """Forced and derived parameters override the values and change reasons of the file"""
+        for param_name, param in params.items():
+            for computed_parameters in (self.local_filesystem.forced_parameters, self.local_filesystem.derived_parameters):
+                if self.current_file not in computed_parameters or param_name not in computed_parameters[self.current_file]:
+                    continue
+                computed_param = computed_parameters[self.current_file][param_name]
+                if not is_within_tolerance(param.value, computed_param.value):
+                    param.value = computed_param.value
+                    self.at_least_one_param_edited = True
+                if param.comment != computed_param.comment:
+                    param.comment = computed_param.comment
+                    self.at_least_one_param_edited = True
+
+    def __is_forced_or_derived(self, param_name: str) -> bool:
+        return any(
+            self.current_file in computed_parameters and param_name in computed_parameters[self.current_file]
+            for computed_parameters in (self.local_filesystem.forced_parameters, self.local_filesystem.derived_parameters)
+        )
+
+    def __create_row(self) -> ParameterTableRow:
+        row = ParameterTableRow(self.view_port)
+        row.delete_button.configure(command=lambda: self.__on_parameter_delete(row.param_name))
+        row.new_value_entry.bind("<FocusIn>", lambda event: self.__on_row_value_focus_in(row, event))
+        row.new_value_entry.bind("<FocusOut>", lambda event: self.__on_row_value_focus_out(row, event))
+        row.new_value_combobox.bind("<FocusOut>", lambda event: self.__on_row_value_focus_out(row, event))
+        row.new_value_combobox.bind(
+            "<<ComboboxSelected>>",
+            lambda event: self.__update_combobox_style_on_selection(
+                row.new_value_combobox, self.local_filesystem.param_default_dict.get(row.param_name, None), event
+            ),
+            "+",
+        )
+        row.change_reason_entry.bind("<FocusOut>", lambda event: self.__on_row_change_reason_focus_out(row, event))
+        for widget in (row.delete_button, row.new_value_combobox, row.upload_checkbutton, row.change_reason_entry):
+            widget.bind("<FocusIn>", lambda _event: self.__scroll_row_into_view(row))
+        if not self.__row_height:
+            # all rows get the height of the highest widget, so that the position of each row is known
+            self.view_port.update_idletasks()
+            self.__row_height = max(widget.winfo_reqheight() for widget in row.widgets())
+        return row
+
+    def __on_canvas_yscroll(self, first: float, last: float) -> None:
+        self.vsb.set(first, last)
+        self.__layout_visible_rows()
+
+    def __layout_visible_rows(self) -> None:
+        # committing the edits of a row can open a message box, whose event loop scrolls the table again
+        if self.__layout_running:
+            self.__layout_requested = True
+            return
+        self.__layout_running = True
+        try:
+            self.__layout_requested = True
+            while self.__layout_requested:
+                self.__layout_requested = False
+                self.__bind_visible_rows()
+        finally:
+            self.__layout_running = False
+
+    def __bind_visible_rows(self) -> None:
+        """Binds rows of widgets to the parameters in the visible part of the table and hides the other rows"""
+        view_top = self.canvas.canvasy(0) - VIEW_PORT_OFFSET - self.__header_height
+        view_height = max(self.canvas.winfo_height(), self.canvas.winfo_reqheight())
+        needed = visible_row_range(view_top, view_height, self.__row_height, len(self.__param_names))
+        for index in [index for index in self.__bound_rows if index not in needed]:
+            row = self.__bound_rows.pop(index)
+            self.__commit_row_edits(row)
+            self.__free_rows.append(row)
+        param_name = ""
+        rebound = False
+        try:
+            for index in needed:
+                if index not in self.__bound_rows:
+                    param_name = self.__param_names[index]
+                    row = self.__free_rows.pop() if self.__free_rows else self.__create_row()
+                    self.__bind_row(row, index, param_name)
+                    self.__bound_rows[index] = row
+                    rebound = True
         except KeyError as e:
             logging_critical(_("Parameter %s not found in the %s file: %s"), param_name, self.current_file, e, exc_info=True)
             sys_exit(1)
-
-        # Configure the table_frame to stretch columns
-        self.view_port.columnconfigure(0, weight=0)  # Delete and Add buttons
-        self.view_port.columnconfigure(1, weight=0, minsize=120)  # Parameter name
-        self.view_port.columnconfigure(2, weight=0)  # Current Value
-        self.view_port.columnconfigure(3, weight=0)  # New Value
-        self.view_port.columnconfigure(4, weight=0)  # Units
-        self.view_port.columnconfigure(5, weight=0)  # Upload to FC
-        self.view_port.columnconfigure(6, weight=1)  # Change Reason
-
-    def __create_delete_button(self, param_name) -> ttk.Button:
-        delete_button = ttk.Button(
-            self.view_port, text=_("Del"), style="narrow.TButton", command=lambda: self.__on_parameter_delete(param_name)
+        if rebound:
+            restack_rows(self.__bound_rows)
+            self.add_button.lift()
+        for row in self.__free_rows:
+            if row.param_name is not None:
+                row.param_name = None
+                for widget in row.widgets():
+                    widget.grid_remove()
+
+    def __scroll_row_into_view(self, row: ParameterTableRow) -> None:
+        """Scrolls the table when the keyboard focus moves to a row outside of the visible area"""
+        index = next((index for index, bound_row in self.__bound_rows.items() if bound_row is row), None)
+        bbox = self.canvas.bbox("all")
+        if index is None or not bbox or bbox[3] <= bbox[1]:
+            return
+        row_top = VIEW_PORT_OFFSET + self.__header_height + index * self.__row_height
+        view_top = self.canvas.canvasy(0)
+        view_height = self.canvas.winfo_height()
+        if row_top < view_top:
+            new_view_top = row_top
+        elif row_top + self.__row_height > view_top + view_height:
+            new_view_top = row_top + self.__row_height - view_height
+        else:
+            return
+        # the canvas then reports the new position, which binds the rows that became visible
+        self.canvas.yview_moveto((new_view_top - bbox[1]) / (bbox[3] - bbox[1]))
+
+    def __bind_row(self, row: ParameterTableRow, index: int, param_name: str) -> None:
+        param = self.__params[param_name]
+        param_metadata = self.local_filesystem.doc_dict.get(param_name, None)
+        param_default = self.local_filesystem.param_default_dict.get(param_name, None)
+        doc_tooltip = (
+            param_metadata.get("doc_tooltip")
+            if param_metadata
+            else _("No documentation available in apm.pdef.xml for this parameter")
         )
-        tooltip_msg = _("Delete {param_name} from the {self.current_file} file")
-        show_tooltip(delete_button, tooltip_msg.format(**locals()))
-        return delete_button
+        row.param_name = param_name
 
-    def __create_parameter_name(self, param_name, param_metadata, doc_tooltip) -> ttk.Label:
+        tooltip_msg = _("Delete {param_name} from the {self.current_file} file")
+        row.set_tooltip(row.delete_button, tooltip_msg.format(**locals()))
+        self.__bind_parameter_name(row, param_name, param_metadata, doc_tooltip)
+        self.__bind_flightcontroller_value(row, param_name, param_default, doc_tooltip)
+        self.__bind_new_value(row, param_name, param, doc_tooltip)
+        self.__bind_unit_label(row, param_metadata)
+        self.__bind_upload_checkbutton(row, param_name)
+        self.__bind_change_reason(row, param_name)
+
+        grid_row = index + 1  # the headers are on the first row
+        row.delete_button.grid(row=grid_row, column=0, sticky="w", padx=0)
+        row.parameter_label.grid(row=grid_row, column=1, sticky="w", padx=0)
+        row.flightcontroller_value.grid(row=grid_row, column=2, sticky="e", padx=0)
+        row.value_widget.grid(row=grid_row, column=3, sticky="e", padx=0)
+        row.unit_label.grid(row=grid_row, column=4, sticky="e", padx=0)
+        row.upload_checkbutton.grid(row=grid_row, column=5, sticky="e", padx=0)
+        row.change_reason_entry.grid(row=grid_row, column=6, sticky="ew", padx=(0, 5))
+
+    def __bind_parameter_name(self, row: ParameterTableRow, param_name, param_metadata, doc_tooltip) -> None:
         is_calibration = param_metadata.get("Calibration", False) if param_metadata else False
         is_readonly = param_metadata.get("ReadOnly", False) if param_metadata else False
-        parameter_label = ttk.Label(
-            self.view_port,
+        row.parameter_label.configure(
             text=param_name + (" " * (16 - len(param_name))),
-            background="red"
-            if is_readonly
-            else "yellow"
-            if is_calibration
-            else ttk.Style(self.root).lookup("TFrame", "background"),
+            background="red" if is_readonly else "yellow" if is_calibration else self.__default_background,
         )
-        if doc_tooltip:
-            show_tooltip(parameter_label, doc_tooltip)
-        return parameter_label
-
-    def __create_flightcontroller_value(self, fc_parameters, param_name, param_default, doc_tooltip) -> ttk.Label:
-        if param_name in fc_parameters:
-            value_str = format(fc_parameters[param_name], ".6f").rstrip("0").rstrip(".")
-            if param_default is not None and is_within_tolerance(fc_parameters[param_name], param_default.value):
+        row.set_tooltip(row.parameter_label, doc_tooltip)
+
+    def __bind_flightcontroller_value(self, row: ParameterTableRow, param_name, param_default, doc_tooltip) -> None:
+        if param_name in self.__fc_parameters:
+            value_str = format(self.__fc_parameters[param_name], ".6f").rstrip("0").rstrip(".")
+            if param_default is not None and is_within_tolerance(self.__fc_parameters[param_name], param_default.value):
                 # If it matches, set the background color to light blue
-                flightcontroller_value = ttk.Label(self.view_port, text=value_str, background="light blue")
+                row.flightcontroller_value.configure(text=value_str, background="light blue")
             else:
                 # Otherwise, set the background color to the default color
-                flightcontroller_value = ttk.Label(self.view_port, text=value_str)
+                row.flightcontroller_value.configure(text=value_str, background=row.label_background)
         else:
-            flightcontroller_value = ttk.Label(self.view_port, text=_("N/A"), background="orange")
-        if doc_tooltip:
-            show_tooltip(flightcontroller_value, doc_tooltip)
-        return flightcontroller_value
+            row.flightcontroller_value.configure(text=_("N/A"), background="orange")
+        row.set_tooltip(row.flightcontroller_value, doc_tooltip)
+
+    def update_fc_parameters(self, diff: dict[str, Optional[float]]) -> None:
+        """
+        Updates the "Current Value" column after the flight controller parameters changed, without rebuilding the table.
+
+        Only the rows of the parameters in the diff, as returned by fc_parameters_diff(), get updated,
+        so the scroll position, the focus and edits in progress are kept.
+        The rows displayed by show_only_differences stay the same until the next repopulate().
+        """
+        fc_parameters = dict(self.__fc_parameters)
+        for param_name, value in diff.items():
+            if value is None:
+                fc_parameters.pop(param_name, None)
+            else:
+                fc_parameters[param_name] = value
+        upload_state_changed = bool(fc_parameters) != bool(self.__fc_parameters)
+        self.__fc_parameters = fc_parameters
+        for row in self.__bound_rows.values():
+            if row.param_name in diff:
+                param_default = self.local_filesystem.param_default_dict.get(row.param_name, None)
+                param_metadata = self.local_filesystem.doc_dict.get(row.param_name, None)
+                doc_tooltip = (
+                    param_metadata.get("doc_tooltip")
+                    if param_metadata
+                    else _("No documentation available in apm.pdef.xml for this parameter")
+                )
+                self.__bind_flightcontroller_value(row, row.param_name, param_default, doc_tooltip)
+            if upload_state_changed and row.param_name is not None:
+                row.upload_checkbutton.configure(state="normal" if fc_parameters else "disabled")
 
     def __update_combobox_style_on_selection(self, combobox_widget, param_default, event) -> None:
         try:
@@ -295,215 +646,131 @@ class ParameterEditorTable(ScrollFrame):  # pylint: disable=too-many-ancestors
         else:
             new_value_entry.configure(style="TEntry")
 
-    def __create_new_value_entry(  # pylint: disable=too-many-arguments, too-many-positional-arguments
-        self,
-        param_name,
-        param,
-        param_metadata,
-        param_default,
-        doc_tooltip,
-    ) -> Union[PairTupleCombobox, ttk.Entry]:
-        present_as_forced = False
-        if (
-            self.current_file in self.local_filesystem.forced_parameters
-            and param_name in self.local_filesystem.forced_parameters[self.current_file]
-        ):
-            present_as_forced = True
-            if not is_within_tolerance(
-                param.value, self.local_filesystem.forced_parameters[self.current_file][param_name].value
-            ):
-                param.value = self.local_filesystem.forced_parameters[self.current_file][param_name].value
-                self.at_least_one_param_edited = True
-        if (
-            self.current_file in self.local_filesystem.derived_parameters
-            and param_name in self.local_filesystem.derived_parameters[self.current_file]
-        ):
-            present_as_forced = True
-            if not is_within_tolerance(
-                param.value, self.local_filesystem.derived_parameters[self.current_file][param_name].value
-            ):
-                param.value = self.local_filesystem.derived_parameters[self.current_file][param_name].value
-                self.at_least_one_param_edited = True
-
-        bitmask_dict = None
+    def __get_combobox_entries(self, param_name: str, values: dict[str, str]) -> PairTupleEntries:
+        """The combobox entries of a parameter, computed once and reused across files and table refreshes"""
+        cached = self.__combobox_entries.get(param_name)
+        # a reloaded documentation has new values dicts
+        if cached is None or cached[0] is not values:
+            cached = (values, PairTupleEntries(values))
+            self.__combobox_entries[param_name] = cached
+        return cached[1]
+
+    def __bind_new_value(self, row: ParameterTableRow, param_name, param, doc_tooltip) -> None:
+        param_metadata = self.local_filesystem.doc_dict.get(param_name, None)
+        param_default = self.local_filesystem.param_default_dict.get(param_name, None)
+        row.present_as_forced = self.__is_forced_or_derived(param_name)
+        row.bitmask_dict = None
         value_str = format(param.value, ".6f").rstrip("0").rstrip(".")
-        new_value_entry: Union[PairTupleCombobox, ttk.Entry]
         if (
             param_metadata
             and "values" in param_metadata
             and param_metadata["values"]
             and value_str in param_metadata["values"]
         ):
-            selected_value = param_metadata["values"].get(value_str, None)
             has_default_value = param_default is not None and is_within_tolerance(param.value, param_default.value)
-            new_value_entry = PairTupleCombobox(
-                self.view_port,
-                param_metadata["values"],
-                value_str,
-                param_name,
+            new_value_combobox = row.new_value_combobox
+            new_value_combobox.cb_name = param_name
+            new_value_combobox.configure(state="normal")
+            new_value_combobox.set_entries_tupple(self.__get_combobox_entries(param_name, param_metadata["values"]), value_str)
+            new_value_combobox.configure(
                 style="TCombobox"
-                if present_as_forced
+                if row.present_as_forced
                 else "default_v.TCombobox"
                 if has_default_value
                 else "readonly.TCombobox",
+                width=NEW_VALUE_WIDGET_WIDTH,
+                state="disabled" if row.present_as_forced else "readonly",
+                background="light grey" if row.present_as_forced else row.combobox_background,
             )
-            new_value_entry.set(selected_value)
-            font = get_widget_font(new_value_entry)
-            font["size"] -= 2 if platform_system() == "Windows" else 1
-            new_value_entry.config(state="readonly", width=NEW_VALUE_WIDGET_WIDTH, font=(font["family"], font["size"]))
-            new_value_entry.bind(
-                "<<ComboboxSelected>>",
-                lambda event: self.__update_combobox_style_on_selection(new_value_entry, param_default, event),
-                "+",
-            )
+            new_value_widget: Union[PairTupleCombobox, ttk.Entry] = new_value_combobox
+            row.new_value_entry.grid_remove()
         else:
-            new_value_entry = ttk.Entry(self.view_port, width=NEW_VALUE_WIDGET_WIDTH + 1, justify=tk.RIGHT)
+            new_value_entry = row.new_value_entry
+            new_value_entry.configure(state="normal", background=row.entry_background)
             ParameterEditorTable.__update_new_value_entry_text(new_value_entry, param.value, param_default)
-            bitmask_dict = param_metadata.get("Bitmask", None) if param_metadata else None
-        try:
-            old_value = self.local_filesystem.file_parameters[self.current_file][param_name].value
-        except KeyError as e:
-            logging_critical(_("Parameter %s not found in the %s file: %s"), param_name, self.current_file, e, exc_info=True)
-            sys_exit(1)
-        if present_as_forced:
-            new_value_entry.config(state="disabled", background="light grey")
-        elif bitmask_dict:
-            new_value_entry.bind(
-                "<FocusIn>", lambda event: self.__open_bitmask_selection_window(event, param_name, bitmask_dict, old_value)
-            )
-        else:
-            # pylint: disable=line-too-long
-            new_value_entry.bind(
-                "<FocusOut>",
-                lambda event, current_file=self.current_file, param_name=param_name: self.__on_parameter_value_change(  # type: ignore[misc]
-                    event, current_file, param_name
-                ),
-            )
-            # pylint: enable=line-too-long
-        if doc_tooltip:
-            show_tooltip(new_value_entry, doc_tooltip)
-        return new_value_entry
-
-    def __open_bitmask_selection_window(self, event, param_name, bitmask_dict, old_value) -> None:  # pylint: disable=too-many-locals
-        def on_close() -> None:
-            checked_keys = [key for key, var in checkbox_vars.items() if var.get()]
-            # Convert checked keys back to a decimal value
-            new_decimal_value = sum(1 << key for key in checked_keys)
-            # Update new_value_entry with the new decimal value
-            ParameterEditorTable.__update_new_value_entry_text(
-                event.widget, new_decimal_value, self.local_filesystem.param_default_dict.get(param_name, None)
-            )
-            self.at_least_one_param_edited = (old_value != new_decimal_value) or self.at_least_one_param_edited
-            self.local_filesystem.file_parameters[self.current_file][param_name].value = new_decimal_value
-            # Destroy the window
-            window.destroy()
-            # Issue a FocusIn event on something else than new_value_entry to prevent endless looping
-            self.root.focus_set()
-            # Run the Tk event loop once to process the event
-            self.root.update_idletasks()
-            # Re-bind the FocusIn event to new_value_entry
-            event.widget.bind(
-                "<FocusIn>", lambda event: self.__open_bitmask_selection_window(event, param_name, bitmask_dict, old_value)
-            )
+            if row.present_as_forced:
+                new_value_entry.configure(state="disabled", background="light grey")
+            else:
+                row.bitmask_dict = param_metadata.get("Bitmask", None) if param_metadata else None
+            new_value_widget = new_value_entry
+            row.new_value_combobox.grid_remove()
+        row.value_widget = new_value_widget
+        row.set_tooltip(new_value_widget, doc_tooltip)
+
+    def __on_row_value_focus_in(self, row: ParameterTableRow, event) -> None:
+        self.__scroll_row_into_view(row)
+        if row.param_name is not None and row.bitmask_dict and event.widget is row.value_widget:
+            self.__open_bitmask_selection_window(event, row)
+
+    def __on_row_value_focus_out(self, row: ParameterTableRow, event) -> None:
+        if row.param_name is None or row.present_as_forced or row.bitmask_dict or event.widget is not row.value_widget:
+            return
+        self.__on_parameter_value_change(event, self.current_file, row.param_name)
 
-        def get_param_value_msg(_param_name, checked_keys) -> str:
-            _new_decimal_value = sum(1 << key for key in checked_keys)
-            text = _("{_param_name} Value: {_new_decimal_value}")
-            return text.format(**locals())
+    def __on_row_change_reason_focus_out(self, row: ParameterTableRow, event) -> None:
+        if row.param_name is None or row.present_as_forced:
+            return
+        self.__on_parameter_change_reason_change(event, self.current_file, row.param_name)
 
-        def update_label() -> None:
-            checked_keys = [key for key, var in checkbox_vars.items() if var.get()]
-            close_label.config(text=get_param_value_msg(param_name, checked_keys))
+    def __open_bitmask_selection_window(self, event, row: ParameterTableRow) -> None:
+        param_name = row.param_name
+        if param_name is None:  # the row got recycled
+            return
+        current_file = self.current_file
+        param = self.local_filesystem.file_parameters[current_file][param_name]
+        old_value = param.value
 
         # Temporarily unbind the FocusIn event to prevent triggering the window again
         event.widget.unbind("<FocusIn>")
-        window = tk.Toplevel(self.root)
-        title = _("Select {param_name} Bitmask Options")
-        window.title(title.format(**locals()))
-        checkbox_vars = {}
-
-        main_frame = ttk.Frame(window)
-        main_frame.pack(expand=True, fill=tk.BOTH)
-
-        # Convert current_value to a set of checked keys
-        current_value = int(event.widget.get())
-        checked_keys = {key for key, _value in bitmask_dict.items() if (current_value >> key) & 1}
-
-        for i, (key, value) in enumerate(bitmask_dict.items()):
-            var = tk.BooleanVar(value=key in checked_keys)
-            checkbox_vars[key] = var
-            checkbox = ttk.Checkbutton(main_frame, text=value, variable=var, command=update_label)
-            checkbox.grid(row=i, column=0, sticky="w")
-
-        # Replace the close button with a read-only label displaying the current new_decimal_value
-        close_label = ttk.Label(main_frame, text=get_param_value_msg(param_name, checked_keys))
-        close_label.grid(row=len(bitmask_dict), column=0, pady=10)
-
-        # Bind the on_close function to the window's WM_DELETE_WINDOW protocol
-        window.protocol("WM_DELETE_WINDOW", on_close)
-
-        # Make sure the window is visible before disabling the parent window
-        window.deiconify()
+        new_decimal_value = self.__bitmask_selection_window.select(param_name, row.bitmask_dict or {}, int(event.widget.get()))
+        # select() runs a nested event loop, meanwhile the row might have been rebound to another parameter
+        if row.param_name == param_name and self.current_file == current_file:
+            # Update new_value_entry with the new decimal value
+            ParameterEditorTable.__update_new_value_entry_text(
+                event.widget, new_decimal_value, self.local_filesystem.param_default_dict.get(param_name, None)
+            )
+        self.at_least_one_param_edited = (old_value != new_decimal_value) or self.at_least_one_param_edited
+        param.value = new_decimal_value
+        # Issue a FocusIn event on something else than new_value_entry to prevent endless looping
+        self.root.focus_set()
+        # Run the Tk event loop once to process the event
         self.root.update_idletasks()
-        window.grab_set()
-
-        window.wait_window()  # Wait for the window to be closed
+        # Re-bind the FocusIn event to new_value_entry
+        event.widget.bind("<FocusIn>", lambda event: self.__on_row_value_focus_in(row, event))
 
-    def __create_unit_label(self, param_metadata) -> ttk.Label:
-        unit_label = ttk.Label(self.view_port, text=param_metadata.get("unit") if param_metadata else "")
+    def __bind_unit_label(self, row: ParameterTableRow, param_metadata) -> None:
+        row.unit_label.configure(text=param_metadata.get("unit") if param_metadata else "")
         unit_tooltip = (
             param_metadata.get("unit_tooltip")
             if param_metadata
             else _("No documentation available in apm.pdef.xml for this parameter")
         )
-        if unit_tooltip:
-            show_tooltip(unit_label, unit_tooltip)
-        return unit_label
-
-    def __create_upload_checkbutton(self, param_name, fc_connected) -> ttk.Checkbutton:
-        self.upload_checkbutton_var[param_name] = tk.BooleanVar(value=fc_connected)
-        upload_checkbutton = ttk.Checkbutton(self.view_port, variable=self.upload_checkbutton_var[param_name])
-        upload_checkbutton.configure(state="normal" if fc_connected else "disabled")
-        msg = _("When selected upload {param_name} new value to the flight controller")
-        show_tooltip(upload_checkbutton, msg.format(**locals()))
-        return upload_checkbutton
+        row.set_tooltip(row.unit_label, unit_tooltip)
 
-    def __create_change_reason_entry(self, param_name, param, new_value_entry) -> ttk.Entry:
-        present_as_forced = False
-        if (
-            self.current_file in self.local_filesystem.forced_parameters
-            and param_name in self.local_filesystem.forced_parameters[self.current_file]
-        ):
-            present_as_forced = True
-            if param.comment != self.local_filesystem.forced_parameters[self.current_file][param_name].comment:
-                param.comment = self.local_filesystem.forced_parameters[self.current_file][param_name].comment
-                self.at_least_one_param_edited = True
-        if (
-            self.current_file in self.local_filesystem.derived_parameters
-            and param_name in self.local_filesystem.derived_parameters[self.current_file]
-        ):
-            present_as_forced = True
-            if param.comment != self.local_filesystem.derived_parameters[self.current_file][param_name].comment:
-                param.comment = self.local_filesystem.derived_parameters[self.current_file][param_name].comment
-                self.at_least_one_param_edited = True
+    def __bind_upload_checkbutton(self, row: ParameterTableRow, param_name) -> None:
+        row.upload_checkbutton.configure(
+            variable=self.upload_checkbutton_var[param_name], state="normal" if self.__fc_parameters else "disabled"
+        )
+        msg = _("When selected upload {param_name} new value to the flight controller")
+        row.set_tooltip(row.upload_checkbutton, msg.format(**locals()))
 
-        change_reason_entry = ttk.Entry(self.view_port, background="white")
+    def __bind_change_reason(self, row: ParameterTableRow, param_name) -> None:
+        param = self.__params[param_name]
+        change_reason_entry = row.change_reason_entry
+        change_reason_entry.configure(state="normal", background="white")
+        change_reason_entry.delete(0, tk.END)
         change_reason_entry.insert(0, "" if param.comment is None else param.comment)
-        if present_as_forced:
+        if row.present_as_forced:
             change_reason_entry.config(state="disabled", background="light grey")
-        else:
-            # pylint: disable=line-too-long
-            change_reason_entry.bind(
-                "<FocusOut>",
-                lambda event, current_file=self.current_file, param_name=param_name: self.__on_parameter_change_reason_change(  # type: ignore[misc]
-                    event, current_file, param_name
-                ),
-            )
-            # pylint: enable=line-too-long
-        _value = new_value_entry.get()
+        _value = row.value_widget.get()
         msg = _("Reason why {param_name} should change to {_value}")
-        show_tooltip(change_reason_entry, msg.format(**locals()))
-        return change_reason_entry
+        row.set_tooltip(change_reason_entry, msg.format(**locals()))
+
+    def __commit_row_edits(self, row: ParameterTableRow) -> None:
+        """Processes the edits of a row before it gets hidden or bound to another parameter"""
+        if row.param_name is not None:
+            row.value_widget.event_generate("<FocusOut>", when="now")
+            row.change_reason_entry.event_generate("<FocusOut>", when="now")
 
     def __on_parameter_delete(self, param_name) -> None:
         msg = _("Are you sure you want to delete the {param_name} parameter?")
@@ -678,9 +945,8 @@ class ParameterEditorTable(ScrollFrame):  # pylint: disable=too-many-ancestors
 
     def generate_edit_widgets_focus_out(self) -> None:
         # Trigger the <FocusOut> event for all entry widgets to ensure all changes are processed
-        for widget in self.view_port.winfo_children():
-            if isinstance(widget, ttk.Entry):
-                widget.event_generate("<FocusOut>", when="now")
+        for row in list(self.__bound_rows.values()):
+            self.__commit_row_edits(row)
 
     def get_at_least_one_param_edited(self):
         return self.at_least_one_param_edited
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+"""
+Displays large read-only parameter lists in a ttk.Treeview.
+
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Literal, Optional, Union
+
+from MethodicConfigurator import _
+from MethodicConfigurator.annotate_params import Par
+from MethodicConfigurator.backend_filesystem import is_within_tolerance
+from MethodicConfigurator.frontend_tkinter_base import BaseWindow
+
+PARAMETER_TREEVIEW_COLUMNS = ("parameter", "fc_value", "value", "unit", "comment")
+
+
+def format_parameter_value(value: Union[float, None]) -> str:
+    if value is None:
+        return _("N/A")
+    return format(value, ".6f").rstrip("0").rstrip(".")
+
+
+def parameter_row_tags(param: Par, param_metadata: Optional[dict], param_default: Optional[Par]) -> tuple[str, ...]:
+    """The tags that color a row like the ParameterEditorTable colors its value entries"""
+    if param_metadata and param_metadata.get("ReadOnly", False):
+        return ("readonly",)
+    if param_metadata and param_metadata.get("Calibration", False):
+        return ("calibration",)
+    if param_default is not None and is_within_tolerance(param.value, param_default.value):
+        return ("default_value",)
+    return ()
+
+
+class ParameterTreeview(ttk.Frame):  # pylint: disable=too-many-ancestors
+    """
+    A scrollable, read-only parameter table backed by a single ttk.Treeview.
+
+    Unlike the ParameterEditorTable, a row is a Treeview item and not a set of widgets,
+    so thousands of parameters display instantly.
+    """
+
+    def __init__(self, parent: tk.Widget, doc_dict: dict, param_default_dict: dict) -> None:
+        super().__init__(parent)
+        self.doc_dict = doc_dict
+        self.param_default_dict = param_default_dict
+
+        self.tree = ttk.Treeview(self, columns=PARAMETER_TREEVIEW_COLUMNS, show="headings", selectmode="browse")
+        headings: dict[str, tuple[str, int, Literal["w", "e"]]] = {
+            "parameter": (_("Parameter"), 160, tk.W),
+            "fc_value": (_("Current Value"), 110, tk.E),
+            "value": (_("New Value"), 110, tk.E),
+            "unit": (_("Unit"), 80, tk.W),
+            "comment": (_("Change Reason"), 400, tk.W),
+        }
+        for column, (heading, width, anchor) in headings.items():
+            self.tree.heading(column, text=heading, anchor=anchor)
+            self.tree.column(column, width=width, anchor=anchor, stretch=column == "comment")
+        self.tree.tag_configure("readonly", background="red")
+        self.tree.tag_configure("calibration", background="yellow")
+        self.tree.tag_configure("default_value", background="light blue")
+
+        vsb = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=vsb.set)
+        vsb.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+    def set_parameters(self, params: dict[str, Par], fc_parameters: Optional[dict[str, float]] = None) -> None:
+        """
+        Replaces the displayed parameters.
+
+        The Current Value column is hidden when fc_parameters is None.
+        """
+        self.tree.delete(*self.tree.get_children())
+        for param_name, param in params.items():
+            self.tree.insert(
+                "",
+                tk.END,
+                iid=param_name,
+                values=self.__row_values(param_name, param, fc_parameters),
+                tags=parameter_row_tags(
+                    param, self.doc_dict.get(param_name, None), self.param_default_dict.get(param_name, None)
+                ),
+            )
+        displaycolumns = [c for c in PARAMETER_TREEVIEW_COLUMNS if c != "fc_value" or fc_parameters is not None]
+        self.tree.configure(displaycolumns=displaycolumns)
+        self.tree.heading("value", text=_("Value") if fc_parameters is None else _("New Value"))
+
+    def __row_values(self, param_name: str, param: Par, fc_parameters: Optional[dict[str, float]]) -> tuple[str, ...]:
+        param_metadata = self.doc_dict.get(param_name, None)
+        fc_value = fc_parameters.get(param_name, None) if fc_parameters is not None else None
+        return (
+            param_name,
+            format_parameter_value(fc_value),
+            format_parameter_value(param.value),
+            param_metadata.get("unit", "") if param_metadata else "",
+            param.comment or "",
+        )
+
+
+class ParameterSummaryWindow(BaseWindow):
+    """
+    Displays the summary of the configuration, and the parameters of each summary category in a read-only table.
+    """
+
+    def __init__(
+        self, parent: tk.Toplevel, summary_message: str, categories: dict[str, dict[str, Par]], local_filesystem
+    ) -> None:
+        super().__init__(parent)
+        self.root.title(_("Last parameter file processed"))
+        self.root.geometry("900x600")
+
+        summary_label = ttk.Label(self.main_frame, text=summary_message, justify=tk.LEFT)
+        summary_label.pack(side=tk.TOP, anchor=tk.NW, padx=10, pady=10)
+
+        notebook = ttk.Notebook(self.main_frame)
+        for category, params in categories.items():
+            table = ParameterTreeview(notebook, local_filesystem.doc_dict, local_filesystem.param_default_dict)
+            table.set_parameters(params)
+            notebook.add(table, text=f"{category} ({len(params)})")
+        notebook.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=10)
+
+        close_button = ttk.Button(self.main_frame, text=_("Close"), command=self.root.destroy)
+        close_button.pack(side=tk.BOTTOM, pady=10)
+
+        BaseWindow.center_window(self.root, parent)
+        self.root.grab_set()
+        close_button.focus_set()
+        self.root.wait_window()
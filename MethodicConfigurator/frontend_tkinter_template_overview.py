@@ -12,6 +12,8 @@ import argparse
 import tkinter as tk
 from logging import basicConfig as logging_basicConfig
 from logging import getLevelName as logging_getLevelName
+from queue import Empty, Queue
+from threading import Thread
 from tkinter import ttk
 from typing import Optional
 
@@ -22,8 +24,12 @@ from MethodicConfigurator.common_arguments import add_common_arguments_and_parse
 from MethodicConfigurator.frontend_tkinter_base import BaseWindow
 from MethodicConfigurator.middleware_template_overview import TemplateOverview
 
+# Rows inserted into the Treeview at once, and how often the rows read by the worker thread are inserted
+TEMPLATE_ROWS_PER_CHUNK = 50
+TEMPLATE_ROWS_POLL_INTERVAL_MS = 20
 
-class TemplateOverviewWindow(BaseWindow):
+
+class TemplateOverviewWindow(BaseWindow):  # pylint: disable=too-many-instance-attributes
     """
     Represents the window for viewing and managing ArduPilot vehicle templates.
 
@@ -86,13 +92,17 @@ class TemplateOverviewWindow(BaseWindow):
         for col in columns:
             self.tree.heading(col, text=col)
 
-        # Populate the Treeview with data from the template overview
-        for key, template_overview in VehicleComponents.get_vehicle_components_overviews().items():
-            attribute_names = template_overview.attributes()
-            values = (key, *(getattr(template_overview, attr, "") for attr in attribute_names))
-            self.tree.insert("", "end", text=key, values=values)
+        # The values of each row and the sort keys of each column are kept, so sorting does not read the Treeview cells
+        self.__row_values: dict[str, tuple] = {}
+        self.__sort_keys: dict[str, list[tuple]] = {}
+        self.__sort_reverse = False
+        self.__font = tk.font.Font()
+        self.__column_widths = [max(self.__font.measure(subtitle) for subtitle in col.title().split("\n")) for col in columns]
 
-        self.__adjust_treeview_column_widths()
+        # Read the templates on a worker thread, and populate the Treeview in chunks as the rows arrive
+        self.__template_rows: Queue[Optional[tuple[str, tuple]]] = Queue()
+        Thread(target=self.__read_template_overviews, name="TemplateOverview", daemon=True).start()
+        self.root.after(TEMPLATE_ROWS_POLL_INTERVAL_MS, self.__insert_template_rows)
 
         self.tree.bind("<Double-1>", self.__on_row_double_click)
         self.tree.pack(fill=tk.BOTH, expand=True)
@@ -115,23 +125,54 @@ class TemplateOverviewWindow(BaseWindow):
         else:
             self.root.mainloop()
 
-    def __adjust_treeview_column_widths(self) -> None:
+    def __read_template_overviews(self) -> None:
+        """Runs on a worker thread, it must not use any Tk widget"""
+        try:
+            for key, template_overview in VehicleComponents.iter_vehicle_components_overviews():
+                attribute_names = template_overview.attributes()
+                values = (key, *(getattr(template_overview, attr, "") for attr in attribute_names))
+                self.__template_rows.put((key, values))
+        finally:
+            self.__template_rows.put(None)  # all templates were read
+
+    def __insert_template_rows(self) -> None:
+        finished = False
+        rows: list[tuple[str, tuple]] = []
+        while len(rows) < TEMPLATE_ROWS_PER_CHUNK:
+            try:
+                row = self.__template_rows.get_nowait()
+            except Empty:
+                break
+            if row is None:
+                finished = True
+                break
+            rows.append(row)
+        try:
+            for key, values in rows:
+                self.tree.insert("", "end", iid=key, text=key, values=values)
+                self.__row_values[key] = values
+            if rows:
+                self.__sort_keys.clear()
+                self.__adjust_treeview_column_widths(rows)
+                if hasattr(self, "sort_column") and self.sort_column:
+                    # the user already sorted the rows that arrived so far, sort the new ones in
+                    self.__sort_by_column(self.sort_column, self.__sort_reverse)
+            if not finished:
+                self.root.after(TEMPLATE_ROWS_POLL_INTERVAL_MS, self.__insert_template_rows)
+        except tk.TclError:
+            pass  # the window got closed while the templates were being read
+
+    def __adjust_treeview_column_widths(self, rows: list[tuple[str, tuple]]) -> None:
         """
-        Adjusts the column widths of the Treeview to fit the contents of each column.
+        Adjusts the column widths of the Treeview to fit the contents of each column, including the new rows.
         """
-        for col in self.tree["columns"]:
-            max_width = 0
-            for subtitle in col.title().split("\n"):
-                max_width = max(max_width, tk.font.Font().measure(subtitle))
-
-            # Iterate over all rows and update the max_width if a wider entry is found
-            for item in self.tree.get_children():
-                item_text = self.tree.item(item, "values")[self.tree["columns"].index(col)]
-                text_width = tk.font.Font().measure(item_text)
-                max_width = max(max_width, text_width)
-
-            # Update the column's width property to accommodate the largest text width
-            self.tree.column(col, width=int(max_width * 0.6 + 10))
+        for index, col in enumerate(self.tree["columns"]):
+            # Update the max_width if a wider entry is found in the new rows
+            max_width = max(self.__column_widths[index], *(self.__font.measure(values[index]) for _key, values in rows))
+            if max_width > self.__column_widths[index] or len(self.__row_values) == len(rows):
+                self.__column_widths[index] = max_width
+                # Update the column's width property to accommodate the largest text width
+                self.tree.column(col, width=int(max_width * 0.6 + 10))
 
     def __on_row_double_click(self, event) -> None:
         """Handle row double-click event."""
@@ -146,12 +187,16 @@ class TemplateOverviewWindow(BaseWindow):
             self.tree.heading(self.sort_column, text=self.sort_column)
         self.tree.heading(col, text=col + (" ▼" if reverse else " ▲"))
         self.sort_column = col
+        self.__sort_reverse = reverse
 
-        try:
-            col_data = [(float(self.tree.set(k, col)), k) for k in self.tree.get_children("")]
-        except ValueError:
-            col_data = [(self.tree.set(k, col), k) for k in self.tree.get_children("")]
-        col_data.sort(reverse=reverse)
+        if col not in self.__sort_keys:
+            index = self.tree["columns"].index(col)
+            try:
+                self.__sort_keys[col] = [(float(values[index]), k) for k, values in self.__row_values.items()]
+            except ValueError:
+                self.__sort_keys[col] = [(str(values[index]), k) for k, values in self.__row_values.items()]
+            self.__sort_keys[col].sort()
+        col_data = reversed(self.__sort_keys[col]) if reverse else self.__sort_keys[col]
 
         # rearrange items in sorted positions
         for index, (_val, k) in enumerate(col_data):
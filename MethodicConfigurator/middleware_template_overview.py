@@ -51,3 +51,11 @@ class TemplateOverview:  # pylint: disable=too-many-instance-attributes
 
     def attributes(self) -> list[str]:
         return self.__dict__.keys()  # type: ignore
+
+    @staticmethod
+    def from_attributes(attributes: dict) -> "TemplateOverview":
+        """Recreates a template overview from the attribute values of a previous one, missing attributes are left empty"""
+        template_overview = TemplateOverview({})
+        for attribute_name in list(template_overview.attributes()):
+            setattr(template_overview, attribute_name, attributes.get(attribute_name, ""))
+        return template_overview
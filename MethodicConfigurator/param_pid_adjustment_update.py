@@ -15,12 +15,11 @@ SPDX-License-Identifier: GPL-3.0-or-later
 
 import argparse
 import os
-import re
 import subprocess
 from typing import Callable, Optional, Union
 
-PARAM_NAME_REGEX = r"^[A-Z][A-Z_0-9]*$"
-PARAM_NAME_MAX_LEN = 16
+from MethodicConfigurator.annotate_params import Par as AnnotateParamsPar
+
 VERSION = "1.0"
 
 
@@ -106,37 +105,13 @@ class Par:
 
     @staticmethod
     def load_param_file_into_dict(param_file: str) -> tuple[dict[str, "Par"], list[str]]:
-        parameter_dict = {}
-        content = []
         with open(param_file, encoding="utf-8") as f_handle:
-            for n, f_line in enumerate(f_handle, start=1):
-                line = f_line.strip()
-                content.append(line)
-                comment = None
-                if not line or line.startswith("#"):
-                    continue
-                if "#" in line:
-                    line, comment = line.split("#", 1)
-                    comment = comment.strip()
-                if "," in line:
-                    parameter, value = line.split(",", 1)
-                elif " " in line:
-                    parameter, value = line.split(" ", 1)
-                elif "\t" in line:
-                    parameter, value = line.split("\t", 1)
-                else:
-                    raise SystemExit(f"Missing parameter-value separator: {line} in {param_file} line {n}")
-                if len(parameter) > PARAM_NAME_MAX_LEN:
-                    raise SystemExit(f"Too long parameter name: {parameter} in {param_file} line {n}")
-                if not re.match(PARAM_NAME_REGEX, parameter):
-                    raise SystemExit(f"Invalid characters in parameter name {parameter} in {param_file} line {n}")
-                try:
-                    fvalue = float(value)
-                except ValueError as exc:
-                    raise SystemExit(f"Invalid parameter value {value} in {param_file} line {n}") from exc
-                if parameter in parameter_dict:
-                    raise SystemExit(f"Duplicated parameter {parameter} in {param_file} line {n}")
-                parameter_dict[parameter] = Par(fvalue, comment)
+            lines = f_handle.readlines()
+        content = [line.strip() for line in lines]
+        # use the same parser and error messages as the other tools
+        parameter_dict = {
+            name: Par(par.value, par.comment) for name, par in AnnotateParamsPar.parse_param_lines(lines, param_file).items()
+        }
         return parameter_dict, content
 
     @staticmethod
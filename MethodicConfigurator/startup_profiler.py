@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+
+"""
+Measures where the time until the first usable window goes, when the AMC_PROFILE_STARTUP environment variable is set.
+
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import sys
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from os import environ as os_environ
+from time import perf_counter
+from types import ModuleType
+from typing import Any, Optional
+
+# Do not import nor use logging functions in this file.
+# The profiler starts before logging gets configured, and it must not import anything heavy itself
+
+# Profiling starts when the package gets imported if this environment variable is set to a non-empty value
+PROFILE_STARTUP_ENV_VAR = "AMC_PROFILE_STARTUP"
+
+# Number of modules listed in the report, sorted by their import time
+REPORTED_IMPORTS = 25
+
+
+class _TimedLoader(Loader):
+    """Wraps the loader of a module to measure how long executing the module takes, including its own imports"""
+
+    def __init__(self, loader: Loader, import_times: dict[str, float]) -> None:
+        self.__loader = loader
+        self.__import_times = import_times
+
+    def create_module(self, spec: ModuleSpec) -> Optional[ModuleType]:
+        return self.__loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        # the module must only see its real loader, for instance to find its resource files
+        module.__loader__ = self.__loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self.__loader
+        start = perf_counter()
+        try:
+            self.__loader.exec_module(module)
+        finally:
+            self.__import_times[module.__name__] = perf_counter() - start
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        return getattr(self.__loader, name)
+
+
+class _ImportTimer(MetaPathFinder):
+    """Finds modules using the other finders in sys.meta_path and times the execution of the modules they find"""
+
+    def __init__(self, import_times: dict[str, float]) -> None:
+        self.import_times = import_times
+
+    def find_spec(
+        self, fullname: str, path: Optional[Sequence[str]], target: Optional[ModuleType] = None
+    ) -> Optional[ModuleSpec]:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self.import_times)
+                return spec
+        return None
+
+
+class StartupProfiler:
+    """
+    Records the duration of the startup phases and of the module imports.
+
+    Phases can be nested, the report indents them accordingly. Only wall-clock time is measured,
+    so the time spent waiting for user input must be marked with waiting_for_user(), it gets
+    subtracted from the phases and from the total. Phases still running when the report
+    gets generated are reported until then.
+    """
+
+    def __init__(self) -> None:
+        self.start_time = perf_counter()
+        self.import_times: dict[str, float] = {}
+        self.phases: list[tuple[str, int, float, Optional[float]]] = []  # name, depth, start, end
+        self.user_waits: list[tuple[float, float]] = []  # start, end
+        self.__depth = 0
+        self.__import_timer: Optional[_ImportTimer] = None
+
+    def install_import_timer(self) -> None:
+        self.__import_timer = _ImportTimer(self.import_times)
+        sys.meta_path.insert(0, self.__import_timer)
+
+    def uninstall_import_timer(self) -> None:
+        if self.__import_timer in sys.meta_path:
+            sys.meta_path.remove(self.__import_timer)
+        self.__import_timer = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = perf_counter()
+        index = len(self.phases)
+        self.phases.append((name, self.__depth, start, None))
+        self.__depth += 1
+        try:
+            yield
+        finally:
+            self.__depth -= 1
+            self.phases[index] = (name, self.__depth, start, perf_counter())
+
+    @contextmanager
+    def waiting_for_user(self) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.user_waits.append((start, perf_counter()))
+
+    def busy_time(self, start: float, end: float) -> float:
+        """Time between start and end that was not spent waiting for user input"""
+        waited = sum(max(0.0, min(end, wait_end) - max(start, wait_start)) for wait_start, wait_end in self.user_waits)
+        return end - start - waited
+
+    def format_report(self, end_time: float) -> str:
+        total = self.busy_time(self.start_time, end_time)
+        waited = end_time - self.start_time - total
+        header = (
+            f"Startup profile: {1000 * total:.1f} ms of startup work until the first usable window, "
+            f"not counting {1000 * waited:.1f} ms waiting for user input"
+        )
+        lines = [header]
+        lines.append(f"{'start':>10} {'duration':>10}  phase")
+        for name, depth, start, end in self.phases:
+            duration = self.busy_time(start, end_time if end is None else end)  # phases that are still running end now
+            offset = self.busy_time(self.start_time, start)
+            lines.append(f"{1000 * offset:7.1f} ms {1000 * duration:7.1f} ms  {'  ' * depth}{name}")
+        slowest_imports = sorted(self.import_times.items(), key=lambda item: item[1], reverse=True)
+        lines.append(f"Slowest {REPORTED_IMPORTS} module imports, each including the modules it imports:")
+        lines.extend(f"{1000 * duration:18.1f} ms  {module}" for module, duration in slowest_imports[:REPORTED_IMPORTS])
+        return "\n".join(lines)
+
+
+_profiler: Optional[StartupProfiler] = None  # pylint: disable=invalid-name
+
+
+def start_startup_profiler_if_requested() -> None:
+    """Starts profiling if the AMC_PROFILE_STARTUP environment variable is set, it must run before the heavy imports"""
+    global _profiler  # noqa: PLW0603 pylint: disable=global-statement
+    if os_environ.get(PROFILE_STARTUP_ENV_VAR) and _profiler is None:
+        _profiler = StartupProfiler()
+        _profiler.install_import_timer()
+
+
+@contextmanager
+def startup_phase(name: str) -> Iterator[None]:
+    """Measures the duration of a startup phase, does nothing unless profiling"""
+    if _profiler is None:
+        yield
+        return
+    with _profiler.phase(name):
+        yield
+
+
+@contextmanager
+def waiting_for_user() -> Iterator[None]:
+    """Excludes the time spent waiting for user input from the startup profile, does nothing unless profiling"""
+    if _profiler is None:
+        yield
+        return
+    with _profiler.waiting_for_user():
+        yield
+
+
+def finish_startup_profiling() -> None:
+    """Prints the report and stops profiling, call it once the first usable window is displayed"""
+    global _profiler  # noqa: PLW0603 pylint: disable=global-statement
+    if _profiler is None:
+        return
+    end_time = perf_counter()
+    _profiler.uninstall_import_timer()
+    # Do not use logging functions here, the report must be displayed regardless of the log level
+    print(_profiler.format_report(end_time))
+    _profiler = None
@@ -8,6 +8,7 @@ SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
 SPDX-License-Identifier: GPL-3.0-or-later
 """
 
+import filecmp
 import os
 import shutil
 import sys
@@ -32,5 +33,8 @@ for root, dirs, _files in os.walk(BASE_TARGET_DIR):
     for directory in dirs:
         target_dir = os.path.join(root, directory)
         target_file_path = os.path.join(target_dir, FILE_TO_COPY)
+        # Identical copies share one parsed documentation instance, do not touch them
+        if os.path.isfile(target_file_path) and filecmp.cmp(source_file_path, target_file_path, shallow=False):
+            continue
         shutil.copy(source_file_path, target_file_path)
         print(f"Copied {FILE_TO_COPY} to {target_file_path}")
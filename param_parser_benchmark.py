@@ -0,0 +1,89 @@
+#!/usr/bin/python3
+
+"""
+This script micro-benchmarks the ArduPilot parameter file parser on the vehicle templates.
+
+It times parsing every *.param file of the templates one by one,
+and the bulk loading of all intermediate parameter files of each template directory,
+serially and with a pool of reading threads.
+
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import argparse
+import os
+import re
+import timeit
+from typing import Callable
+
+from MethodicConfigurator.annotate_params import Par
+
+TEMPLATES_DIR = os.path.join("MethodicConfigurator", "vehicle_templates")
+INTERMEDIATE_FILE_PATTERN = re.compile(r"^\d{2}_.*\.param$")
+
+
+def arg_parser() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks the parameter file parser on the vehicle templates.")
+    parser.add_argument(
+        "-d",
+        "--directory",
+        default=TEMPLATES_DIR,
+        help="The directory containing the parameter files. Defaults to %(default)s.",
+    )
+    parser.add_argument(
+        "-n",
+        "--repeat",
+        type=int,
+        default=5,
+        help="Report the best of this many runs. Defaults to %(default)s.",
+    )
+    return parser.parse_args()
+
+
+def find_param_files(directory: str) -> dict[str, list[str]]:
+    """Returns the intermediate parameter files of each directory, like LocalFilesystem.read_params_from_files()"""
+    param_files: dict[str, list[str]] = {}
+    for root, _dirs, files in os.walk(directory):
+        selected = sorted(
+            os.path.join(root, f)
+            for f in files
+            if INTERMEDIATE_FILE_PATTERN.match(f) and f not in {"00_default.param", "01_ignore_readonly.param"}
+        )
+        if selected:
+            param_files[root] = selected
+    return param_files
+
+
+def best_time(function: Callable[[], object], repeat: int) -> float:
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main() -> None:
+    args = arg_parser()
+    param_files = find_param_files(args.directory)
+    all_files = [f for files in param_files.values() for f in files]
+    line_count = 0
+    for filename in all_files:
+        with open(filename, encoding="utf-8") as file:
+            line_count += sum(1 for _ in file)
+    print(f"{len(all_files)} files with {line_count} lines in {len(param_files)} directories")
+
+    elapsed = best_time(lambda: [Par.load_param_file_into_dict(f) for f in all_files], args.repeat)
+    print(f"one file at a time: {elapsed * 1000:8.2f} ms, {elapsed * 1e6 / max(line_count, 1):6.2f} us per line")
+
+    for max_workers in (1, 4):
+
+        def load_directories(max_workers: int = max_workers) -> None:
+            for files in param_files.values():
+                Par.load_param_files_into_dicts(files, max_workers)
+
+        elapsed = best_time(load_directories, args.repeat)
+        print(f"bulk, max_workers={max_workers}: {elapsed * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
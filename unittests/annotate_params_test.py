@@ -24,8 +24,12 @@ from defusedxml import ElementTree as DET  # just parsing, no data-structure man
 from MethodicConfigurator.annotate_params import (
     BASE_URL,
     PARAM_DEFINITION_XML_FILE,
+    Par,
     arg_parser,
     create_doc_dict,
+    create_doc_dict_from_xml_file,
+    find_param_file_dirs,
+    format_annotated_params,
     format_columns,
     get_xml_data,
     get_xml_url,
@@ -34,6 +38,8 @@ from MethodicConfigurator.annotate_params import (
     remove_prefix,
     split_into_lines,
     update_parameter_documentation,
+    update_parameter_documentation_recursively,
+    write_file_if_changed,
 )
 
 
@@ -279,6 +285,42 @@ class TestParamDocsUpdate(unittest.TestCase):  # pylint: disable=missing-class-d
         # Check the result
         self.assertEqual(result, expected_output)
 
+    def test_create_doc_dict_from_xml_file(self) -> None:
+        xml_data = """<paramfile>
+          <vehicles>
+            <parameters name="ArduCopter">
+              <param name="ArduCopter:PARAM1" humanName="Param 1" documentation="Copter specific">
+                <field name="Units">m/s</field>
+                <field name="UnitText">meters per second</field>
+              </param>
+            </parameters>
+            <parameters name="ArduPlane">
+              <param name="ArduPlane:PARAM1" humanName="Plane Param 1" documentation="Plane specific"/>
+            </parameters>
+          </vehicles>
+          <libraries>
+            <parameters name="LIB_">
+              <param name="LIB_PARAM2" humanName="Param 2" documentation="Documentation for Param 2">
+                <values>
+                  <value code="0">Disabled</value>
+                  <value code="1">Enabled</value>
+                </values>
+              </param>
+            </parameters>
+          </libraries>
+        </paramfile>"""
+        xml_file = os.path.join(self.temp_dir, "streamed.pdef.xml")
+        with open(xml_file, "w", encoding="utf-8") as file:
+            file.write(xml_data)
+
+        result = create_doc_dict_from_xml_file(xml_file, "ArduCopter")
+
+        self.assertEqual(create_doc_dict(DET.fromstring(xml_data), "ArduCopter"), result)
+        self.assertEqual(["PARAM1", "LIB_PARAM2"], list(result))
+        self.assertEqual(["Copter specific"], result["PARAM1"]["documentation"])
+        self.assertEqual({"Units": "m/s (meters per second)"}, result["PARAM1"]["fields"])
+        self.assertEqual({"0": "Disabled", "1": "Enabled"}, result["LIB_PARAM2"]["values"])
+
     def test_format_columns(self) -> None:
         # Define the input
         values = {
@@ -537,6 +579,43 @@ PARAM_1\t100
             ]
         )
 
+    def test_unchanged_file_is_not_rewritten(self) -> None:
+        with open(self.temp_file.name, "w", encoding="utf-8") as file:
+            file.write("PARAM1 100\nPARAM3 3\n")
+        update_parameter_documentation(self.doc_dict, self.temp_file.name)
+        os.utime(self.temp_file.name, ns=(0, 0))
+
+        update_parameter_documentation(self.doc_dict, self.temp_file.name)
+
+        self.assertEqual(0, os.stat(self.temp_file.name).st_mtime_ns)
+
+    def test_rendered_documentation_is_reused(self) -> None:
+        with open(self.temp_file.name, "w", encoding="utf-8") as file:
+            file.write("PARAM1 100\nPARAM2 3\n")
+        rendered_doc_cache = {"PARAM1": "Cached Param 1"}
+
+        update_parameter_documentation(self.doc_dict, self.temp_file.name, rendered_doc_cache=rendered_doc_cache)
+
+        with open(self.temp_file.name, encoding="utf-8") as file:
+            updated_content = file.read()
+        self.assertTrue(updated_content.startswith("# Cached Param 1\nPARAM1 100\n"))
+        self.assertIn("PARAM2", rendered_doc_cache)
+
+    def test_format_annotated_params_matches_file_annotation(self) -> None:
+        params = {
+            "PARAM_1": Par(2.5, "tuned"),
+            "PARAM3": Par(3),
+            "PARAM1": Par(100),
+            "PARAM2": Par(0.000001, "small"),
+        }
+        param_default_dict = {"PARAM1": Par(50), "PARAM3": Par(1)}
+        Par.export_to_param(Par.format_params(params), self.temp_file.name)
+        update_parameter_documentation(self.doc_dict, self.temp_file.name, "missionplanner", param_default_dict)
+        with open(self.temp_file.name, encoding="utf-8") as file:
+            expected_content = file.read()
+
+        self.assertEqual(expected_content, format_annotated_params(params, self.doc_dict, param_default_dict))
+
     def test_empty_parameter_file(self) -> None:
         # Call the function with the temporary file
         update_parameter_documentation(self.doc_dict, self.temp_file.name)
@@ -549,6 +628,164 @@ PARAM_1\t100
         self.assertEqual(updated_content, "")
 
 
+class TestParamFileParser(unittest.TestCase):
+    """Test the parameter file parser"""
+
+    def test_parse_param_lines(self) -> None:
+        lines = [
+            "# header comment\n",
+            "\n",
+            "PARAM1,1.5  # tuned\n",
+            " PARAM2 2 \n",
+            "PARAM3\t-3e-2#\n",
+            "PARAM4 , 4 # spaces around the separator\n",
+        ]
+        params = Par.parse_param_lines(lines, "test.param")
+
+        self.assertEqual(
+            {
+                "PARAM1": (1.5, "tuned"),
+                "PARAM2": (2.0, None),
+                "PARAM3": (-0.03, ""),
+                "PARAM4": (4.0, "spaces around the separator"),
+            },
+            {name: (par.value, par.comment) for name, par in params.items()},
+        )
+
+    def test_parse_param_lines_errors(self) -> None:
+        invalid_lines = {
+            "PARAM1\n": "Missing parameter-value separator: PARAM1 in test.param line 1",
+            "PARAMETER_THAT_IS_TOO_LONG,1\n": "Too long parameter name: PARAMETER_THAT_IS_TOO_LONG in test.param line 1",
+            "PARAM-1,1\n": "Invalid characters in parameter name PARAM-1 in test.param line 1",
+            "PARAM1,VALUE\n": "Invalid parameter value VALUE in test.param line 1",
+            "PARAM1 1,2\n": "Invalid characters in parameter name PARAM1 1 in test.param line 1",
+        }
+        for line, message in invalid_lines.items():
+            with self.subTest(line=line), self.assertRaises(SystemExit) as cm:
+                Par.parse_param_lines([line], "test.param")
+            self.assertEqual(message, cm.exception.args[0])
+
+        with self.assertRaises(SystemExit) as cm:
+            Par.parse_param_lines(["PARAM1,1\n", "PARAM1,2\n"], "test.param")
+        self.assertEqual("Duplicated parameter PARAM1 in test.param line 2", cm.exception.args[0])
+
+    def test_load_param_files_into_dicts(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            param_files = []
+            for i in range(5):
+                param_files.append(os.path.join(temp_dir, f"{i:02d}_file.param"))
+                with open(param_files[-1], "w", encoding="utf-8") as file:
+                    file.write(f"PARAM{i},{i}\n")
+
+            serial = Par.load_param_files_into_dicts(param_files)
+            threaded = Par.load_param_files_into_dicts(param_files, max_workers=3)
+
+        self.assertEqual(param_files, list(serial))
+        self.assertEqual(serial, threaded)
+        self.assertEqual({"PARAM4": Par(4.0)}, threaded[param_files[4]])
+
+
+class TestWriteFileIfChanged(unittest.TestCase):
+    """Test the atomic write-only-if-changed file output"""
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.filename = os.path.join(self.temp_dir.name, "01_first.param")
+
+    def test_new_file_is_written(self) -> None:
+        self.assertTrue(write_file_if_changed(self.filename, "PARAM1,1\n"))
+
+        with open(self.filename, encoding="utf-8") as file:
+            self.assertEqual("PARAM1,1\n", file.read())
+        self.assertEqual(["01_first.param"], os.listdir(self.temp_dir.name))
+
+    def test_new_file_gets_the_permissions_of_a_plainly_opened_file(self) -> None:
+        plain_filename = os.path.join(self.temp_dir.name, "plain.param")
+        with open(plain_filename, "w", encoding="utf-8") as file:
+            file.write("PARAM1,1\n")
+
+        write_file_if_changed(self.filename, "PARAM1,1\n")
+
+        self.assertEqual(os.stat(plain_filename).st_mode, os.stat(self.filename).st_mode)
+
+    def test_unchanged_file_is_not_written(self) -> None:
+        write_file_if_changed(self.filename, "PARAM1,1\n")
+        os.utime(self.filename, ns=(0, 0))
+
+        self.assertFalse(write_file_if_changed(self.filename, "PARAM1,1\n"))
+        self.assertEqual(0, os.stat(self.filename).st_mtime_ns)
+
+    def test_changed_file_is_replaced_keeping_its_permissions(self) -> None:
+        with open(self.filename, "w", encoding="utf-8", newline="\r\n") as file:
+            file.write("PARAM1,1\n")
+        os.chmod(self.filename, 0o600)
+
+        self.assertTrue(write_file_if_changed(self.filename, "PARAM1,1\n"))
+
+        with open(self.filename, "rb") as file:
+            self.assertEqual(b"PARAM1,1\n", file.read())
+        self.assertEqual(0o600, os.stat(self.filename).st_mode & 0o777)
+        self.assertEqual(["01_first.param"], os.listdir(self.temp_dir.name))
+
+
+class TestRecursiveAnnotation(unittest.TestCase):
+    """Test the recursive batch annotation of several vehicle directories"""
+
+    XML_DATA = (
+        '<paramfile><vehicles><parameters name="ArduCopter">'
+        '<param name="ArduCopter:PARAM1" humanName="Param 1" documentation="Documentation for Param 1"/>'
+        "</parameters></vehicles><libraries/></paramfile>"
+    )
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.vehicle_dirs = [os.path.join(self.temp_dir.name, name) for name in ("vehicle1", "group/vehicle2")]
+        for default_value, vehicle_dir in enumerate(self.vehicle_dirs):
+            os.makedirs(vehicle_dir)
+            with open(os.path.join(vehicle_dir, PARAM_DEFINITION_XML_FILE), "w", encoding="utf-8") as file:
+                file.write(self.XML_DATA)
+            with open(os.path.join(vehicle_dir, "01_first.param"), "w", encoding="utf-8") as file:
+                file.write("PARAM1,5\n")
+            with open(os.path.join(vehicle_dir, "00_default.param"), "w", encoding="utf-8") as file:
+                file.write(f"PARAM1,{default_value}\n")
+
+    def read_param_file(self, vehicle_dir: str) -> str:
+        with open(os.path.join(vehicle_dir, "01_first.param"), encoding="utf-8") as file:
+            return file.read()
+
+    def test_find_param_file_dirs(self) -> None:
+        self.assertEqual(sorted(self.vehicle_dirs), find_param_file_dirs(self.temp_dir.name))
+
+    def test_identical_xml_files_are_parsed_once(self) -> None:
+        with patch(
+            "MethodicConfigurator.annotate_params.create_doc_dict_from_xml_file", wraps=create_doc_dict_from_xml_file
+        ) as mock_parse:
+            update_parameter_documentation_recursively(self.temp_dir.name, "ArduCopter", "4.5.7", 100)
+
+        mock_parse.assert_called_once()
+        self.assertEqual(
+            "# Param 1\n# Documentation for Param 1\n# Default: 0\nPARAM1,5\n", self.read_param_file(self.vehicle_dirs[0])
+        )
+        self.assertEqual(
+            "# Param 1\n# Documentation for Param 1\n# Default: 1\nPARAM1,5\n", self.read_param_file(self.vehicle_dirs[1])
+        )
+
+    def test_process_pool_gives_the_same_result(self) -> None:
+        update_parameter_documentation_recursively(self.temp_dir.name, "ArduCopter", "4.5.7", 100, jobs=2)
+
+        for default_value, vehicle_dir in enumerate(self.vehicle_dirs):
+            self.assertEqual(
+                f"# Param 1\n# Documentation for Param 1\n# Default: {default_value}\nPARAM1,5\n",
+                self.read_param_file(vehicle_dir),
+            )
+
+    def test_target_must_be_a_directory(self) -> None:
+        with self.assertRaises(ValueError):
+            update_parameter_documentation_recursively(os.path.join(self.temp_dir.name, "missing"), "ArduCopter", "4.5.7", 100)
+
+
 class AnnotateParamsTest(unittest.TestCase):
     def test_arg_parser_valid_arguments(self) -> None:
         test_args = ["annotate_params", "--vehicle-type", "ArduCopter", "--sort", "none", "parameters"]
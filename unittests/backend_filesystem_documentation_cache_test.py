@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+
+"""
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import unittest
+from os import makedirs as os_makedirs
+from os import path as os_path
+from os import utime as os_utime
+from tempfile import TemporaryDirectory
+from typing import Any, Optional
+from unittest.mock import patch
+
+from MethodicConfigurator import backend_filesystem
+from MethodicConfigurator.backend_filesystem import LocalFilesystem
+from MethodicConfigurator.backend_filesystem_documentation_cache import (
+    clear_documentation_store,
+    documentation_cache_filename,
+    documentation_cache_key,
+    load_cached_documentation,
+    save_cached_documentation,
+)
+from MethodicConfigurator.backend_filesystem_program_settings import ProgramSettings
+
+DOC_DICT = {"PARAM_A": {"humanName": "A", "Bitmask": {0: "Bit0"}, "doc_tooltip": "A\nB"}}
+
+
+class TestDocumentationCache(unittest.TestCase):
+    """Test the parameter documentation cache"""
+
+    def setUp(self) -> None:
+        self.tmpdir = TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.tmpdir.cleanup)
+        clear_documentation_store()
+        self.addCleanup(clear_documentation_store)
+        self.xml_file = os_path.join(self.tmpdir.name, "apm.pdef.xml")
+        self.default_file = os_path.join(self.tmpdir.name, "00_default.param")
+        with open(self.xml_file, "w", encoding="utf-8") as file:
+            file.write("<paramfile/>")
+        self.source_files = [self.xml_file, self.default_file]
+
+    def key(self, max_line_length: int = 105) -> Optional[tuple[Any, ...]]:
+        return documentation_cache_key(self.source_files, "ArduCopter", max_line_length)
+
+    def test_round_trip(self) -> None:
+        save_cached_documentation(self.tmpdir.name, self.key(), DOC_DICT)
+
+        self.assertEqual(DOC_DICT, load_cached_documentation(self.tmpdir.name, self.key()))
+
+    def test_no_cache_without_main_xml_file(self) -> None:
+        self.assertIsNone(documentation_cache_key([self.default_file], "ArduCopter", 105))
+        self.assertIsNone(load_cached_documentation(self.tmpdir.name, None))
+
+    def test_modified_source_file_invalidates_cache(self) -> None:
+        save_cached_documentation(self.tmpdir.name, self.key(), DOC_DICT)
+        with open(self.xml_file, "w", encoding="utf-8") as file:
+            file.write("<paramfile><vehicles/></paramfile>")
+
+        self.assertIsNone(load_cached_documentation(self.tmpdir.name, self.key()))
+
+    def test_touched_source_file_keeps_cache(self) -> None:
+        save_cached_documentation(self.tmpdir.name, self.key(), DOC_DICT)
+        os_utime(self.xml_file, ns=(0, 0))
+        clear_documentation_store()
+
+        self.assertEqual(DOC_DICT, load_cached_documentation(self.tmpdir.name, self.key()))
+
+    def test_identical_copies_share_the_documentation(self) -> None:
+        template_dir = os_path.join(self.tmpdir.name, "template")
+        os_makedirs(template_dir)
+        with open(os_path.join(template_dir, "apm.pdef.xml"), "w", encoding="utf-8") as file:
+            file.write("<paramfile/>")
+        template_key = documentation_cache_key(
+            [os_path.join(template_dir, "apm.pdef.xml"), os_path.join(template_dir, "00_default.param")], "ArduCopter", 105
+        )
+        save_cached_documentation(self.tmpdir.name, self.key(), DOC_DICT)
+
+        self.assertEqual(self.key(), template_key)
+        self.assertIs(DOC_DICT, load_cached_documentation(self.tmpdir.name, template_key))
+        clear_documentation_store()
+        self.assertEqual(DOC_DICT, load_cached_documentation(self.tmpdir.name, template_key))
+
+    def test_new_source_file_invalidates_cache(self) -> None:
+        save_cached_documentation(self.tmpdir.name, self.key(), DOC_DICT)
+        with open(self.default_file, "w", encoding="utf-8") as file:
+            file.write("PARAM_A,1\n")
+
+        self.assertIsNone(load_cached_documentation(self.tmpdir.name, self.key()))
+
+    def test_line_length_is_part_of_the_key(self) -> None:
+        save_cached_documentation(self.tmpdir.name, self.key(105), DOC_DICT)
+
+        self.assertIsNone(load_cached_documentation(self.tmpdir.name, self.key(80)))
+
+    def test_corrupt_cache_file_is_ignored(self) -> None:
+        with open(documentation_cache_filename(self.tmpdir.name, self.key()), "wb") as file:
+            file.write(b"not a pickle")
+
+        self.assertIsNone(load_cached_documentation(self.tmpdir.name, self.key()))
+
+
+class TestLoadParameterDocumentation(unittest.TestCase):
+    """Test resolving the documentation of template directories through the shared documentation store"""
+
+    PDEF_XML = (
+        '<paramfile><vehicles><parameters name="ArduCopter">'
+        '<param humanName="Compass enable" name="ArduCopter:COMPASS_ENABLE" documentation="Enables the compass">'
+        '<values><value code="0">Disabled</value><value code="1">Enabled</value></values>'
+        "</param></parameters></vehicles><libraries/></paramfile>"
+    )
+
+    def setUp(self) -> None:
+        self.tmpdir = TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.tmpdir.cleanup)
+        clear_documentation_store()
+        self.addCleanup(clear_documentation_store)
+        patcher = patch.object(ProgramSettings, "get_documentation_cache_dir", return_value=self.tmpdir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_template(self, name: str, default_value: int) -> str:
+        template_dir = os_path.join(self.tmpdir.name, name)
+        os_makedirs(template_dir)
+        with open(os_path.join(template_dir, "apm.pdef.xml"), "w", encoding="utf-8") as file:
+            file.write(self.PDEF_XML)
+        with open(os_path.join(template_dir, "00_default.param"), "w", encoding="utf-8") as file:
+            file.write(f"COMPASS_ENABLE,{default_value}\n")
+        return template_dir
+
+    def test_identical_pdef_files_are_parsed_once(self) -> None:
+        template1 = self.create_template("template1", 0)
+        template2 = self.create_template("template2", 1)
+
+        with patch.object(
+            backend_filesystem, "parse_parameter_metadata", wraps=backend_filesystem.parse_parameter_metadata
+        ) as mock_parse:
+            doc1 = LocalFilesystem.load_parameter_documentation(template1, "ArduCopter")
+            doc2 = LocalFilesystem.load_parameter_documentation(template2, "ArduCopter")
+
+        mock_parse.assert_called_once()
+        self.assertEqual({0: "Disabled", 1: "Enabled"}, doc2["COMPASS_ENABLE"]["Values"])
+        self.assertTrue(doc1["COMPASS_ENABLE"]["doc_tooltip"].endswith("Default: 0"))
+        self.assertTrue(doc2["COMPASS_ENABLE"]["doc_tooltip"].endswith("Default: 1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+"""
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import unittest
+from os import path as os_path
+from os import remove as os_remove
+from os import utime as os_utime
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from MethodicConfigurator import backend_filesystem
+from MethodicConfigurator.annotate_params import Par
+from MethodicConfigurator.backend_filesystem import LocalFilesystem
+
+
+class TestReadParamsFromFilesCache(unittest.TestCase):
+    """Test the (size, mtime) keyed cache of the intermediate parameter files and refresh()"""
+
+    def setUp(self) -> None:
+        self.tmpdir = TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.tmpdir.cleanup)
+        backend_filesystem._parsed_param_files.clear()  # pylint: disable=protected-access
+        self.addCleanup(backend_filesystem._parsed_param_files.clear)  # pylint: disable=protected-access
+        self.write_param_file("02_first.param", "PARAM_A,1\n", mtime=1000)
+        self.write_param_file("03_second.param", "PARAM_B,2 # comment\n", mtime=1000)
+        self.lfs = LocalFilesystem(None, "ArduCopter", None, False)  # type: ignore[arg-type]
+        self.lfs.vehicle_dir = self.tmpdir.name
+
+    def write_param_file(self, filename: str, content: str, mtime: int) -> None:
+        path = os_path.join(self.tmpdir.name, filename)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+        os_utime(path, (mtime, mtime))
+
+    def read_params_counting_parsed_files(self) -> tuple[dict[str, dict[str, Par]], list[str]]:
+        with patch.object(Par, "load_param_files_into_dicts", wraps=Par.load_param_files_into_dicts) as mock_load:
+            parameters = self.lfs.read_params_from_files()
+        return parameters, [os_path.basename(f) for call in mock_load.call_args_list for f in call.args[0]]
+
+    def test_unchanged_files_are_not_parsed_again(self) -> None:
+        first, parsed = self.read_params_counting_parsed_files()
+        self.assertEqual(["02_first.param", "03_second.param"], parsed)
+
+        self.write_param_file("03_second.param", "PARAM_B,3\n", mtime=2000)
+        second, parsed = self.read_params_counting_parsed_files()
+
+        self.assertEqual(["03_second.param"], parsed)
+        self.assertEqual(first["02_first.param"], second["02_first.param"])
+        self.assertEqual({"PARAM_B": Par(3.0, None)}, second["03_second.param"])
+
+    def test_returned_parameters_are_copies(self) -> None:
+        first = self.lfs.read_params_from_files()
+        first["02_first.param"]["PARAM_A"].value = 5.0
+        first["02_first.param"]["PARAM_C"] = Par(1.0, None)
+
+        second = self.lfs.read_params_from_files()
+
+        self.assertEqual({"PARAM_A": Par(1.0, None)}, second["02_first.param"])
+
+    def test_recently_modified_files_are_not_cached(self) -> None:
+        with open(os_path.join(self.tmpdir.name, "02_first.param"), "a", encoding="utf-8") as file:
+            file.write("PARAM_C,3\n")
+        self.lfs.read_params_from_files()
+
+        _parameters, parsed = self.read_params_counting_parsed_files()
+
+        self.assertEqual(["02_first.param"], parsed)
+
+    def test_refresh_reconciles_external_changes(self) -> None:
+        self.lfs.file_parameters = self.lfs.read_params_from_files()
+        self.lfs.file_parameters["02_first.param"]["PARAM_A"].value = 7.0  # unsaved edit
+        self.write_param_file("03_second.param", "PARAM_B,4\n", mtime=2000)
+        self.write_param_file("04_third.param", "PARAM_D,5\n", mtime=2000)
+
+        self.assertEqual(["03_second.param", "04_third.param"], self.lfs.refresh())
+        self.assertEqual(["02_first.param", "03_second.param", "04_third.param"], list(self.lfs.file_parameters))
+        self.assertEqual(7.0, self.lfs.file_parameters["02_first.param"]["PARAM_A"].value)
+        self.assertEqual({"PARAM_B": Par(4.0, None)}, self.lfs.file_parameters["03_second.param"])
+
+        os_remove(os_path.join(self.tmpdir.name, "04_third.param"))
+        self.assertEqual(["04_third.param"], self.lfs.refresh())
+        self.assertEqual(["02_first.param", "03_second.param"], list(self.lfs.file_parameters))
+        self.assertEqual([], self.lfs.refresh())
+
+    def test_refresh_does_not_read_back_exported_files(self) -> None:
+        self.lfs.file_parameters = self.lfs.read_params_from_files()
+        self.lfs.file_parameters["02_first.param"]["PARAM_A"].value = 7.0
+
+        self.lfs.export_to_param(self.lfs.file_parameters["02_first.param"], "02_first.param", annotate_doc=False)
+
+        self.assertEqual([], self.lfs.refresh())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+"""
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import pickle
+import unittest
+
+from MethodicConfigurator.backend_filesystem import ParameterDocumentation
+
+
+class TestParameterDocumentation(unittest.TestCase):
+    """Test the lazily derived parameter documentation fields"""
+
+    def setUp(self) -> None:
+        self.param_info = {
+            "humanName": "Battery monitoring",
+            "documentation": ["Controls enabling monitoring of the battery's voltage and current"],
+            "fields": {
+                "Units": "A (ampere)",
+                "Range": "0 100",
+                "Calibration": "True",
+                "RebootRequired": "True",
+                "Bitmask": "0:Voltage,1:Current",
+            },
+            "values": {"0": "Disabled", "4": "Analog Voltage and Current"},
+        }
+
+    def test_derived_fields(self) -> None:
+        doc = ParameterDocumentation(self.param_info, 4.0)
+
+        self.assertEqual("A", doc["unit"])
+        self.assertEqual("ampere", doc.get("unit_tooltip"))
+        self.assertEqual((0.0, 100.0), (doc["min"], doc["max"]))
+        self.assertTrue(doc.get("RebootRequired", False))
+        self.assertFalse(doc.get("ReadOnly", False))
+        self.assertEqual({0: "Voltage", 1: "Current"}, doc["Bitmask"])
+        self.assertEqual({0: "Disabled", 4: "Analog Voltage and Current"}, doc["Values"])
+        self.assertIs(doc["Calibration"], True)
+        self.assertTrue(doc["doc_tooltip"].startswith("Battery monitoring\n"))
+        self.assertTrue(doc["doc_tooltip"].endswith("Default: 4"))
+
+    def test_parsed_fields_are_not_modified(self) -> None:
+        doc = ParameterDocumentation(self.param_info)
+
+        self.assertIn("doc_tooltip", doc)
+        self.assertNotIn("doc_tooltip", self.param_info)
+        self.assertNotIn("Default:", doc["doc_tooltip"])
+
+    def test_pickle_stores_only_the_parsed_fields(self) -> None:
+        doc = ParameterDocumentation(self.param_info, 4.0)
+        doc_tooltip = doc["doc_tooltip"]
+
+        data = pickle.dumps(doc)
+
+        self.assertNotIn(b"Default: 4", data)
+        self.assertEqual(doc_tooltip, pickle.loads(data)["doc_tooltip"])  # noqa: S301
+
+
+if __name__ == "__main__":
+    unittest.main()
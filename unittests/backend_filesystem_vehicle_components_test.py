@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+"""
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import json
+import unittest
+from os import makedirs as os_makedirs
+from os import path as os_path
+from os import utime as os_utime
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from MethodicConfigurator.backend_filesystem_program_settings import ProgramSettings
+from MethodicConfigurator.backend_filesystem_vehicle_components import VehicleComponents
+
+
+class TestVehicleComponentsOverviewsCache(unittest.TestCase):
+    """Test the cache of the vehicle template overviews"""
+
+    def setUp(self) -> None:
+        self.tmpdir = TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.templates_dir = os_path.join(self.tmpdir.name, "vehicle_templates")
+        self.cache_filename = os_path.join(self.tmpdir.name, "template_overview_cache.json")
+        for patcher in (
+            patch.object(ProgramSettings, "get_templates_base_dir", return_value=self.templates_dir),
+            patch.object(ProgramSettings, "get_template_overview_cache_filename", return_value=self.cache_filename),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.mtime = 1000
+        self.write_template("ArduCopter/quad", "Holybro", "Pixhawk6C")
+        self.write_template("ArduPlane/wing", "CUAV", "Nora")
+
+    def write_template(self, relative_path: str, manufacturer: str, model: str) -> None:
+        template_dir = os_path.join(self.templates_dir, relative_path)
+        os_makedirs(template_dir, exist_ok=True)
+        filename = os_path.join(template_dir, "vehicle_components.json")
+        components = {"Components": {"Flight Controller": {"Product": {"Manufacturer": manufacturer, "Model": model}}}}
+        with open(filename, "w", encoding="utf-8") as file:
+            json.dump(components, file)
+        # distinct modification times, the file system timestamps might be too coarse to tell the writes apart
+        self.mtime += 1
+        os_utime(filename, (self.mtime, self.mtime))
+
+    def overviews(self) -> dict[str, tuple[str, str]]:
+        return {
+            key: (overview.fc_manufacturer, overview.fc_model)
+            for key, overview in VehicleComponents.get_vehicle_components_overviews().items()
+        }
+
+    def test_overviews_are_cached(self) -> None:
+        expected = {
+            os_path.join("ArduCopter", "quad"): ("Holybro", "Pixhawk6C"),
+            os_path.join("ArduPlane", "wing"): ("CUAV", "Nora"),
+        }
+        self.assertEqual(self.overviews(), expected)
+        self.assertTrue(os_path.isfile(self.cache_filename))
+        with patch.object(VehicleComponents, "load_vehicle_components_json_data") as mock_load:
+            self.assertEqual(self.overviews(), expected)
+        mock_load.assert_not_called()
+
+    def test_only_changed_templates_are_parsed_again(self) -> None:
+        self.overviews()
+        self.write_template("ArduCopter/quad", "Holybro", "Pixhawk6X")
+        self.write_template("Rover/boat", "mRo", "ControlZero")
+        load_vehicle_components_json_data = VehicleComponents.load_vehicle_components_json_data
+        with patch.object(
+            VehicleComponents,
+            "load_vehicle_components_json_data",
+            autospec=True,
+            side_effect=load_vehicle_components_json_data,
+        ) as mock_load:
+            overviews = self.overviews()
+        self.assertEqual(
+            sorted(os_path.relpath(call.args[1], self.templates_dir) for call in mock_load.call_args_list),
+            [os_path.join("ArduCopter", "quad"), os_path.join("Rover", "boat")],
+        )
+        self.assertEqual(overviews[os_path.join("ArduCopter", "quad")], ("Holybro", "Pixhawk6X"))
+        self.assertEqual(overviews[os_path.join("Rover", "boat")], ("mRo", "ControlZero"))
+        self.assertEqual(overviews[os_path.join("ArduPlane", "wing")], ("CUAV", "Nora"))
+
+    def test_unreadable_cache_file_is_ignored(self) -> None:
+        with open(self.cache_filename, "w", encoding="utf-8") as file:
+            file.write("{not json")
+        self.assertEqual(len(self.overviews()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
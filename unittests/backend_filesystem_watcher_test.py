@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+"""
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import unittest
+from os import path as os_path
+from os import remove as os_remove
+from os import rename as os_rename
+from os import utime as os_utime
+from platform import system as platform_system
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from MethodicConfigurator.backend_filesystem_watcher import VehicleDirectoryWatcher
+
+
+class TestPollingVehicleDirectoryWatcher(unittest.TestCase):
+    """Test the size and modification time polling backend"""
+
+    def setUp(self) -> None:
+        self.tmpdir = TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.mtime = 1000
+        self.write_file("02_first.param", "PARAM_A,1\n")
+        self.watcher = self.create_watcher()
+        self.addCleanup(self.watcher.close)
+
+    def create_watcher(self) -> VehicleDirectoryWatcher:
+        with patch("MethodicConfigurator.backend_filesystem_watcher.platform_system", return_value="Windows"):
+            watcher = VehicleDirectoryWatcher(self.tmpdir.name)
+        self.assertFalse(watcher.uses_inotify)
+        return watcher
+
+    def write_file(self, filename: str, content: str) -> None:
+        path = os_path.join(self.tmpdir.name, filename)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+        # same size writes within one mtime tick can not be detected by polling, so use distinct mtimes
+        self.mtime += 1
+        os_utime(path, (self.mtime, self.mtime))
+
+    def test_no_changes(self) -> None:
+        self.assertFalse(self.watcher.has_changes())
+
+    def test_modified_file(self) -> None:
+        self.write_file("02_first.param", "PARAM_A,2\n")
+        self.assertTrue(self.watcher.has_changes())
+        self.assertFalse(self.watcher.has_changes())
+
+    def test_created_renamed_and_deleted_files(self) -> None:
+        self.write_file("03_second.param", "PARAM_B,1\n")
+        self.assertTrue(self.watcher.has_changes())
+        os_rename(os_path.join(self.tmpdir.name, "03_second.param"), os_path.join(self.tmpdir.name, "04_second.param"))
+        self.assertTrue(self.watcher.has_changes())
+        os_remove(os_path.join(self.tmpdir.name, "04_second.param"))
+        self.assertTrue(self.watcher.has_changes())
+
+    def test_other_files_are_ignored(self) -> None:
+        self.write_file("notes.txt", "not a parameter file\n")
+        self.assertFalse(self.watcher.has_changes())
+
+
+@unittest.skipUnless(platform_system() == "Linux", "inotify is only available on Linux")
+class TestInotifyVehicleDirectoryWatcher(TestPollingVehicleDirectoryWatcher):
+    """Test the inotify backend"""
+
+    def create_watcher(self) -> VehicleDirectoryWatcher:
+        watcher = VehicleDirectoryWatcher(self.tmpdir.name)
+        self.assertTrue(watcher.uses_inotify)
+        return watcher
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+"""
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from MethodicConfigurator.annotate_params import Par
+from MethodicConfigurator.backend_flightcontroller_session_manager import FlightControllerSessionManager
+
+
+def fake_flight_controller(_reboot_time) -> MagicMock:
+    flight_controller = MagicMock()
+
+    def connect(device) -> str:
+        if device == "unplugged":
+            return "no such device"
+        flight_controller.info.system_id = 2 if device == "tcp:sitl2" else 1
+        return ""
+
+    flight_controller.connect.side_effect = connect
+    flight_controller.download_params.return_value = ({"PARAM_A": 1.0, "PARAM_B": 2.0}, {})
+    flight_controller.upload_params_pipelined.side_effect = lambda params: [p for p in params if p == "PARAM_B"]
+    return flight_controller
+
+
+@patch("MethodicConfigurator.backend_flightcontroller_session_manager.FlightController", side_effect=fake_flight_controller)
+class TestFlightControllerSessionManager(unittest.TestCase):
+    """Test the multi-vehicle session manager"""
+
+    def setUp(self) -> None:
+        self.manager = FlightControllerSessionManager(reboot_time=7, work_dir="work")
+
+    def test_connect_keys_sessions_by_device_and_system_id(self, _mock_fc) -> None:
+        errors = self.manager.connect(["tcp:sitl1", "tcp:sitl2", "unplugged"])
+
+        self.assertEqual({"tcp:sitl1": "", "tcp:sitl2": "", "unplugged": "no such device"}, errors)
+        self.assertEqual({("tcp:sitl1", 1), ("tcp:sitl2", 2)}, set(self.manager.sessions))
+
+    def test_download_params_uses_distinct_files_per_vehicle(self, _mock_fc) -> None:
+        self.manager.connect(["tcp:sitl1", "tcp:sitl2"])
+        progress = MagicMock()
+        reports = self.manager.download_params(progress)
+
+        self.assertTrue(all(report.success and report.param_count == 2 for report in reports.values()))
+        filenames = {fc.download_params.call_args.args[1] for fc in self.manager.sessions.values()}
+        self.assertEqual(2, len(filenames))
+
+    def test_upload_param_file_reports_failed_params(self, _mock_fc) -> None:
+        self.manager.connect(["tcp:sitl1", "tcp:sitl2"])
+        with patch.object(Par, "load_param_file_into_dict", return_value={"PARAM_A": Par(1.0), "PARAM_B": Par(3.0)}):
+            reports = self.manager.upload_param_file("some.param")
+
+        self.assertEqual(2, len(reports))
+        for report in reports.values():
+            self.assertFalse(report.success)
+            self.assertEqual(["PARAM_B"], report.failed_params)
+            self.assertEqual(1, report.param_count)
+
+    def test_disconnect_closes_all_sessions(self, _mock_fc) -> None:
+        self.manager.connect(["tcp:sitl1", "tcp:sitl2"])
+        sessions = list(self.manager.sessions.values())
+        self.manager.disconnect()
+
+        self.assertEqual({}, self.manager.sessions)
+        for flight_controller in sessions:
+            flight_controller.disconnect.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+
+"""
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import unittest
+from typing import Optional
+from unittest.mock import MagicMock, patch
+
+from MethodicConfigurator.backend_flightcontroller import BANNER_TIMEOUT, FlightController
+
+
+class TestFlightControllerProbeConnections(unittest.TestCase):
+    """Test the concurrent connection probing"""
+
+    def setUp(self) -> None:
+        self.fc = FlightController(reboot_time=7)
+
+    @staticmethod
+    def fake_mavlink_connection(device, **_kwargs) -> MagicMock:
+        if device == "refused":
+            raise ConnectionRefusedError("connection refused")
+        master = MagicMock()
+        master.wait_heartbeat.return_value = MagicMock() if device.startswith("answers") else None
+        return master
+
+    @patch("MethodicConfigurator.backend_flightcontroller.mavutil.mavlink_connection")
+    def test_probe_connections_ranks_answering_ports(self, mock_connection) -> None:
+        mock_connection.side_effect = self.fake_mavlink_connection
+        ranked = self.fc.probe_connections(["silent", "answers1", "refused", "answers2"], timeout=0.1)
+
+        self.assertEqual({"answers1", "answers2"}, {device for device, _latency in ranked})
+        self.assertLessEqual(ranked[0][1], ranked[1][1])
+        self.assertEqual(4, mock_connection.call_count)
+
+    @patch("MethodicConfigurator.backend_flightcontroller.mavutil.mavlink_connection")
+    def test_probe_connections_closes_all_connections(self, mock_connection) -> None:
+        masters = []
+
+        def create_master(device, **kwargs) -> MagicMock:
+            master = self.fake_mavlink_connection(device, **kwargs)
+            masters.append(master)
+            return master
+
+        mock_connection.side_effect = create_master
+        self.fc.probe_connections(["silent", "answers1", "answers2"], timeout=0.1)
+
+        self.assertEqual(3, len(masters))
+        for master in masters:
+            master.close.assert_called_once()
+
+    def test_probe_connections_without_devices(self) -> None:
+        self.assertEqual([], self.fc.probe_connections([]))
+
+
+class TestFlightControllerUploadParamsPipelined(unittest.TestCase):
+    """Test the pipelined parameter upload"""
+
+    def setUp(self) -> None:
+        self.fc = FlightController(reboot_time=7)
+        self.fc.master = MagicMock()
+        self.echoes: list[MagicMock] = []
+        self.fc.master.param_set_send.side_effect = self.echo
+        self.fc.master.recv_match.side_effect = lambda **_kwargs: self.echoes.pop(0) if self.echoes else None
+
+    def echo(self, param_name, param_value) -> None:
+        if param_name != "REFUSED":
+            self.echoes.append(MagicMock(param_id=param_name, param_value=param_value))
+
+    def test_all_parameters_confirmed(self) -> None:
+        params = {f"PARAM_{i}": float(i) for i in range(50)}
+        failed = self.fc.upload_params_pipelined(params, max_in_flight=8)
+
+        self.assertEqual([], failed)
+        self.assertEqual(params, self.fc.fc_parameters)
+        self.assertEqual(50, self.fc.master.param_set_send.call_count)
+
+    def test_unconfirmed_parameter_is_retried_then_reported(self) -> None:
+        failed = self.fc.upload_params_pipelined({"GOOD": 1.0, "REFUSED": 2.0}, timeout=0, retries=2)
+
+        self.assertEqual(["REFUSED"], failed)
+        self.assertEqual({"GOOD": 1.0}, self.fc.fc_parameters)
+        refused_calls = [c for c in self.fc.master.param_set_send.call_args_list if c.args[0] == "REFUSED"]
+        self.assertEqual(3, len(refused_calls))
+
+
+class TestFlightControllerDownloadParamsViaMavlink(unittest.TestCase):
+    """Test the PARAM_VALUE based parameter download"""
+
+    def setUp(self) -> None:
+        self.fc = FlightController(reboot_time=7)
+        self.master = MagicMock()
+        self.fc.master = self.master
+        self.fc.info.is_mavftp_supported = False
+        self.incoming = [
+            MagicMock(param_count=3, **{"to_dict.return_value": {"param_id": f"PARAM_{i}", "param_value": float(i)}})
+            for i in range(3)
+        ]
+        self.master.recv_match.side_effect = lambda **_kwargs: self.incoming.pop(0) if self.incoming else None
+
+    def test_all_parameters_are_received(self) -> None:
+        progress = MagicMock()
+        params, defaults = self.fc.download_params(progress)
+
+        self.assertEqual({"PARAM_0": 0.0, "PARAM_1": 1.0, "PARAM_2": 2.0}, params)
+        self.assertEqual({}, defaults)
+        self.assertEqual(3, progress.call_count)
+
+    def test_cancelling_progress_callback_stops_the_download(self) -> None:
+        class CancelledError(Exception):
+            """Raised by the progress callback"""
+
+        def cancel(received: int, _total: int) -> None:
+            if received == 2:
+                raise CancelledError
+
+        with (
+            patch("MethodicConfigurator.backend_flightcontroller.logging_error") as mock_error,
+            self.assertRaises(CancelledError),
+        ):
+            self.fc.download_params(cancel)
+        mock_error.assert_not_called()
+        self.assertEqual(1, len(self.incoming))
+
+
+class TestFlightControllerReceiveBannerAndAutopilotVersion(unittest.TestCase):
+    """Test the single message pump that collects the banner and the AUTOPILOT_VERSION message"""
+
+    def setUp(self) -> None:
+        self.fc = FlightController(reboot_time=7)
+        self.master = MagicMock()
+        self.master.recv_match.side_effect = self.recv_match
+        self.fc.master = self.master
+        self.incoming: list[Optional[MagicMock]] = []
+        self.now = 1000.0
+        patcher = patch("MethodicConfigurator.backend_flightcontroller.time_time", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def recv_match(self, **_kwargs) -> Optional[MagicMock]:
+        # each call takes 0.1 seconds and returns the next incoming message, if any
+        self.now += 0.1
+        return self.incoming.pop(0) if self.incoming else None
+
+    @staticmethod
+    def statustext(text: str) -> MagicMock:
+        m = MagicMock(text=text)
+        m.get_type.return_value = "STATUSTEXT"
+        return m
+
+    @staticmethod
+    def autopilot_version() -> MagicMock:
+        m = MagicMock()
+        m.get_type.return_value = "AUTOPILOT_VERSION"
+        return m
+
+    def receive(self, timeout: int = 5) -> tuple[list[str], MagicMock]:
+        return self.fc._FlightController__receive_banner_text_and_autopilot_version(timeout)  # type: ignore[attr-defined,no-any-return] # pylint: disable=protected-access
+
+    def test_banner_then_version_returns_early(self) -> None:
+        version = self.autopilot_version()
+        self.incoming = [
+            self.statustext("ArduCopter V4.5.7 (2a3dc4b7)"),
+            self.statustext("ChibiOS: 6a85082c"),
+            self.statustext("Pixhawk6C 00360042 3132510C 31383938"),
+            version,
+            self.statustext("Frame: QUAD/X"),
+        ]
+        banner_msgs, m = self.receive()
+
+        self.assertIs(version, m)
+        self.assertEqual(
+            ["ArduCopter V4.5.7 (2a3dc4b7)", "ChibiOS: 6a85082c", "Pixhawk6C 00360042 3132510C 31383938"], banner_msgs
+        )
+        # returned as soon as both were complete, without waiting for more messages
+        self.assertEqual(4, self.master.recv_match.call_count)
+
+    def test_version_without_chibios_banner_waits_for_the_banner_timeout(self) -> None:
+        version = self.autopilot_version()
+        self.incoming = [version, self.statustext("ArduPlane V4.5.7 (2a3dc4b7)")]
+        start = self.now
+        banner_msgs, m = self.receive()
+
+        self.assertIs(version, m)
+        self.assertEqual(["ArduPlane V4.5.7 (2a3dc4b7)"], banner_msgs)
+        self.assertGreater(self.now - start, BANNER_TIMEOUT)
+        self.assertLess(self.now - start, BANNER_TIMEOUT + 0.3)
+
+    def test_no_version_times_out_and_ignores_late_banner_text(self) -> None:
+        self.incoming = [self.statustext("ChibiOS: 6a85082c")] + [None] * int(BANNER_TIMEOUT / 0.1 + 1)
+        self.incoming.append(self.statustext("late banner line"))
+        start = self.now
+        banner_msgs, m = self.receive(timeout=3)
+
+        self.assertIsNone(m)
+        self.assertEqual(["ChibiOS: 6a85082c"], banner_msgs)
+        self.assertGreater(self.now - start, 3)
+        self.assertLess(self.now - start, 3.3)
+
+    def test_version_before_the_banner_timeout(self) -> None:
+        version = self.autopilot_version()
+        self.incoming = [self.statustext("ChibiOS: 6a85082c"), None, version, self.statustext("Pixhawk6C 00360042")]
+        banner_msgs, m = self.receive()
+
+        self.assertIs(version, m)
+        self.assertEqual(["ChibiOS: 6a85082c", "Pixhawk6C 00360042"], banner_msgs)
+        self.assertEqual(4, self.master.recv_match.call_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
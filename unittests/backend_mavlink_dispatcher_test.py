@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+"""
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import unittest
+from threading import Event
+from unittest.mock import MagicMock
+
+from MethodicConfigurator.backend_mavlink_dispatcher import MavlinkDispatcher
+
+
+def fake_message(msg_type: str, value: int = 0) -> MagicMock:
+    m = MagicMock(value=value)
+    m.get_type.return_value = msg_type
+    return m
+
+
+class TestMavlinkDispatcher(unittest.TestCase):
+    """Test the background MAVLink reader and its per-type queues"""
+
+    def setUp(self) -> None:
+        self.incoming = [
+            fake_message("HEARTBEAT"),
+            fake_message("PARAM_VALUE", 1),
+            fake_message("STATUSTEXT", 2),
+            fake_message("ATTITUDE"),
+            fake_message("PARAM_VALUE", 3),
+            fake_message("FILE_TRANSFER_PROTOCOL", 4),
+        ]
+        self.all_read = Event()
+        self.master = MagicMock()
+        self.master.recv_match.side_effect = self.read_link
+        self.dispatcher = MavlinkDispatcher(self.master)
+
+    def tearDown(self) -> None:
+        self.dispatcher.stop()
+
+    def read_link(self, **_kwargs) -> MagicMock:
+        if self.incoming:
+            return self.incoming.pop(0)
+        self.all_read.set()
+        return None
+
+    def start_and_read_all(self) -> None:
+        self.dispatcher.start()
+        self.assertTrue(self.all_read.wait(timeout=5))
+
+    def test_messages_are_dispatched_by_type(self) -> None:
+        self.start_and_read_all()
+
+        self.assertEqual(4, self.dispatcher.recv_match(type="FILE_TRANSFER_PROTOCOL").value)
+        self.assertEqual(1, self.dispatcher.recv_match(type="PARAM_VALUE").value)
+        self.assertEqual(3, self.dispatcher.recv_match(type=["PARAM_VALUE"]).value)
+        self.assertIsNone(self.dispatcher.recv_match(type="PARAM_VALUE"))
+        self.assertEqual(2, self.dispatcher.recv_match(type="STATUSTEXT").value)
+
+    def test_multiple_types_are_returned_in_arrival_order(self) -> None:
+        self.start_and_read_all()
+
+        values = [self.dispatcher.recv_match(type=["FILE_TRANSFER_PROTOCOL", "PARAM_VALUE"]).value for _i in range(3)]
+        self.assertEqual([1, 3, 4], values)
+
+    def test_unsubscribed_types_are_dropped(self) -> None:
+        self.start_and_read_all()
+
+        self.assertIsNone(self.dispatcher.recv_match(type="ATTITUDE"))
+
+    def test_blocking_recv_match_times_out(self) -> None:
+        self.start_and_read_all()
+
+        self.assertIsNone(self.dispatcher.recv_match(type="COMMAND_ACK", blocking=True, timeout=0.05))
+
+    def test_close_stops_the_reader_and_closes_the_connection(self) -> None:
+        self.start_and_read_all()
+        self.dispatcher.close()
+
+        self.master.close.assert_called_once()
+        self.assertIsNone(self.dispatcher.recv_match(type="COMMAND_ACK", blocking=True))
+
+    def test_reads_go_through_the_queues(self) -> None:
+        self.start_and_read_all()
+
+        self.assertEqual("HEARTBEAT", self.dispatcher.wait_heartbeat(timeout=0.05).get_type())
+        self.assertEqual(1, self.dispatcher.recv_msg().value)
+        self.assertIsNone(self.dispatcher.wait_heartbeat(blocking=False))
+        with self.assertRaises(AttributeError):
+            self.dispatcher.recv()
+        # only the reader thread reads the link
+        self.master.wait_heartbeat.assert_not_called()
+        self.master.recv_msg.assert_not_called()
+
+    def test_stale_messages_are_discarded(self) -> None:
+        self.start_and_read_all()
+
+        self.dispatcher.discard(("PARAM_VALUE", "COMMAND_ACK"))
+        self.assertIsNone(self.dispatcher.recv_match(type="PARAM_VALUE"))
+        self.dispatcher.subscribe("STATUSTEXT")
+        self.assertIsNone(self.dispatcher.recv_match(type="STATUSTEXT"))
+        self.assertEqual(4, self.dispatcher.recv_match(type="FILE_TRANSFER_PROTOCOL").value)
+
+    def test_other_attributes_are_forwarded(self) -> None:
+        self.dispatcher.target_system = 3  # only sets the attribute on the dispatcher itself
+        self.master.source_system = 255
+
+        self.assertEqual(255, self.dispatcher.source_system)
+        self.assertIs(self.master, self.dispatcher.connection)
+
+
+if __name__ == "__main__":
+    unittest.main()
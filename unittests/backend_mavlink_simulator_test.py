@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+"""
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import unittest
+from os import path as os_path
+from tempfile import TemporaryDirectory
+
+from MethodicConfigurator.annotate_params import Par
+from MethodicConfigurator.backend_flightcontroller import FlightController
+from MethodicConfigurator.backend_mavftp import MAVFTP, MAVFTPSettings
+from MethodicConfigurator.backend_mavlink_simulator import (
+    BOARD_NAME,
+    OS_CUSTOM_VERSION,
+    SimulatedAutopilot,
+    SimulatedMavlinkConnection,
+    encode_param_pck,
+)
+
+PARAMS = {
+    "ATC_ACCEL_P_MAX": 110000.0,
+    "ATC_ACCEL_R_MAX": 110000.0,
+    "ATC_ANG_PIT_P": 4.5,
+    "BATT_MONITOR": 4.0,
+    "INS_ACC_BODYFIX": 2.0,
+    "INS_ACCOFFS_X": 0.25,
+}
+DEFAULTS = {**PARAMS, "ATC_ANG_PIT_P": 6.0, "BATT_MONITOR": 0.0}
+
+
+class TestEncodeParamPck(unittest.TestCase):
+    """Test the param.pck encoder against the MAVFTP decoder"""
+
+    def test_round_trip_without_defaults(self) -> None:
+        pdata = MAVFTP.ftp_param_decode(encode_param_pck(PARAMS))
+
+        decoded = {name.decode(): value for name, value, _ptype in pdata.params}
+        self.assertEqual(PARAMS, decoded)
+        self.assertIsNone(pdata.defaults)
+
+    def test_round_trip_with_defaults(self) -> None:
+        pdata = MAVFTP.ftp_param_decode(encode_param_pck(PARAMS, DEFAULTS))
+
+        self.assertEqual(PARAMS, {name.decode(): value for name, value, _ptype in pdata.params})
+        self.assertEqual(DEFAULTS, {name.decode(): value for name, value, _ptype in pdata.defaults})
+
+
+class TestSimulatedAutopilot(unittest.TestCase):
+    """Test the FlightController and MAVFTP end-to-end against the simulated autopilot"""
+
+    def setUp(self) -> None:
+        self.autopilot = SimulatedAutopilot(PARAMS, DEFAULTS, system_id=3)
+        self.link_options = {"latency": 0.001, "bandwidth": 115200 / 10}
+
+    def connected_flight_controller(self, **link_options) -> FlightController:
+        def connect(**_kwargs) -> SimulatedMavlinkConnection:
+            return SimulatedMavlinkConnection(self.autopilot, **self.link_options, **link_options)
+
+        flight_controller = FlightController(reboot_time=0, mavlink_connection_factory=connect)
+        self.assertEqual("", flight_controller.connect("sim"))
+        self.addCleanup(flight_controller.disconnect)
+        return flight_controller
+
+    def test_connect_reads_autopilot_information(self) -> None:
+        with self.assertNoLogs(level="WARNING"):
+            flight_controller = self.connected_flight_controller()
+
+        self.assertEqual(3, flight_controller.info.system_id)
+        self.assertEqual("ArduCopter", flight_controller.info.vehicle_type)
+        self.assertEqual("4.5.7", flight_controller.info.flight_sw_version)
+        self.assertTrue(flight_controller.info.is_mavftp_supported)
+        # the banner matches AUTOPILOT_VERSION
+        self.assertEqual(BOARD_NAME, flight_controller.info.product)
+        self.assertEqual(OS_CUSTOM_VERSION, flight_controller.info.os_custom_version)
+
+    def test_download_params_via_mavlink(self) -> None:
+        flight_controller = self.connected_flight_controller()
+        flight_controller.info.is_mavftp_supported = False
+
+        params, defaults = flight_controller.download_params()
+
+        self.assertEqual(PARAMS, params)
+        self.assertEqual({}, defaults)
+
+    def test_pipelined_upload_survives_packet_loss(self) -> None:
+        flight_controller = self.connected_flight_controller(seed=1)
+        flight_controller.master.connection.loss = 0.2
+        new_values = {name: value + 1 for name, value in PARAMS.items()}
+
+        failed = flight_controller.upload_params_pipelined(new_values, timeout=0.2, retries=10)
+
+        self.assertEqual([], failed)
+        self.assertEqual(new_values, self.autopilot.params)
+
+    def test_mavftp_getparams_with_defaults(self) -> None:
+        master = SimulatedMavlinkConnection(self.autopilot, **self.link_options)
+        self.addCleanup(master.close)
+        master.wait_heartbeat(timeout=1)
+        settings = MAVFTPSettings(
+            [
+                ("debug", int, 0),
+                ("pkt_loss_tx", int, 0),
+                ("pkt_loss_rx", int, 0),
+                ("max_backlog", int, 5),
+                ("burst_read_size", int, 80),
+                ("write_size", int, 80),
+                ("write_qsize", int, 5),
+                ("idle_detection_time", float, 1.2),
+                ("read_retry_time", float, 1.0),
+                ("retry_time", float, 0.5),
+            ]
+        )
+        mavftp = MAVFTP(master, master.target_system, master.target_component, settings)
+
+        with TemporaryDirectory() as tmpdir:
+            values_file = os_path.join(tmpdir, "complete.param")
+            defaults_file = os_path.join(tmpdir, "00_default.param")
+            mavftp.cmd_getparams([values_file, defaults_file])
+            mavftp.process_ftp_reply("getparams", timeout=5)
+
+            values = {name: par.value for name, par in Par.load_param_file_into_dict(values_file).items()}
+            defaults = {name: par.value for name, par in Par.load_param_file_into_dict(defaults_file).items()}
+        self.assertEqual(PARAMS, values)
+        self.assertEqual(DEFAULTS, defaults)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+
+"""
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import threading
+import time
+import unittest
+from typing import Callable
+from unittest.mock import MagicMock, patch
+
+from MethodicConfigurator.frontend_tkinter_background_task import BackgroundTask, TaskCancelledError
+
+
+class FakeBooleanVar:
+    """Replaces tk.BooleanVar, that needs a Tk interpreter"""
+
+    def __init__(self, master=None, value=False) -> None:  # pylint: disable=unused-argument
+        self.value = value
+
+    def get(self) -> bool:
+        return self.value
+
+    def set(self, value: bool) -> None:
+        self.value = value
+
+
+class FakeRoot:
+    """Runs the root.after() callbacks like the Tk event loop does inside wait_variable()"""
+
+    def __init__(self) -> None:
+        self.tk = MagicMock()
+        self.callbacks: list[Callable[[], None]] = []
+        self.tk_thread = threading.get_ident()
+        self.callback_threads: set[int] = set()
+
+    def after(self, _ms: int, callback: Callable[[], None]) -> None:
+        self.callbacks.append(callback)
+
+    def wait_variable(self, variable: FakeBooleanVar) -> None:
+        while not variable.get():
+            time.sleep(0.001)
+            callbacks, self.callbacks = self.callbacks, []
+            for callback in callbacks:
+                self.callback_threads.add(threading.get_ident())
+                callback()
+
+
+@patch("MethodicConfigurator.frontend_tkinter_background_task.tk.BooleanVar", FakeBooleanVar)
+class TestBackgroundTask(unittest.TestCase):
+    """Test running blocking functions on a worker thread"""
+
+    def setUp(self) -> None:
+        self.root = FakeRoot()
+
+    def test_result_and_progress_are_delivered_on_the_tk_thread(self) -> None:
+        worker_threads = set()
+        progress = []
+
+        def function(progress_callback) -> str:
+            worker_threads.add(threading.get_ident())
+            for i in range(1, 4):
+                progress_callback(i, 3)
+                time.sleep(0.06)
+            return "done"
+
+        task = BackgroundTask(self.root, function)
+        self.assertEqual(task.run(lambda current, total: progress.append((current, total))), "done")
+        self.assertNotIn(self.root.tk_thread, worker_threads)
+        self.assertEqual(self.root.callback_threads, {self.root.tk_thread})
+        self.assertEqual(progress[-1], (3, 3))
+        self.assertEqual(progress, sorted(progress))
+
+    def test_exceptions_are_raised_on_the_tk_thread(self) -> None:
+        def function(_progress_callback) -> None:
+            msg = "no connection"
+            raise ValueError(msg)
+
+        with self.assertRaisesRegex(ValueError, "no connection"):
+            BackgroundTask(self.root, function).run()
+
+    def test_cancel(self) -> None:
+        steps = []
+        task: BackgroundTask[None] = BackgroundTask(self.root, lambda progress_callback: None)
+
+        def function(progress_callback) -> None:
+            for i in range(1000):
+                progress_callback(i, 1000)
+                steps.append(i)
+                if i == 2:
+                    task.cancel()
+
+        task.function = function
+        with self.assertRaises(TaskCancelledError):
+            task.run()
+        self.assertTrue(task.cancelled)
+        self.assertEqual(steps, [0, 1, 2])
+
+    def test_busy_window(self) -> None:
+        busy_window = MagicMock()
+        busy_window.__str__.return_value = ".main"
+        BackgroundTask(self.root, lambda _progress_callback: None).run(busy_window=busy_window)
+        self.root.tk.call.assert_any_call("tk", "busy", "hold", ".main")
+        self.root.tk.call.assert_called_with("tk", "busy", "forget", ".main")
+
+
+if __name__ == "__main__":
+    unittest.main()
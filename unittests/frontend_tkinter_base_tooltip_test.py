@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+"""
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import tkinter as tk
+import unittest
+from typing import Callable
+from unittest.mock import MagicMock, patch
+
+from MethodicConfigurator.frontend_tkinter_base import show_tooltip
+
+
+class TestShowTooltip(unittest.TestCase):
+    """Test the tooltips shared by all widgets of a toplevel window"""
+
+    @staticmethod
+    def create_mock_widget(toplevel, name: str) -> MagicMock:
+        mock_widget = MagicMock()
+        mock_widget.configure_mock(**{"__str__.return_value": name})
+        mock_widget.winfo_toplevel.return_value = toplevel
+        mock_widget.bindtags.return_value = (name, "TLabel", ".", "all")
+        mock_widget.winfo_rootx.return_value = 100
+        mock_widget.winfo_rooty.return_value = 200
+        mock_widget.winfo_width.return_value = 50
+        mock_widget.winfo_height.return_value = 30
+        return mock_widget
+
+    @staticmethod
+    def class_binding(toplevel, sequence: str) -> Callable:
+        for call in toplevel.bind_class.call_args_list:
+            if call.args[1] == sequence:
+                binding: Callable = call.args[2]
+                return binding
+        raise AssertionError(sequence)
+
+    @patch("tkinter.Toplevel")
+    @patch("tkinter.ttk.Label")
+    def test_show_tooltip(self, mock_label, mock_toplevel) -> None:
+        toplevel = MagicMock()
+        toplevel.configure_mock(**{"__str__.return_value": ".test_show_tooltip"})
+        mock_widget = self.create_mock_widget(toplevel, ".test_show_tooltip.label")
+
+        # Call the function with test parameters
+        show_tooltip(mock_widget, "Test Tooltip Message")
+
+        # The widget gets a bindtag shared by all widgets of the toplevel window, instead of bindings of its own
+        mock_widget.bind.assert_not_called()
+        mock_widget.bindtags.assert_called_with(
+            (".test_show_tooltip.label", "TLabel", ".", "all", "Tooltip.test_show_tooltip")
+        )
+        mock_toplevel.assert_not_called()
+
+        # Simulate the <Enter> event to trigger the deiconify method
+        mock_event = MagicMock()
+        mock_event.widget = mock_widget
+        self.class_binding(toplevel, "<Enter>")(mock_event)
+
+        # Assert that the Tkinter Toplevel class was instantiated
+        mock_toplevel.assert_called_once_with(toplevel)
+
+        # Assert that the Tkinter Label class was instantiated with the correct parameters
+        mock_label.assert_called_once_with(
+            mock_toplevel.return_value,
+            text="Test Tooltip Message",
+            background="#ffffe0",
+            relief="solid",
+            borderwidth=1,
+            justify=tk.LEFT,
+        )
+        mock_label.return_value.pack.assert_called_once()
+        mock_toplevel.return_value.geometry.assert_called_with("+125+230")
+        mock_toplevel.return_value.deiconify.assert_called_once()
+
+        # Simulate the <Leave> event to trigger the withdraw method
+        self.class_binding(toplevel, "<Leave>")(mock_event)
+        mock_toplevel.return_value.withdraw.assert_called_once()
+
+    @patch("tkinter.Toplevel")
+    @patch("tkinter.ttk.Label")
+    def test_widgets_share_one_tooltip_window(self, mock_label, mock_toplevel) -> None:
+        toplevel = MagicMock()
+        toplevel.configure_mock(**{"__str__.return_value": ".test_widgets_share_one_tooltip_window"})
+        widgets = [self.create_mock_widget(toplevel, f".w{i}") for i in range(3)]
+        show_tooltip(widgets[0], "first")
+        show_tooltip(widgets[1], "second")
+        show_tooltip(widgets[2], "")
+        enter = self.class_binding(toplevel, "<Enter>")
+        destroy = self.class_binding(toplevel, "<Destroy>")
+        toplevel.bind_class.reset_mock()
+
+        # Replacing the text does not add a second bindtag or bind the events again
+        widgets[0].bindtags.return_value = (".w0", "TLabel", ".", "all", "Tooltip.test_widgets_share_one_tooltip_window")
+        widgets[0].bindtags.reset_mock()
+        show_tooltip(widgets[0], "replaced")
+        widgets[0].bindtags.assert_called_once_with()
+        toplevel.bind_class.assert_not_called()
+
+        for widget in widgets:
+            enter(MagicMock(widget=widget))
+        mock_toplevel.assert_called_once()
+        mock_label.return_value.configure.assert_called_once_with(text="second")
+        # a widget without tooltip text hides the tooltip
+        mock_toplevel.return_value.withdraw.assert_called_once()
+
+        # destroyed widgets are removed from the map
+        destroy(MagicMock(widget=widgets[1]))
+        mock_toplevel.return_value.deiconify.reset_mock()
+        enter(MagicMock(widget=widgets[1]))
+        mock_toplevel.return_value.deiconify.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+"""
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import unittest
+
+from MethodicConfigurator.frontend_tkinter_component_editor import (
+    can_ports,
+    combobox_values_table,
+    i2c_ports,
+    mot_pwm_type_dict,
+    serial_ports,
+)
+
+
+class TestComboboxValuesTable(unittest.TestCase):
+    """Test the allowed values of the component editor comboboxes"""
+
+    def test_values_from_the_metadata(self) -> None:
+        doc_dict = {
+            "RC_PROTOCOLS": {"Bitmask": {"0": "All", "1": "PPM"}},
+            "BATT_MONITOR": {"values": {"0": "Disabled", "4": "Analog Voltage and Current"}},
+            "MOT_PWM_TYPE": {"values": {"0": "Normal", "6": "DShot600"}},
+            "GPS_TYPE": {"values": {"0": "None", "2": "uBlox"}},
+        }
+        table = combobox_values_table(doc_dict, serial_ports, can_ports, i2c_ports)
+        self.assertEqual(table[("RC Receiver", "FC Connection", "Protocol")], ("All", "PPM"))
+        self.assertEqual(table[("Battery Monitor", "FC Connection", "Protocol")], ("Disabled", "Analog Voltage and Current"))
+        self.assertEqual(table[("ESC", "FC Connection", "Protocol")], ("Normal", "DShot600"))
+        self.assertEqual(table[("GNSS Receiver", "FC Connection", "Protocol")], ("None", "uBlox"))
+
+    def test_fallback_values_without_metadata(self) -> None:
+        table = combobox_values_table({}, serial_ports, can_ports, i2c_ports)
+        self.assertEqual(
+            table[("ESC", "FC Connection", "Protocol")], tuple(value["protocol"] for value in mot_pwm_type_dict.values())
+        )
+        self.assertIn("uBlox", table[("GNSS Receiver", "FC Connection", "Protocol")])
+        self.assertIn("Lipo", table[("Battery", "Specifications", "Chemistry")])
+
+    def test_connection_types(self) -> None:
+        table = combobox_values_table({}, serial_ports, can_ports, i2c_ports)
+        self.assertEqual(table[("Telemetry", "FC Connection", "Type")], (*serial_ports, *can_ports))
+        self.assertEqual(table[("ESC", "FC Connection", "Type")][:2], ("Main Out", "AIO"))
+        self.assertIn("I2C1", table[("Battery Monitor", "FC Connection", "Type")])
+        self.assertNotIn("I2C1", table[("GNSS Receiver", "FC Connection", "Type")])
+
+
+if __name__ == "__main__":
+    unittest.main()
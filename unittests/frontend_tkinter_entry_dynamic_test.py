@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+"""
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import unittest
+
+from MethodicConfigurator.frontend_tkinter_entry_dynamic import FilterIndex, listbox_row_edits
+
+PARAM_NAMES = ["ATC_RAT_PIT_P", "ATC_RAT_RLL_P", "BATT_MONITOR", "INS_ACCOFFS_X", "INS_GYROFFS_X", "SERVO1_FUNCTION"]
+
+
+class TestFilterIndex(unittest.TestCase):
+    """Test the prefix and substring index of the filtered listbox"""
+
+    def test_startswith(self) -> None:
+        index = FilterIndex(PARAM_NAMES, ignorecase=True)
+        self.assertEqual(index.startswith("atc_rat"), ["ATC_RAT_PIT_P", "ATC_RAT_RLL_P"])
+        self.assertEqual(index.startswith("INS_"), ["INS_ACCOFFS_X", "INS_GYROFFS_X"])
+        self.assertEqual(index.startswith("X"), [])
+
+    def test_contains(self) -> None:
+        index = FilterIndex(PARAM_NAMES, ignorecase=True)
+        self.assertEqual(index.contains("offs_x"), ["INS_ACCOFFS_X", "INS_GYROFFS_X"])
+        self.assertEqual(index.contains("_p"), ["ATC_RAT_PIT_P", "ATC_RAT_RLL_P"])
+        self.assertEqual(index.contains("1"), ["SERVO1_FUNCTION"])
+        self.assertEqual(index.contains("offs_y"), [])
+        self.assertEqual(index.contains(""), PARAM_NAMES)
+
+    def test_case_sensitive(self) -> None:
+        index = FilterIndex(PARAM_NAMES, ignorecase=False)
+        self.assertEqual(index.startswith("ins"), [])
+        self.assertEqual(index.contains("offs"), [])
+        self.assertEqual(index.contains("OFFS"), ["INS_ACCOFFS_X", "INS_GYROFFS_X"])
+
+    def test_same_results_as_a_linear_scan(self) -> None:
+        index = FilterIndex(PARAM_NAMES, ignorecase=True)
+        for text in ("a", "at", "rat", "rat_", "S_X", "function", "o"):
+            self.assertEqual(index.contains(text), [p for p in PARAM_NAMES if text.lower() in p.lower()], text)
+            self.assertEqual(index.startswith(text), [p for p in PARAM_NAMES if p.lower().startswith(text.lower())], text)
+
+
+class TestListboxRowEdits(unittest.TestCase):
+    """Test the incremental update of the listbox rows"""
+
+    @staticmethod
+    def apply(old: list[str], edits: list[tuple[int, int, list[str]]]) -> list[str]:
+        rows = list(old)
+        for index, delete_count, inserts in reversed(edits):
+            rows[index : index + delete_count] = inserts
+        return rows
+
+    def test_narrowing_deletes_rows(self) -> None:
+        edits = listbox_row_edits(PARAM_NAMES, ["ATC_RAT_RLL_P", "INS_GYROFFS_X"])
+        self.assertIsNotNone(edits)
+        self.assertEqual(self.apply(PARAM_NAMES, edits or []), ["ATC_RAT_RLL_P", "INS_GYROFFS_X"])
+        self.assertTrue(all(not inserts for _index, _count, inserts in edits or []))
+
+    def test_widening_inserts_rows(self) -> None:
+        old = ["BATT_MONITOR", "SERVO1_FUNCTION"]
+        edits = listbox_row_edits(old, PARAM_NAMES)
+        self.assertEqual(self.apply(old, edits or []), PARAM_NAMES)
+        self.assertTrue(all(count == 0 for _index, count, _inserts in edits or []))
+
+    def test_unchanged_rows(self) -> None:
+        self.assertEqual(listbox_row_edits(PARAM_NAMES, PARAM_NAMES), [])
+
+    def test_reordered_or_duplicated_rows(self) -> None:
+        self.assertIsNone(listbox_row_edits(["A", "B"], ["B", "A"]))
+        self.assertIsNone(listbox_row_edits(["A", "A"], ["A"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
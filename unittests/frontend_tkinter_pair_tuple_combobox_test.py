@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+"""
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from MethodicConfigurator.frontend_tkinter_pair_tuple_combobox import PairTupleEntries
+
+
+class TestPairTupleEntries(unittest.TestCase):
+    """Test the precomputed entries of the PairTupleCombobox"""
+
+    def test_dict_keeps_the_metadata_order(self) -> None:
+        entries = PairTupleEntries({"4": "Analog Voltage and Current", "0": "Disabled", "3": "Analog Voltage Only"})
+        self.assertEqual(entries.keys, ("4", "0", "3"))
+        self.assertEqual(entries.shows, ("Analog Voltage and Current", "Disabled", "Analog Voltage Only"))
+        self.assertEqual(entries.key_index, {"4": 0, "0": 1, "3": 2})
+        self.assertEqual(entries.width, len("Analog Voltage and Current"))
+        self.assertEqual(entries.longest_show, "Analog Voltage and Current")
+
+    def test_list_of_tuples(self) -> None:
+        entries = PairTupleEntries([("a", "A"), ("b", "B"), ("a", "A again")])
+        self.assertEqual(entries.keys, ("a", "b", "a"))
+        # like list.index(), the first occurrence of a key is selected
+        self.assertEqual(entries.key_index["a"], 0)
+        # short entries still get the minimum width
+        self.assertEqual(entries.width, len("A again"))
+        self.assertEqual(PairTupleEntries([("a", "A")]).width, 4)
+        self.assertEqual(PairTupleEntries({}).width, 4)
+
+    def test_longest_show_is_measured_once_per_font(self) -> None:
+        entries = PairTupleEntries({"0": "Disabled", "1": "Enabled"})
+        font = MagicMock()
+        font.__str__.return_value = "TkDefaultFont"
+        font.measure.return_value = 77
+        self.assertEqual(entries.longest_show_pixels(font), 77)
+        self.assertEqual(entries.longest_show_pixels(font), 77)
+        font.measure.assert_called_once_with("Disabled0000")
+
+    def test_invalid_type_exits(self) -> None:
+        exit_patch = patch("MethodicConfigurator.frontend_tkinter_pair_tuple_combobox.sys_exit", side_effect=SystemExit)
+        with exit_patch as mock_exit, self.assertRaises(SystemExit):
+            PairTupleEntries("not a list")
+        mock_exit.assert_called_once_with(1)
+
+
+if __name__ == "__main__":
+    unittest.main()
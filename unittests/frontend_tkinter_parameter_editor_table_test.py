@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+
+"""
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import unittest
+from typing import Any
+from unittest.mock import MagicMock
+
+from MethodicConfigurator.annotate_params import Par
+from MethodicConfigurator.frontend_tkinter_parameter_editor_table import (
+    VIEW_PORT_OFFSET,
+    ParameterEditorTable,
+    fc_parameters_diff,
+    restack_rows,
+    visible_row_range,
+)
+
+
+class TestVisibleRowRange(unittest.TestCase):
+    """Test which table rows get widgets"""
+
+    def test_top_of_table(self) -> None:
+        self.assertEqual(visible_row_range(0, 100, 25, 1000, margin=0), range(0, 5))
+        self.assertEqual(visible_row_range(0, 100, 25, 1000, margin=2), range(0, 7))
+
+    def test_scrolled_table(self) -> None:
+        self.assertEqual(visible_row_range(510, 100, 25, 1000, margin=0), range(20, 25))
+        self.assertEqual(visible_row_range(510, 100, 25, 1000, margin=2), range(18, 27))
+
+    def test_bottom_of_table(self) -> None:
+        self.assertEqual(visible_row_range(24900, 100, 25, 1000), range(994, 1000))
+
+    def test_table_smaller_than_view(self) -> None:
+        self.assertEqual(visible_row_range(0, 500, 25, 3), range(0, 3))
+
+    def test_empty_or_unmeasured_table(self) -> None:
+        self.assertEqual(len(visible_row_range(0, 500, 25, 0)), 0)
+        self.assertEqual(len(visible_row_range(0, 500, 0, 10)), 0)
+
+
+class TestFcParametersDiff(unittest.TestCase):
+    """Test the diff of the flight controller parameters used to update the table rows"""
+
+    def test_no_changes(self) -> None:
+        self.assertEqual(fc_parameters_diff({"A": 1.0, "B": 2.0}, {"A": 1.0, "B": 2.0}), {})
+
+    def test_changed_added_and_removed_parameters(self) -> None:
+        diff = fc_parameters_diff({"A": 1.0, "B": 2.0, "C": 3.0}, {"A": 1.5, "B": 2.0, "D": 4.0})
+        self.assertEqual(diff, {"A": 1.5, "C": None, "D": 4.0})
+
+    def test_changes_within_tolerance_are_ignored(self) -> None:
+        self.assertEqual(fc_parameters_diff({"A": 0.1}, {"A": 0.1 + 1e-9}), {})
+
+
+class FakeWidget:  # pylint: disable=too-few-public-methods
+    """A widget that keeps track of the stacking order of its siblings, which Tk uses as focus order"""
+
+    def __init__(self, name: str, siblings: list["FakeWidget"]) -> None:
+        self.name = name
+        self.siblings = siblings
+        siblings.append(self)
+
+    def lift(self) -> None:
+        self.siblings.remove(self)
+        self.siblings.append(self)
+
+
+class TestRestackRows(unittest.TestCase):
+    """Test that the Tab key moves the keyboard focus in the order of the table rows"""
+
+    def test_focus_order_matches_row_order_after_rebind(self) -> None:
+        siblings: list[FakeWidget] = []
+        rows = []
+        for created in range(3):
+            row = MagicMock()
+            row.widgets.return_value = [FakeWidget(f"row{created} {column}", siblings) for column in ("value", "reason")]
+            rows.append(row)
+        # rows get recycled last-in, first-out, so they get bound in the reverse creation order
+        bound_rows: dict[int, Any] = {7: rows[0], 5: rows[2], 6: rows[1]}
+
+        restack_rows(bound_rows)
+
+        self.assertEqual(
+            [widget.name for widget in siblings],
+            ["row2 value", "row2 reason", "row1 value", "row1 reason", "row0 value", "row0 reason"],
+        )
+
+
+class TestScrollRowIntoView(unittest.TestCase):
+    """Test that the table scrolls when the keyboard focus moves to a row outside of the visible area"""
+
+    def setUp(self) -> None:
+        # the table is not displayed, only the attributes used for scrolling are needed
+        self.table = ParameterEditorTable.__new__(ParameterEditorTable)
+        self.canvas = MagicMock()
+        self.canvas.bbox.return_value = (0, 0, 500, 2000)
+        self.canvas.canvasy.return_value = 200
+        self.canvas.winfo_height.return_value = 100
+        self.table.canvas = self.canvas
+        self.rows = {index: MagicMock() for index in range(6, 14)}
+        vars(self.table)["_ParameterEditorTable__bound_rows"] = self.rows
+        vars(self.table)["_ParameterEditorTable__header_height"] = 20
+        vars(self.table)["_ParameterEditorTable__row_height"] = 20
+
+    def __focus(self, index: int) -> None:
+        # pylint: disable-next=protected-access
+        self.table._ParameterEditorTable__scroll_row_into_view(self.rows[index])  # type: ignore[attr-defined]
+
+    def test_visible_row_does_not_scroll(self) -> None:
+        self.__focus(9)
+        self.canvas.yview_moveto.assert_not_called()
+
+    def test_row_below_the_view_scrolls_down(self) -> None:
+        self.__focus(13)
+        row_bottom = VIEW_PORT_OFFSET + 20 + 14 * 20
+        self.canvas.yview_moveto.assert_called_once_with((row_bottom - 100) / 2000)
+
+    def test_row_above_the_view_scrolls_up(self) -> None:
+        self.__focus(6)
+        self.canvas.yview_moveto.assert_called_once_with((VIEW_PORT_OFFSET + 20 + 6 * 20) / 2000)
+
+
+class TestBitmaskSelection(unittest.TestCase):
+    """Test that the bitmask selection result goes to the parameter it was opened for"""
+
+    def setUp(self) -> None:
+        # the table is not displayed, only the attributes used by the bitmask selection are needed
+        self.table = ParameterEditorTable.__new__(ParameterEditorTable)
+        self.table.root = MagicMock()
+        self.table.current_file = "02_test.param"
+        self.table.at_least_one_param_edited = False
+        self.table.local_filesystem = MagicMock()
+        self.table.local_filesystem.file_parameters = {"02_test.param": {"LOG_BITMASK": Par(1.0, "")}}
+        self.table.local_filesystem.param_default_dict = {}
+        self.bitmask_window = MagicMock()
+        vars(self.table)["_ParameterEditorTable__bitmask_selection_window"] = self.bitmask_window
+        self.row = MagicMock()
+        self.row.param_name = "LOG_BITMASK"
+        self.row.bitmask_dict = {0: "Fast Attitude", 1: "Medium Attitude"}
+        self.event = MagicMock()
+        self.event.widget.get.return_value = "1"
+
+    def __select(self) -> None:
+        # pylint: disable-next=protected-access
+        self.table._ParameterEditorTable__open_bitmask_selection_window(self.event, self.row)  # type: ignore[attr-defined]
+
+    def test_selected_value_is_displayed_and_stored(self) -> None:
+        self.bitmask_window.select.return_value = 3
+        self.__select()
+        self.event.widget.insert.assert_called_once_with(0, "3")
+        self.assertEqual(self.table.local_filesystem.file_parameters["02_test.param"]["LOG_BITMASK"].value, 3)
+        self.assertTrue(self.table.at_least_one_param_edited)
+        self.event.widget.bind.assert_called_once()
+
+    def test_row_rebound_while_selecting(self) -> None:
+        def rebind_row(*_args) -> int:
+            self.row.param_name = "BATT_MONITOR"
+            return 3
+
+        self.bitmask_window.select.side_effect = rebind_row
+        self.__select()
+        # the widget now displays another parameter, it must not be overwritten
+        self.event.widget.insert.assert_not_called()
+        self.assertEqual(self.table.local_filesystem.file_parameters["02_test.param"]["LOG_BITMASK"].value, 3)
+        self.event.widget.bind.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
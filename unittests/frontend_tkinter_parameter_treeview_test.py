@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+"""
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import unittest
+
+from MethodicConfigurator.annotate_params import Par
+from MethodicConfigurator.frontend_tkinter_parameter_treeview import format_parameter_value, parameter_row_tags
+
+
+class TestFormatParameterValue(unittest.TestCase):
+    """Test the formatting of the Treeview cell values"""
+
+    def test_integer_values(self) -> None:
+        self.assertEqual(format_parameter_value(0), "0")
+        self.assertEqual(format_parameter_value(12.0), "12")
+        self.assertEqual(format_parameter_value(-3), "-3")
+
+    def test_fractional_values(self) -> None:
+        self.assertEqual(format_parameter_value(0.25), "0.25")
+        self.assertEqual(format_parameter_value(1.0000004), "1")
+        self.assertEqual(format_parameter_value(1.000001), "1.000001")
+
+    def test_missing_value(self) -> None:
+        self.assertEqual(format_parameter_value(None), "N/A")
+
+
+class TestParameterRowTags(unittest.TestCase):
+    """Test the coloring of the Treeview rows"""
+
+    def test_readonly_and_calibration_parameters(self) -> None:
+        param = Par(1.0, "")
+        self.assertEqual(("readonly",), parameter_row_tags(param, {"ReadOnly": True, "Calibration": True}, None))
+        self.assertEqual(("calibration",), parameter_row_tags(param, {"Calibration": True}, Par(1.0, "")))
+
+    def test_default_values(self) -> None:
+        param = Par(1.0, "")
+        self.assertEqual(("default_value",), parameter_row_tags(param, {}, Par(1.0, "")))
+        self.assertEqual((), parameter_row_tags(param, {}, Par(2.0, "")))
+        self.assertEqual((), parameter_row_tags(param, None, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+"""
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import importlib
+import sys
+import unittest
+from os import path as os_path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from MethodicConfigurator import startup_profiler
+from MethodicConfigurator.startup_profiler import (
+    PROFILE_STARTUP_ENV_VAR,
+    StartupProfiler,
+    finish_startup_profiling,
+    start_startup_profiler_if_requested,
+    startup_phase,
+    waiting_for_user,
+)
+
+
+class TestStartupProfiler(unittest.TestCase):
+    """Test the startup time profiler"""
+
+    def test_nested_phases_are_reported(self) -> None:
+        profiler = StartupProfiler()
+        with profiler.phase("LocalFilesystem init"), profiler.phase("XML parse"):
+            pass
+        with profiler.phase("parameter editor"):
+            report = profiler.format_report(profiler.start_time + 1.5)
+        lines = report.splitlines()
+        self.assertEqual(
+            lines[0],
+            "Startup profile: 1500.0 ms of startup work until the first usable window, "
+            "not counting 0.0 ms waiting for user input",
+        )
+        self.assertTrue(lines[2].endswith("ms  LocalFilesystem init"))
+        self.assertTrue(lines[3].endswith("ms    XML parse"))
+        # a phase that has not yet ended is reported until the end of the profiling
+        self.assertRegex(lines[4], r"ms\s+\d+\.\d ms  parameter editor$")
+
+    def test_waiting_for_user_is_not_counted(self) -> None:
+        profiler = StartupProfiler()
+        profiler.phases.append(("FC connect", 0, profiler.start_time, profiler.start_time + 5.0))
+        profiler.phases.append(("component editor", 0, profiler.start_time + 5.0, profiler.start_time + 6.0))
+        # the user took 3 seconds to select a connection and 10 seconds to edit the components
+        profiler.user_waits.append((profiler.start_time + 1.0, profiler.start_time + 4.0))
+        profiler.user_waits.append((profiler.start_time + 6.0, profiler.start_time + 16.0))
+        lines = profiler.format_report(profiler.start_time + 16.5).splitlines()
+        self.assertEqual(
+            lines[0],
+            "Startup profile: 3500.0 ms of startup work until the first usable window, "
+            "not counting 13000.0 ms waiting for user input",
+        )
+        self.assertEqual(lines[2], "    0.0 ms  2000.0 ms  FC connect")
+        self.assertEqual(lines[3], " 2000.0 ms  1000.0 ms  component editor")
+
+    def test_waiting_for_user_records_the_wait(self) -> None:
+        profiler = StartupProfiler()
+        with patch.object(startup_profiler, "_profiler", profiler), waiting_for_user():
+            pass
+        self.assertEqual(len(profiler.user_waits), 1)
+        with patch.object(startup_profiler, "_profiler", None), waiting_for_user():
+            pass
+
+    def test_started_by_the_environment_variable(self) -> None:
+        with patch.object(startup_profiler, "_profiler", None), patch.dict("os.environ", {PROFILE_STARTUP_ENV_VAR: ""}):
+            start_startup_profiler_if_requested()
+            self.assertIsNone(startup_profiler._profiler)  # pylint: disable=protected-access
+        with patch.object(startup_profiler, "_profiler", None), patch.dict("os.environ", {PROFILE_STARTUP_ENV_VAR: "1"}):
+            start_startup_profiler_if_requested()
+            profiler = startup_profiler._profiler  # pylint: disable=protected-access
+            self.assertIsInstance(profiler, StartupProfiler)
+            if isinstance(profiler, StartupProfiler):
+                profiler.uninstall_import_timer()
+
+    def test_import_times(self) -> None:
+        profiler = StartupProfiler()
+        with TemporaryDirectory() as tmpdir:
+            with open(os_path.join(tmpdir, "startup_profiler_test_module.py"), "w", encoding="utf-8") as file:
+                file.write("VALUE = 42\n")
+            sys.path.insert(0, tmpdir)
+            profiler.install_import_timer()
+            try:
+                module = importlib.import_module("startup_profiler_test_module")
+            finally:
+                profiler.uninstall_import_timer()
+                sys.path.remove(tmpdir)
+                sys.modules.pop("startup_profiler_test_module", None)
+        self.assertEqual(module.VALUE, 42)
+        self.assertIn("startup_profiler_test_module", profiler.import_times)
+        # the module only sees its real loader
+        self.assertEqual(type(module.__loader__).__name__, "SourceFileLoader")
+        self.assertNotIn("_ImportTimer", [type(finder).__name__ for finder in sys.meta_path])
+        self.assertIn("startup_profiler_test_module", profiler.format_report(profiler.start_time))
+
+    def test_nothing_happens_without_profiling(self) -> None:
+        with patch.object(startup_profiler, "_profiler", None), patch("builtins.print") as mock_print:
+            with startup_phase("component editor"):
+                pass
+            finish_startup_profiling()
+        mock_print.assert_not_called()
+
+    def test_finish_prints_the_report_once(self) -> None:
+        with patch.object(startup_profiler, "_profiler", StartupProfiler()), patch("builtins.print") as mock_print:
+            with startup_phase("FC connect"):
+                pass
+            finish_startup_profiling()
+            finish_startup_profiling()
+        mock_print.assert_called_once()
+        self.assertIn("FC connect", mock_print.call_args.args[0])
+
+
+if __name__ == "__main__":
+    unittest.main()